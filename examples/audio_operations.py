@@ -10,14 +10,19 @@ from quackvideo.core.operations.audio import (
     AudioConfig,
     AudioOperationType,
 )
-from quackvideo.synthetic.audio import AudioGenerator, AudioPattern
+from quackvideo.synthetic.audio import (
+    AudioConfig as SyntheticAudioConfig,
+    AudioGenerator,
+    AudioPattern,
+    generate_mix,
+)
 
 
 def extract_audio(
     video_path: str,
     output_dir: str,
     format: str = "flac",
-    compression_level: int = 8,
+    compression_level: int = 5,
 ) -> None:
     """Extract audio from video."""
     config = AudioConfig(
@@ -34,7 +39,7 @@ def convert_audio(
     audio_path: str,
     output_dir: str,
     format: str = "flac",
-    compression_level: int = 8,
+    compression_level: int = 5,
 ) -> None:
     """Convert audio format."""
     config = AudioConfig(
@@ -53,10 +58,12 @@ def mix_audio(
     output_dir: str,
     volumes: List[float] = [0.10, 0.90],
     format: str = "flac",
+    compression_level: int = 5,
 ) -> None:
     """Mix two audio files."""
     config = AudioConfig(
         format=format,
+        compression_level=compression_level,
         mixing_volumes=volumes,
     )
 
@@ -73,19 +80,18 @@ def mix_with_synthetic(
 ) -> None:
     """Generate and mix synthetic audio."""
     output_dir = Path(output_dir)
-    audio_path1 = output_dir / "synthetic1.flac"
-    audio_path2 = output_dir / "synthetic2.flac"
+    output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Generate first audio
-    gen1 = AudioGenerator(AudioConfig(pattern=AudioPattern(pattern1)))
-    audio1 = gen1.generate(audio_path1)
+    generators = [
+        AudioGenerator(SyntheticAudioConfig(pattern=AudioPattern(pattern1))),
+        AudioGenerator(SyntheticAudioConfig(pattern=AudioPattern(pattern2))),
+    ]
 
-    # Generate second audio
-    gen2 = AudioGenerator(AudioConfig(pattern=AudioPattern(pattern2)))
-    audio2 = gen2.generate(audio_path2)
-
-    # Mix audio files
-    mix_audio(str(audio1), str(audio2), str(output_dir), volumes=volumes)
+    # Mix the patterns in memory and encode once
+    output_path = generate_mix(
+        generators, volumes, output_dir / f"{pattern1}_{pattern2}_mixed.flac"
+    )
+    print(f"Mixed audio saved to: {output_path}")
 
 
 def main() -> None:
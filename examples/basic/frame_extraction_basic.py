@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import fire
@@ -22,7 +23,7 @@ def extract_basic(
         output_dir: Directory to save frames
         fps: Frames per second to extract (can be fraction like "1/2")
     """
-    config = FrameExtractionConfig(fps=fps, format="png", quality=95)
+    config = FrameExtractionConfig(fps=fps, format="jpg", quality=95)
 
     extractor = FrameExtractor(config, Path(output_dir))
 
@@ -48,7 +49,7 @@ def extract_with_resume(
         output_dir: Directory to save frames
         fps: Frames per second to extract
     """
-    config = FrameExtractionConfig(fps=fps, format="png", quality=95)
+    config = FrameExtractionConfig(fps=fps, format="jpg", quality=95)
 
     extractor = FrameExtractor(config, Path(output_dir))
 
@@ -72,6 +73,7 @@ def extract_frames_direct(
     start_time: float | None = None,
     end_time: float | None = None,
     fps: float | None = None,
+    threads: int = os.cpu_count() or 0,
 ) -> None:
     """
     Demonstrate direct frame extraction using FFmpegWrapper.
@@ -81,6 +83,7 @@ def extract_frames_direct(
         start_time: Start time in seconds
         end_time: End time in seconds
         fps: Frames per second to extract
+        threads: Decoder threads (0 lets FFmpeg decide)
     """
     print(f"\nExtracting frames directly:")
     print(f"Time range: {start_time or 0}s to {end_time or 'end'}")
@@ -89,9 +92,15 @@ def extract_frames_direct(
     frame_count = 0
     for frame in tqdm(
         FFmpegWrapper.extract_frames(
-            video_path=input_path, fps=fps, start_time=start_time, end_time=end_time
+            video_path=input_path,
+            fps=fps,
+            start_time=start_time,
+            end_time=end_time,
+            threads=threads,
         ),
         desc="Extracting",
+        miniters=256,
+        mininterval=0.5,
     ):
         frame_count += 1
 
@@ -111,25 +120,24 @@ def verify_frame_integrity(
         output_dir: Directory to save frames
         fps: Frames per second to extract
     """
-    config = FrameExtractionConfig(fps=fps, format="png", quality=95)
+    config = FrameExtractionConfig(fps=fps)
 
     extractor = FrameExtractor(config, Path(output_dir))
 
-    # First extraction
-    print("\nPerforming initial extraction")
-    result = extractor.extract_frames(Path(input_path))
-    initial_hashes = result.frame_files.copy()
+    # Only hashes are needed, so frames are hashed in memory from the pipe
+    print("\nHashing frames")
+    initial_hashes = extractor.hash_frames(Path(input_path))
 
     # Verify integrity
     print("\nVerifying frame integrity")
-    result = extractor.extract_frames(Path(input_path), resume=True)
+    frame_hashes = extractor.hash_frames(Path(input_path))
 
-    if result.frame_files == initial_hashes:
+    if frame_hashes == initial_hashes:
         print("Frame integrity verified - all hashes match")
     else:
         print("Frame integrity mismatch detected")
 
-    print(f"Verified {len(result.frame_files)} frames")
+    print(f"Verified {len(frame_hashes)} frames")
 
 
 def main() -> None:
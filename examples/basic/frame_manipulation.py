@@ -1,21 +1,39 @@
 from __future__ import annotations
 
+from collections import deque
 from pathlib import Path
-from typing import Iterator
+from typing import Callable, Iterator
 
+import cv2
 import fire
 import numpy as np
 from tqdm import tqdm
 
 from quackvideo.video.reader import VideoReader, VideoReaderConfig
 from quackvideo.video.writer import VideoWriter, VideoWriterConfig
-from quackvideo.core.utils import FeatureExtractor, FeatureExtractionMethod
+from quackvideo.core.utils import (
+    FeatureExtractor,
+    FeatureExtractionMethod,
+    map_frames,
+    prefetch_frames,
+)
+
+
+# Frame kernels for manipulate_sequential, each writing into ``out``
+_FRAME_OPS: dict[str, Callable[[np.ndarray, np.ndarray], np.ndarray]] = {
+    "mirror": lambda frame, out: cv2.flip(frame, 1, dst=out),
+    "rotate": lambda frame, out: cv2.rotate(
+        frame, cv2.ROTATE_90_COUNTERCLOCKWISE, dst=out
+    ),
+    "invert": lambda frame, out: cv2.bitwise_not(frame, dst=out),
+}
 
 
 def manipulate_sequential(
     input_path: str,
     output_path: str,
     operation: str = "mirror",
+    batch_size: int = 32,
 ) -> None:
     """
     Apply sequential frame manipulation.
@@ -24,28 +42,54 @@ def manipulate_sequential(
         input_path: Path to input video
         output_path: Path to save processed video
         operation: Type of manipulation ('mirror', 'rotate', 'invert')
+        batch_size: Number of output frames buffered per batch
     """
     reader = VideoReader(input_path)
     writer = VideoWriter(output_path, VideoWriterConfig(fps=reader.metadata.fps))
 
-    def process_frame(frame: np.ndarray, op: str) -> np.ndarray:
-        if op == "mirror":
-            return np.fliplr(frame)
-        elif op == "rotate":
-            return np.rot90(frame)
-        elif op == "invert":
-            return 255 - frame
-        else:
-            raise ValueError(f"Unknown operation: {op}")
-
-    processed_frames = []
-    print(f"\nApplying {operation} operation to frames")
+    # Resolve the kernel once so the per-frame loop carries no dispatch
+    if operation not in _FRAME_OPS:
+        raise ValueError(f"Unknown operation: {operation}")
+    process_frame = _FRAME_OPS[operation]
+
+    def process_frames(frames: Iterator[np.ndarray]) -> Iterator[np.ndarray]:
+        # Each frame is transformed straight into a slot of a reused output
+        # batch; the writer pipes each output frame to FFmpeg before the
+        # batch is refilled
+        out: np.ndarray | None = None
+        count = 0
+
+        for frame in frames:
+            if out is None:
+                height, width, channels = frame.shape
+                out_shape = (
+                    (batch_size, width, height, channels)
+                    if operation == "rotate"
+                    else (batch_size, height, width, channels)
+                )
+                out = np.empty(out_shape, dtype=frame.dtype)
+
+            process_frame(frame, out[count])
+            count += 1
+            if count == batch_size:
+                yield from out
+                count = 0
+
+        if count:
+            yield from out[:count]
 
-    for frame in tqdm(reader.read_frames(), desc="Processing"):
-        processed = process_frame(frame, operation)
-        processed_frames.append(processed)
+    print(f"\nApplying {operation} operation to frames")
 
-    result = writer.write_frames(processed_frames)
+    result = writer.write_frames_from_stream(
+        process_frames(
+            tqdm(
+                reader.read_frames(),
+                desc="Processing",
+                miniters=256,
+                mininterval=0.5,
+            )
+        )
+    )
     print(f"\nProcessed {result.frame_count} frames")
     print(f"Output saved to: {result.output_path}")
 
@@ -66,25 +110,42 @@ def manipulate_sliding_window(
     reader = VideoReader(input_path)
     writer = VideoWriter(output_path, VideoWriterConfig(fps=reader.metadata.fps))
 
-    def process_window(frames: list[np.ndarray]) -> np.ndarray:
-        """Average frames in the window."""
-        return np.mean(frames, axis=0).astype(np.uint8)
-
-    # Initialize frame buffer
-    frame_buffer = []
-    processed_frames = []
+    def process_window(frames: Iterator[np.ndarray]) -> Iterator[np.ndarray]:
+        """Average frames in the window using a rolling sum."""
+        frame_buffer: deque[np.ndarray] = deque(maxlen=window_size)
+        acc: np.ndarray | None = None
+
+        for frame in frames:
+            if acc is None:
+                # Work buffers are sized once from the first frame; the
+                # writer consumes each output before the next is produced
+                acc = np.zeros(frame.shape, dtype=np.uint32)
+                quotient = np.empty(frame.shape, dtype=np.uint32)
+                out = np.empty(frame.shape, dtype=np.uint8)
+
+            # Evict the oldest frame from the sum before the deque drops it
+            if len(frame_buffer) == window_size:
+                acc -= frame_buffer[0]
+            acc += frame
+            frame_buffer.append(frame)
+
+            if len(frame_buffer) == window_size:
+                np.floor_divide(acc, window_size, out=quotient)
+                np.copyto(out, quotient, casting="unsafe")
+                yield out
 
     print(f"\nProcessing with window size: {window_size}")
 
-    for frame in tqdm(reader.read_frames(), desc="Processing"):
-        frame_buffer.append(frame)
-
-        if len(frame_buffer) >= window_size:
-            processed = process_window(frame_buffer)
-            processed_frames.append(processed)
-            frame_buffer.pop(0)
-
-    result = writer.write_frames(processed_frames)
+    result = writer.write_frames_from_stream(
+        process_window(
+            tqdm(
+                reader.read_frames(),
+                desc="Processing",
+                miniters=256,
+                mininterval=0.5,
+            )
+        )
+    )
     print(f"\nProcessed {result.frame_count} frames")
     print(f"Output saved to: {result.output_path}")
 
@@ -94,6 +155,7 @@ def manipulate_with_features(
     output_path: str,
     feature_method: str = "histogram",
     threshold: float = 0.5,
+    batch_size: int = 32,
 ) -> None:
     """
     Manipulate frames based on feature analysis.
@@ -103,6 +165,7 @@ def manipulate_with_features(
         output_path: Path to save processed video
         feature_method: Feature extraction method
         threshold: Feature difference threshold
+        batch_size: Number of frames processed per vectorized operation
     """
     reader = VideoReader(input_path)
     writer = VideoWriter(output_path, VideoWriterConfig(fps=reader.metadata.fps))
@@ -110,38 +173,55 @@ def manipulate_with_features(
     extractor = FeatureExtractor(method=FeatureExtractionMethod(feature_method))
 
     def process_based_on_features(
-        frame: np.ndarray, features: np.ndarray, base_features: np.ndarray
+        frames: list[np.ndarray], strong: np.ndarray
     ) -> np.ndarray:
-        """Process frame based on feature difference."""
-        diff = np.mean(np.abs(features - base_features))
-        if diff > threshold:
-            # Apply stronger effect for more different frames
-            return np.flip(frame, axis=(0, 1))
-        else:
-            # Apply milder effect for similar frames
-            return np.flip(frame, axis=1)
+        """Process a batch of frames based on precomputed difference mask."""
+        batch = np.stack(frames)
+        strong_idx = np.flatnonzero(strong)
+        mild_idx = np.flatnonzero(~strong)
+
+        # Apply stronger effect for more different frames
+        batch[strong_idx] = np.flip(batch[strong_idx], axis=(1, 2))
+        # Apply milder effect for similar frames
+        batch[mild_idx] = np.flip(batch[mild_idx], axis=2)
+        return batch
+
+    def process_frames() -> Iterator[np.ndarray]:
+        for start in tqdm(range(0, len(frames), batch_size), desc="Processing"):
+            end = start + batch_size
+            yield from process_based_on_features(frames[start:end], strong[start:end])
 
     # Read all frames first
     print("\nReading frames and extracting features")
     frames = []
     features = []
 
-    for frame in tqdm(reader.read_frames(), desc="Analyzing"):
+    analyzed = map_frames(
+        lambda frame: (frame, extractor.extract(frame)),
+        prefetch_frames(reader.read_frames()),
+    )
+
+    for frame, frame_features in tqdm(
+        analyzed, desc="Analyzing", miniters=256, mininterval=0.5
+    ):
         frames.append(frame)
-        features.append(extractor.extract(frame))
+        features.append(frame_features)
+
+    if not frames:
+        print("\nNo frames to process")
+        return
 
-    features = np.array(features)
+    # One contiguous float32 matrix; all distances in a single vectorized pass
+    features = np.ascontiguousarray(np.stack(features), dtype=np.float32)
+    features = features.reshape(len(frames), -1)
     base_features = features[0]  # Use first frame as reference
+    diffs = np.abs(features - base_features).mean(axis=1)
+    strong = diffs > threshold
 
     # Process frames based on features
     print("\nProcessing frames based on feature analysis")
-    processed_frames = []
-
-    for frame, frame_features in tqdm(zip(frames, features), desc="Processing"):
-        processed = process_based_on_features(frame, frame_features, base_features)
-        processed_frames.append(processed)
 
-    result = writer.write_frames(processed_frames)
+    result = writer.write_frames_from_stream(process_frames())
     print(f"\nProcessed {result.frame_count} frames")
     print(f"Output saved to: {result.output_path}")
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import math
 from pathlib import Path
 from typing import Iterator
 
@@ -15,6 +16,8 @@ from quackvideo.core.utils import (
     detect_scene_change,
     detect_black_frames,
     FrameComparisonConfig,
+    map_frames,
+    prefetch_frames,
 )
 
 
@@ -36,19 +39,28 @@ def process_scene_changes(
 
     print(f"\nAnalyzing video for scene changes (threshold: {threshold})")
 
-    frames = list(tqdm(reader.read_frames(), desc="Reading frames"))
-    if len(frames) < 2:
-        print("Video too short for scene detection")
-        return
-
+    # Single pass: only the previous frame and detected scene frames are kept
     scene_changes = []
-    prev_frame = frames[0]
-
-    for i, frame in enumerate(tqdm(frames[1:], desc="Detecting scenes")):
-        if detect_scene_change(prev_frame, frame, config):
-            timestamp = (i + 1) / reader.metadata.fps
-            scene_changes.append((timestamp, frame))
+    prev_frame = None
+    frame_count = 0
+
+    for i, frame in enumerate(
+        tqdm(
+            reader.read_frames(),
+            desc="Detecting scenes",
+            miniters=256,
+            mininterval=0.5,
+        )
+    ):
+        if prev_frame is not None and detect_scene_change(prev_frame, frame, config):
+            timestamp = i / reader.metadata.fps
+            scene_changes.append((timestamp, frame.copy()))
         prev_frame = frame
+        frame_count += 1
+
+    if frame_count < 2:
+        print("Video too short for scene detection")
+        return
 
     print(f"\nDetected {len(scene_changes)} scene changes")
 
@@ -80,8 +92,12 @@ def analyze_black_frames(
 
     print(f"\nAnalyzing video for black frames (threshold: {threshold})")
 
-    for frame in tqdm(reader.read_frames(), desc="Processing"):
-        if detect_black_frames(frame, threshold):
+    is_black = map_frames(
+        lambda frame: detect_black_frames(frame, threshold), reader.read_frames()
+    )
+
+    for black in tqdm(is_black, desc="Processing", miniters=256, mininterval=0.5):
+        if black:
             timestamp = total_frames / reader.metadata.fps
             black_frames.append(timestamp)
         total_frames += 1
@@ -112,14 +128,57 @@ def extract_features(
     reader = VideoReader(input_path)
     extractor = FeatureExtractor(method=FeatureExtractionMethod(method))
 
-    features = []
+    # Preallocate from the expected frame count; grown by doubling if the
+    # container metadata underestimates it
+    capacity = max(1, math.ceil(reader.metadata.duration * reader.metadata.fps))
+    features: np.ndarray | None = None
+    frame_count = 0
+
+    # Running statistics, updated per frame so no second pass is needed
+    stat_count = 0
+    stat_mean = 0.0
+    stat_m2 = 0.0
+    stat_min = math.inf
+    stat_max = -math.inf
+
     print(f"\nExtracting features using method: {method}")
 
-    for frame in tqdm(reader.read_frames(), desc="Processing"):
-        frame_features = extractor.extract(frame)
-        features.append(frame_features)
+    for frame_features in tqdm(
+        map_frames(extractor.extract, prefetch_frames(reader.read_frames())),
+        desc="Processing",
+        miniters=256,
+        mininterval=0.5,
+    ):
+        frame_features = np.asarray(frame_features, dtype=np.float32)
+        frame_features = frame_features.ravel()
+
+        if features is None:
+            features = np.empty((capacity, frame_features.size), dtype=np.float32)
+        elif frame_count == features.shape[0]:
+            grown = np.empty((2 * frame_count, features.shape[1]), dtype=np.float32)
+            grown[:frame_count] = features
+            features = grown
+
+        features[frame_count] = frame_features
+        frame_count += 1
+
+        # Merge this frame into the running mean/variance (Chan et al.)
+        n = frame_features.size
+        frame_mean = float(frame_features.mean(dtype=np.float64))
+        frame_m2 = float(np.square(frame_features - frame_mean, dtype=np.float64).sum())
+        delta = frame_mean - stat_mean
+        total = stat_count + n
+        stat_mean += delta * n / total
+        stat_m2 += frame_m2 + delta * delta * stat_count * n / total
+        stat_count = total
+        stat_min = min(stat_min, float(frame_features.min()))
+        stat_max = max(stat_max, float(frame_features.max()))
+
+    if features is None:
+        print("\nNo frames read from video")
+        return
 
-    features = np.array(features)
+    features = features[:frame_count]
 
     print(f"\nExtracted features shape: {features.shape}")
 
@@ -129,10 +188,10 @@ def extract_features(
 
     # Basic feature analysis
     print("\nFeature Statistics:")
-    print(f"Mean: {np.mean(features):.2f}")
-    print(f"Std: {np.std(features):.2f}")
-    print(f"Min: {np.min(features):.2f}")
-    print(f"Max: {np.max(features):.2f}")
+    print(f"Mean: {stat_mean:.2f}")
+    print(f"Std: {math.sqrt(stat_m2 / stat_count):.2f}")
+    print(f"Min: {stat_min:.2f}")
+    print(f"Max: {stat_max:.2f}")
 
 
 def main() -> None:
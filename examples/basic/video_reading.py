@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import fire
@@ -19,8 +20,8 @@ def read_video_basic(
         video_path: Path to input video file
         display_metadata: Whether to display video metadata
     """
-    # Initialize video reader with default configuration
-    reader = VideoReader(video_path)
+    # Initialize video reader with multi-threaded decoding
+    reader = VideoReader(video_path, VideoReaderConfig(threads=os.cpu_count() or 0))
 
     # Display video metadata if requested
     if display_metadata:
@@ -35,7 +36,9 @@ def read_video_basic(
     # Read and process frames
     print("\nReading frames...")
     frame_count = 0
-    for frame in tqdm(reader.read_frames(), desc="Processing"):
+    for frame in tqdm(
+        reader.read_frames(), desc="Processing", miniters=256, mininterval=0.5
+    ):
         frame_count += 1
 
     print(f"\nProcessed {frame_count} frames")
@@ -48,6 +51,7 @@ def read_video_with_config(
     end_time: float | None = None,
     width: int | None = None,
     height: int | None = None,
+    threads: int = os.cpu_count() or 0,
 ) -> None:
     """
     Example of reading a video with custom configuration.
@@ -59,6 +63,7 @@ def read_video_with_config(
         end_time: End time in seconds
         width: Target width (if None, maintains original)
         height: Target height (if None, maintains original)
+        threads: Decoder threads (0 lets FFmpeg decide)
     """
     # Create configuration
     config = VideoReaderConfig(
@@ -66,6 +71,7 @@ def read_video_with_config(
         start_time=start_time,
         end_time=end_time,
         resolution=(width, height) if width and height else None,
+        threads=threads,
     )
 
     # Initialize reader with config
@@ -73,7 +79,9 @@ def read_video_with_config(
 
     # Read and count frames
     frame_count = 0
-    for frame in tqdm(reader.read_frames(), desc="Processing"):
+    for frame in tqdm(
+        reader.read_frames(), desc="Processing", miniters=256, mininterval=0.5
+    ):
         frame_count += 1
 
     print(f"\nProcessed {frame_count} frames from {start_time}s", end="")
@@ -89,7 +97,7 @@ def extract_keyframes(
     Args:
         video_path: Path to input video file
     """
-    reader = VideoReader(video_path)
+    reader = VideoReader(video_path, VideoReaderConfig(threads=os.cpu_count() or 0))
 
     print("\nExtracting keyframes...")
     keyframe_count = 0
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from pathlib import Path
 
 import fire
@@ -41,16 +42,18 @@ def write_solid_color_video(
 
     # Generate solid color frames
     total_frames = int(duration * fps)
-    frames = []
 
     # Create a single color frame
     color_frame = np.full((height, width, 3), color, dtype=np.uint8)
 
-    # Duplicate the frame
-    frames = [color_frame.copy() for _ in range(total_frames)]
+    def frame_generator() -> Iterator[np.ndarray]:
+        # The writer serializes each frame to ffmpeg before pulling the next,
+        # so the same frame can be yielded repeatedly without copying
+        for _ in range(total_frames):
+            yield color_frame
 
-    # Write frames
-    result = writer.write_frames(frames)
+    # Write frames using streaming
+    result = writer.write_frames_from_stream(frame_generator())
     print(f"\nCreated video at: {result.output_path}")
     print(f"Duration: {result.duration:.2f}s")
     print(f"Frames: {result.frame_count}")
@@ -77,13 +80,21 @@ def write_streaming_gradient(
 
     writer = VideoWriter(output_path, config)
 
-    def frame_generator():
+    def frame_generator() -> Iterator[np.ndarray]:
         total_frames = int(duration * fps)
+
+        # Only the gradient scale changes over time, so build the base ramp
+        # and the output buffers once and rescale in place for each frame
+        ramp = np.linspace(0, 255, width, dtype=np.float32)
+        scaled = np.empty(width, dtype=np.float32)
+        gradient = np.empty(width, dtype=np.uint8)
+        frame = np.empty((height, width, 3), dtype=np.uint8)
+
         for i in range(total_frames):
             # Create gradient that changes over time
             t = i / total_frames
-            gradient = np.linspace(0, 255 * (1 - t), width)
-            frame = np.zeros((height, width, 3), dtype=np.uint8)
+            np.multiply(ramp, 1 - t, out=scaled)
+            gradient[:] = scaled
             frame[:, :, 0] = gradient[None, :]  # Red channel
             frame[:, :, 1] = gradient[None, ::-1]  # Green channel
             frame[:, :, 2] = gradient[None, :]  # Blue channel
@@ -124,28 +135,41 @@ def write_high_quality(
 
     writer = VideoWriter(output_path, config)
 
-    # Generate test pattern frames
-    total_frames = int(duration * fps)
-    frames = []
+    def frame_generator() -> Iterator[np.ndarray]:
+        total_frames = int(duration * fps)
 
-    for i in range(total_frames):
-        # Create a test pattern
-        frame = np.zeros((height, width, 3), dtype=np.uint8)
+        # Coordinate grids and scratch buffers are shared by every frame
+        y, x = np.ogrid[:height, :width]
+        y = y.astype(np.int32)
+        x = x.astype(np.int32)
+        dx = np.empty_like(x)
+        dy = np.empty_like(y)
+        dist = np.empty((height, width), dtype=np.int32)
+        mask = np.empty((height, width), dtype=bool)
+        frame = np.empty((height, width, 3), dtype=np.uint8)
 
-        # Add some animated elements
-        t = i / total_frames
-        circle_x = int(width / 2 + width / 4 * np.cos(2 * np.pi * t))
-        circle_y = int(height / 2 + height / 4 * np.sin(2 * np.pi * t))
+        for i in range(total_frames):
+            # Create a test pattern
+            frame.fill(0)
 
-        # Draw a moving circle
-        y, x = np.ogrid[:height, :width]
-        mask = (x - circle_x) ** 2 + (y - circle_y) ** 2 <= 100**2
-        frame[mask] = [255, 255, 255]
+            # Add some animated elements
+            t = i / total_frames
+            circle_x = int(width / 2 + width / 4 * np.cos(2 * np.pi * t))
+            circle_y = int(height / 2 + height / 4 * np.sin(2 * np.pi * t))
+
+            # Draw a moving circle
+            np.subtract(x, circle_x, out=dx)
+            np.multiply(dx, dx, out=dx)
+            np.subtract(y, circle_y, out=dy)
+            np.multiply(dy, dy, out=dy)
+            np.add(dy, dx, out=dist)
+            np.less_equal(dist, 100**2, out=mask)
+            frame[mask] = 255
 
-        frames.append(frame)
+            yield frame
 
-    # Write frames
-    result = writer.write_frames(frames)
+    # Write frames using streaming
+    result = writer.write_frames_from_stream(frame_generator())
     print(f"\nCreated high-quality video at: {result.output_path}")
     print(f"Duration: {result.duration:.2f}s")
     print(f"Frames: {result.frame_count}")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import fire
@@ -95,6 +96,7 @@ def demonstrate_out_of_range_extraction(video_path: Path) -> None:
             FFmpegWrapper.extract_frames(
                 video_path,
                 start_time=100.0,  # Way beyond our 1-second video
+                threads=os.cpu_count() or 0,
             )
         )
     except FFmpegError as e:
@@ -140,7 +142,9 @@ def demonstrate_extraction_interruption(video_path: Path) -> None:
 
     try:
         config = FrameExtractionConfig()
-        frames_iterator = FFmpegWrapper.extract_frames(video_path)
+        frames_iterator = FFmpegWrapper.extract_frames(
+            video_path, threads=os.cpu_count() or 0
+        )
 
         # Simulate interruption after first frame
         first_frame = next(frames_iterator)
@@ -8,6 +8,10 @@ import fire
 from quackvideo.synthetic.video import VideoPattern, VideoConfig, VideoGenerator
 from quackvideo.synthetic.audio import AudioPattern, AudioConfig, AudioGenerator
 
+# Pattern lookup by value, resolved without raising on unknown names
+_VIDEO_PATTERNS = {p.value: p for p in VideoPattern}
+_AUDIO_PATTERNS = {p.value: p for p in AudioPattern}
+
 
 def generate_video(
     output_path: str,
@@ -30,14 +34,13 @@ def generate_video(
         fps: Frames per second
         bitrate: Output video bitrate
     """
-    try:
-        pattern = VideoPattern(pattern)
-    except ValueError:
-        print(f"Invalid pattern. Available patterns: {[p.value for p in VideoPattern]}")
+    video_pattern = _VIDEO_PATTERNS.get(pattern)
+    if video_pattern is None:
+        print(f"Invalid pattern. Available patterns: {list(_VIDEO_PATTERNS)}")
         return
 
     config = VideoConfig(
-        pattern=pattern,
+        pattern=video_pattern,
         duration=duration,
         width=width,
         height=height,
@@ -73,14 +76,13 @@ def generate_audio(
         amplitude: Signal amplitude (0-1)
         format: Output audio format
     """
-    try:
-        pattern = AudioPattern(pattern)
-    except ValueError:
-        print(f"Invalid pattern. Available patterns: {[p.value for p in AudioPattern]}")
+    audio_pattern = _AUDIO_PATTERNS.get(pattern)
+    if audio_pattern is None:
+        print(f"Invalid pattern. Available patterns: {list(_AUDIO_PATTERNS)}")
         return
 
     config = AudioConfig(
-        pattern=pattern,
+        pattern=audio_pattern,
         duration=duration,
         frequency=frequency,
         sample_rate=sample_rate,
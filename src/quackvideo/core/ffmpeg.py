@@ -1,15 +1,29 @@
 # src/quackvideo/core/ffmpeg.py
 from __future__ import annotations
 
+import io
+import itertools
 import logging
+import math
+import os
+import queue
+import shutil
+import subprocess
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing, suppress
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import Callable, Generator, Iterator, Optional, Sequence
 
 import ffmpeg
 import numpy as np
 from pydantic import BaseModel, Field, field_validator
 from tqdm import tqdm
 
+from quackvideo.core.utils import _put_until_stopped, probe_media, set_pipe_size
+
 
 class FFmpegError(Exception):
     """Base exception for FFmpeg-related errors."""
@@ -23,17 +37,88 @@ class FFmpegTimeoutError(FFmpegError):
     pass
 
 
+# Frames decoded between progress bar updates
+PROGRESS_BATCH = 256
+
+# stderr lines kept from a running FFmpeg process for error messages
+STDERR_TAIL_LINES = 4096
+
+# Seconds of packets scanned to estimate the GOP length before deciding
+# whether to build a full keyframe index for sparse seeking
+GOP_SCAN_SECONDS = 20.0
+
+# Marks the end of a GOP's frames in extract_frames_parallel buffers
+_SEGMENT_DONE = object()
+
+# Stands in for the input path in memoized argv templates
+_INPUT_PLACEHOLDER = "{INPUT}"
+
+# Decoder discard levels accepted by FFmpeg's -skip_frame option
+SKIP_FRAME_MODES = frozenset({"none", "default", "noref", "bidir", "nokey", "all"})
+
+# Raw output pixel formats; 4:2:0 formats are planar and half the size of rgb24
+PIX_FMTS = frozenset({"rgb24", "bgr24", "gray", "nv12", "yuv420p"})
+
+
+def pix_fmt_shape(pix_fmt: str, width: int, height: int) -> tuple[int, ...]:
+    """
+    Get the array shape of one raw frame in the given pixel format.
+
+    Packed RGB formats are (H, W, 3) and gray is (H, W). The 4:2:0 formats
+    are returned as a single (H * 3 // 2, W) plane, the layout expected by
+    ``cv2.cvtColor`` with ``COLOR_YUV2RGB_NV12`` / ``COLOR_YUV2RGB_I420``.
+
+    Args:
+        pix_fmt: One of PIX_FMTS
+        width: Frame width in pixels
+        height: Frame height in pixels
+
+    Returns:
+        Shape of the uint8 array holding one frame
+    """
+    if pix_fmt in ("rgb24", "bgr24"):
+        return (height, width, 3)
+    if pix_fmt == "gray":
+        return (height, width)
+    if pix_fmt in ("nv12", "yuv420p"):
+        if width % 2 or height % 2:
+            raise ValueError(f"{pix_fmt} requires even frame dimensions")
+        return (height * 3 // 2, width)
+    raise ValueError(f"pix_fmt must be one of {sorted(PIX_FMTS)}")
+
+
 class FFmpegCommand(BaseModel):
     """Represents an FFmpeg command with its parameters."""
 
     input_path: Path = Field(..., description="Path to input file")
-    output_path: Path | None = Field(None, description="Path to output file")
+    output_path: Path | None = Field(default=None, description="Path to output file")
     fps: float | None = Field(None, description="Frames per second")
     start_time: float | None = Field(None, description="Start time in seconds")
     end_time: float | None = Field(None, description="End time in seconds")
     resolution: tuple[int, int] | None = Field(
         None, description="Output resolution (width, height)"
     )
+    threads: int = Field(0, description="Decoder threads (0 lets FFmpeg decide)")
+    hwaccel: str | None = Field(
+        None, description="Hardware decode API (e.g. 'cuda', 'vaapi', 'auto')"
+    )
+    skip_frame: str | None = Field(
+        default=None,
+        description=(
+            "Frames the decoder skips without decoding ('noref', 'bidir', "
+            "'nokey'); useful for sparse sampling"
+        ),
+    )
+    scale_flags: str | None = Field(
+        default=None,
+        description=(
+            "swscale algorithm for resizing (e.g. 'fast_bilinear', 'bilinear'); "
+            "defaults to FFmpeg's bicubic"
+        ),
+    )
+    pix_fmt: str = Field(
+        "rgb24", description="Raw output pixel format (e.g. 'rgb24', 'nv12')"
+    )
 
     @field_validator("fps")
     def validate_fps(cls, v: float | None) -> float | None:
@@ -55,26 +140,94 @@ class FFmpegCommand(BaseModel):
                 raise ValueError("Resolution dimensions must be positive")
         return v
 
+    @field_validator("threads")
+    def validate_threads(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError("Thread count must be non-negative")
+        return v
+
+    @field_validator("skip_frame")
+    def validate_skip_frame(cls, v: str | None) -> str | None:
+        if v is not None and v not in SKIP_FRAME_MODES:
+            raise ValueError(f"skip_frame must be one of {sorted(SKIP_FRAME_MODES)}")
+        return v
+
+    @field_validator("pix_fmt")
+    def validate_pix_fmt(cls, v: str) -> str:
+        if v not in PIX_FMTS:
+            raise ValueError(f"pix_fmt must be one of {sorted(PIX_FMTS)}")
+        return v
+
+    def input_kwargs(self) -> dict[str, str | int | float]:
+        """Build the decoder options passed to ``ffmpeg.input``."""
+        input_kwargs: dict[str, str | int | float] = {}
+        if self.threads > 0:
+            # Slice threading decodes each frame in parallel without the
+            # extra latency (and instability) of frame threading
+            input_kwargs.update(threads=self.threads, thread_type="slice")
+        if self.hwaccel is not None:
+            # Frames are decoded on the device and downloaded to system
+            # memory, so the filters below and the raw pipe are unchanged
+            input_kwargs["hwaccel"] = self.hwaccel
+        if self.skip_frame is not None:
+            # Skipped packets are demuxed but never reach the decoder
+            input_kwargs["skip_frame"] = self.skip_frame
+        return input_kwargs
+
     def build_stream(self) -> ffmpeg.Stream:
         """Build the FFmpeg stream with the specified parameters."""
-        stream = ffmpeg.input(str(self.input_path))
+        input_kwargs = self.input_kwargs()
 
+        # Seek and limit on the input side: the demuxer jumps to the keyframe
+        # before start_time and decoding stops at end_time, instead of
+        # decoding the whole file and discarding frames in filters
         if self.start_time is not None:
-            stream = stream.filter("setpts", f"PTS-{self.start_time}/TB")
+            input_kwargs["ss"] = self.start_time
+
+        if self.end_time is not None:
+            duration = self.end_time - (self.start_time or 0.0)
+            if duration > 0:
+                input_kwargs["t"] = duration
+
+        stream = ffmpeg.input(str(self.input_path), **input_kwargs)
 
         if self.fps is not None:
             stream = stream.filter("fps", fps=self.fps)
 
-        if self.resolution is not None:
-            stream = stream.filter("scale", self.resolution[0], self.resolution[1])
+        return self.scale_stream(stream)
 
-        if self.end_time is not None and self.start_time is not None:
-            duration = self.end_time - self.start_time
-            if duration > 0:
-                stream = stream.filter("setpts", f"PTS-STARTPTS")
-                stream = stream.filter("trim", duration=duration)
+    def compile_args(self) -> list[str]:
+        """
+        Build the argv that pipes raw frames in ``pix_fmt`` to stdout.
+
+        The argv is memoized on every parameter except the input path, so
+        repeated extractions with the same settings skip building the
+        ffmpeg-python graph and only substitute the path.
+        """
+        key = tuple(
+            (name, getattr(self, name))
+            for name in type(self).model_fields
+            if name not in ("input_path", "output_path")
+        )
+        input_path = str(self.input_path)
+        return [
+            input_path if arg == _INPUT_PLACEHOLDER else arg
+            for arg in _compile_pipe_args(key)
+        ]
 
-        return stream
+    def scale_stream(self, stream: ffmpeg.Stream) -> ffmpeg.Stream:
+        """Apply the configured resolution to a stream, if any."""
+        if self.resolution is None:
+            return stream
+
+        scale_kwargs = {"flags": self.scale_flags} if self.scale_flags else {}
+        stream = stream.filter(
+            "scale", self.resolution[0], self.resolution[1], **scale_kwargs
+        )
+        # Pin the output format right after scaling so swscale resizes and
+        # converts to the output format in one pass instead of adding a
+        # second scaler
+        return stream.filter("format", self.pix_fmt)
 
 
 class VideoInfo(BaseModel):
@@ -86,6 +239,213 @@ class VideoInfo(BaseModel):
     fps: float = Field(..., description="Video frames per second")
 
 
+def _byte_view(frame: np.ndarray) -> memoryview:
+    """Get a flat writable byte view of a contiguous frame."""
+    return memoryview(frame).cast("B")
+
+
+def _drain_stderr(
+    process: subprocess.Popen[bytes], maxlen: int = STDERR_TAIL_LINES
+) -> tuple[threading.Thread, deque[bytes]]:
+    """
+    Read a process's stderr on a background thread, keeping only the tail.
+
+    Without a reader, a chatty FFmpeg fills the stderr pipe and blocks on
+    its next log write, stalling decode while stdout is being consumed.
+    """
+    stderr = process.stderr
+    if stderr is None:
+        raise ValueError("process was started without a stderr pipe")
+    tail: deque[bytes] = deque(maxlen=maxlen)
+    set_pipe_size(stderr)
+    thread = threading.Thread(
+        target=lambda: tail.extend(iter(stderr.readline, b"")),
+        name="ffmpeg-stderr",
+        daemon=True,
+    )
+    thread.start()
+    return thread, tail
+
+
+def _stop_process(
+    process: subprocess.Popen[bytes], stderr_thread: threading.Thread
+) -> None:
+    """
+    Stop a piped FFmpeg process and release its pipes.
+
+    Errors closing a pipe are suppressed so they cannot mask the error that
+    ended the read.
+    """
+    if process.stdout is not None:
+        with suppress(OSError):
+            process.stdout.close()
+    if process.poll() is None:
+        process.terminate()
+        try:
+            process.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+    # FFmpeg has exited, so the drain thread reaches EOF; close stderr only
+    # after it stops reading
+    stderr_thread.join()
+    if process.stderr is not None:
+        with suppress(OSError):
+            process.stderr.close()
+
+
+def _run_to_completion(args: list[str], timeout: int) -> bytes:
+    """
+    Run an FFmpeg command and return its stdout.
+
+    Raises:
+        FFmpegTimeoutError: If FFmpeg does not finish within ``timeout``
+        FFmpegError: If FFmpeg exits with an error
+    """
+    # The argv is compiled by ffmpeg-python from our own stream graph and
+    # run without a shell
+    with subprocess.Popen(  # noqa: S603
+        args, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    ) as process:
+        try:
+            out, err = process.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired as e:
+            process.kill()
+            process.communicate()
+            raise FFmpegTimeoutError(f"FFmpeg timed out after {timeout}s") from e
+
+    if process.returncode != 0:
+        error_msg = err.decode(errors="replace")
+        raise FFmpegError(f"Frame extraction failed: {error_msg}")
+    return out
+
+
+def _fill_segment_buffer(
+    segment: Generator[np.ndarray, None, None],
+    buffer: queue.Queue,
+    stop: threading.Event,
+) -> None:
+    """Move a segment's frames into its buffer until done or stopped."""
+    with closing(segment):
+        try:
+            for frame in segment:
+                if not _put_until_stopped(buffer, frame, stop):
+                    return
+            _put_until_stopped(buffer, _SEGMENT_DONE, stop)
+        except Exception as e:
+            _put_until_stopped(buffer, e, stop)
+
+
+def _ordered_segment_frames(
+    segments: Iterator[Generator[np.ndarray, None, None]],
+    workers: int,
+    buffer_frames: int,
+) -> Iterator[np.ndarray]:
+    """
+    Run up to ``workers`` segment decoders at once, yielding frames in order.
+
+    Each running segment fills its own queue of ``buffer_frames`` frames and
+    blocks when it is full, so memory stays bounded by the number of frames
+    buffered rather than by segment length.
+    """
+    stop = threading.Event()
+    buffers: deque[queue.Queue] = deque()
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+
+        def start_next() -> None:
+            segment = next(segments, None)
+            if segment is not None:
+                buffers.append(queue.Queue(maxsize=buffer_frames))
+                executor.submit(_fill_segment_buffer, segment, buffers[-1], stop)
+
+        try:
+            for _ in range(workers):
+                start_next()
+
+            while buffers:
+                buffer = buffers.popleft()
+                while (item := buffer.get()) is not _SEGMENT_DONE:
+                    if isinstance(item, Exception):
+                        raise item
+                    yield item
+                # The segment's worker has finished, so its slot is free
+                start_next()
+        finally:
+            # Unblock workers if the consumer stopped early
+            stop.set()
+
+
+@lru_cache(maxsize=64)
+def _compile_pipe_args(key: tuple[tuple[str, object], ...]) -> tuple[str, ...]:
+    """Compile the raw-pipe argv template for a set of command parameters."""
+    cmd = FFmpegCommand.model_validate(
+        {**dict(key), "input_path": Path(_INPUT_PLACEHOLDER)}
+    )
+    return tuple(
+        cmd.build_stream()
+        .output("pipe:", format="rawvideo", pix_fmt=cmd.pix_fmt)
+        .global_args("-nostats")
+        .overwrite_output()
+        .compile()
+    )
+
+
+@lru_cache(maxsize=32)
+def _probe_keyframes(
+    video_path: str,
+    mtime_ns: int,
+    size: int,
+    timeout: int,
+    scan_seconds: float | None = None,
+) -> tuple[float, ...]:
+    """
+    Probe keyframe timestamps; mtime and size key the cache to the file.
+
+    With ``scan_seconds`` only packets from the first that many seconds are
+    read, which is enough to estimate the GOP length cheaply.
+    """
+    ffprobe = shutil.which("ffprobe")
+    if ffprobe is None:
+        raise FFmpegError("Failed to index keyframes: ffprobe not found on PATH")
+
+    read_intervals = (
+        [] if scan_seconds is None else ["-read_intervals", f"%+{scan_seconds}"]
+    )
+    try:
+        # Fixed argv with the path as its own argument; no shell is involved
+        result = subprocess.run(  # noqa: S603
+            [
+                ffprobe,
+                "-v",
+                "error",
+                "-select_streams",
+                "v:0",
+                *read_intervals,
+                "-show_entries",
+                "packet=pts_time,flags",
+                "-of",
+                "csv=p=0",
+                video_path,
+            ],
+            capture_output=True,
+            check=True,
+            timeout=timeout,
+        )
+    except subprocess.CalledProcessError as e:
+        raise FFmpegError(f"Failed to index keyframes: {e.stderr.decode()}") from e
+    except subprocess.TimeoutExpired as e:
+        raise FFmpegTimeoutError(f"Keyframe indexing timed out after {timeout}s") from e
+
+    # Packets are listed in decode order; only flags and pts matter here
+    keyframes = []
+    for line in result.stdout.decode().splitlines():
+        fields = line.split(",")
+        if len(fields) >= 2 and fields[1].startswith("K") and fields[0] != "N/A":
+            keyframes.append(float(fields[0]))
+    return tuple(sorted(keyframes))
+
+
 class FFmpegWrapper:
     """High-level wrapper for FFmpeg operations using ffmpeg-python."""
 
@@ -93,9 +453,15 @@ class FFmpegWrapper:
 
     @staticmethod
     def get_video_info(video_path: Path, timeout: int = 10) -> VideoInfo:
-        """Get video information using ffmpeg-python's probe."""
+        """
+        Get video information using ffmpeg-python's probe.
+
+        The probe is cached per file version, so repeated calls (including
+        the ones made while planning an extraction) do not spawn ffprobe
+        again.
+        """
         try:
-            probe = ffmpeg.probe(str(video_path))
+            probe = probe_media(video_path)
             video_stream = next(
                 (
                     stream
@@ -120,7 +486,223 @@ class FFmpegWrapper:
         except ffmpeg.Error as e:
             raise FFmpegError(
                 f"Failed to probe video: {e.stderr.decode() if e.stderr else str(e)}"
+            ) from e
+        except OSError as e:
+            raise FFmpegError(f"Failed to probe video: {e}") from e
+
+    @staticmethod
+    def build_keyframe_index(video_path: str | Path, timeout: int = 60) -> list[float]:
+        """
+        Get the presentation timestamps of all keyframes in a video.
+
+        Only packets are demuxed, nothing is decoded. Results are cached per
+        file until it is modified.
+
+        Args:
+            video_path: Path to video file
+            timeout: Probe timeout in seconds
+
+        Returns:
+            Sorted keyframe timestamps in seconds
+        """
+        video_path = Path(video_path).resolve()
+        stat = video_path.stat()
+        return list(
+            _probe_keyframes(str(video_path), stat.st_mtime_ns, stat.st_size, timeout)
+        )
+
+    @classmethod
+    def _use_sparse_seek(cls, video_path: Path, fps: float, timeout: int) -> bool:
+        """
+        Check whether seeking per sample skips at least one whole GOP.
+
+        The full keyframe index scans every packet of the file, so cheaper
+        checks run first: sampling at or above the video's frame rate never
+        skips a GOP, and a scan of the first ``GOP_SCAN_SECONDS`` rules out
+        sample intervals no longer than the GOPs seen there. The index is
+        only built when sparse seeking is likely to pay off.
+        """
+        interval = 1 / fps
+        try:
+            video_info = cls.get_video_info(video_path, timeout=timeout)
+            if interval <= 1 / video_info.fps:
+                return False
+
+            resolved = video_path.resolve()
+            stat = resolved.stat()
+            head = _probe_keyframes(
+                str(resolved),
+                stat.st_mtime_ns,
+                stat.st_size,
+                timeout,
+                GOP_SCAN_SECONDS,
+            )
+            # Fewer than two keyframes means the GOP spans the whole scan
+            gop_estimate = (
+                float(np.median(np.diff(head))) if len(head) >= 2 else GOP_SCAN_SECONDS
             )
+            if interval <= gop_estimate:
+                return False
+
+            keyframes = cls.build_keyframe_index(video_path, timeout=max(timeout, 60))
+        except (FFmpegError, OSError):
+            return False
+
+        if len(keyframes) < 2:
+            return False
+
+        gop_duration = float(np.median(np.diff(keyframes)))
+        return interval > gop_duration
+
+    @classmethod
+    def _extract_frames_sparse(
+        cls,
+        cmd: FFmpegCommand,
+        fps: float,
+        video_info: VideoInfo,
+        width: int,
+        height: int,
+        timeout: int,
+    ) -> Iterator[np.ndarray]:
+        """Extract one frame per sample by seeking to it on the input."""
+        start = cmd.start_time or 0.0
+        stop = cmd.end_time if cmd.end_time is not None else video_info.duration
+        frame_shape = pix_fmt_shape(cmd.pix_fmt, width, height)
+        frame_size = math.prod(frame_shape)
+        sample_count = max(0, math.ceil((stop - start) * fps))
+
+        with tqdm(total=sample_count, desc="Extracting frames", unit="frame") as pbar:
+            for i in range(sample_count):
+                # Input seeking jumps to the preceding keyframe and decodes
+                # only up to the sample instead of every frame in between
+                stream = ffmpeg.input(
+                    str(cmd.input_path), ss=start + i / fps, **cmd.input_kwargs()
+                )
+                stream = cmd.scale_stream(stream)
+                out = _run_to_completion(
+                    stream.output(
+                        "pipe:", vframes=1, format="rawvideo", pix_fmt=cmd.pix_fmt
+                    ).compile(),
+                    timeout,
+                )
+
+                if len(out) < frame_size:
+                    break
+
+                pbar.update(1)
+                yield np.frombuffer(out, np.uint8, frame_size).reshape(frame_shape)
+
+    @classmethod
+    def _decode_segment(
+        cls,
+        video_path: Path,
+        start: float,
+        duration: float,
+        resolution: tuple[int, int] | None,
+        frame_shape: tuple[int, int, int],
+        timeout: int,
+    ) -> Generator[np.ndarray, None, None]:
+        """Stream the frames of one GOP from its own FFmpeg process."""
+        stream = ffmpeg.input(str(video_path), ss=start)
+        if resolution is not None:
+            stream = stream.filter("scale", *resolution)
+
+        process = (
+            stream.output("pipe:", t=duration, format="rawvideo", pix_fmt="rgb24")
+            .global_args("-loglevel", "error", "-nostats")
+            .run_async(pipe_stdout=True, pipe_stderr=True)
+        )
+        set_pipe_size(process.stdout)
+        frame_size = math.prod(frame_shape)
+
+        try:
+            while True:
+                frame = np.empty(frame_shape, np.uint8)
+                if process.stdout.readinto(_byte_view(frame)) < frame_size:
+                    break
+                yield frame
+
+            process.wait(timeout=timeout)
+            if process.returncode != 0:
+                raise FFmpegError(
+                    f"FFmpeg process failed: {process.stderr.read().decode()}"
+                )
+        finally:
+            process.stdout.close()
+            process.stderr.close()
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+
+    @classmethod
+    def extract_frames_parallel(
+        cls,
+        video_path: str | Path,
+        resolution: tuple[int, int] | None = None,
+        *,
+        workers: int | None = None,
+        buffer_frames: int = 32,
+        skip_validation: bool = False,
+        timeout: int = 10,
+    ) -> Iterator[np.ndarray]:
+        """
+        Extract all frames by decoding GOPs in parallel FFmpeg processes.
+
+        The video is split at its keyframes and each GOP is decoded by its own
+        FFmpeg process, so decoding scales across cores even for codecs with
+        little internal parallelism. Frames are yielded in presentation order.
+        Each GOP being decoded streams into a buffer of ``buffer_frames``
+        frames and its FFmpeg process pauses when the buffer is full, so at
+        most ``workers * buffer_frames`` decoded frames are held at once,
+        however long the GOPs are.
+
+        Args:
+            video_path: Path to video file
+            resolution: Optional output resolution (width, height)
+            workers: Number of concurrent FFmpeg processes (defaults to CPU
+                count)
+            buffer_frames: Frames buffered ahead per GOP being decoded
+            skip_validation: Skip checking that the file exists
+            timeout: Timeout in seconds for probing and each decode
+
+        Yields:
+            Frames as HxWx3 uint8 arrays
+        """
+        if buffer_frames <= 0:
+            raise ValueError("buffer_frames must be positive")
+
+        video_path = Path(video_path)
+        if not skip_validation and not video_path.exists():
+            raise FileNotFoundError(f"Video file not found: {video_path}")
+
+        video_info = cls.get_video_info(video_path, timeout=timeout)
+        width, height = (
+            resolution if resolution else (video_info.width, video_info.height)
+        )
+        frame_shape = (height, width, 3)
+
+        keyframes = cls.build_keyframe_index(video_path, timeout=max(timeout, 60))
+        bounds = [0.0, *(kf for kf in keyframes if kf > 0), video_info.duration]
+
+        # Stop half a frame early so the next GOP's keyframe is not duplicated
+        half_frame = 0.5 / video_info.fps
+        segments = (
+            cls._decode_segment(
+                video_path,
+                start,
+                max(end - start - half_frame, half_frame),
+                resolution,
+                frame_shape,
+                timeout,
+            )
+            for start, end in itertools.pairwise(bounds)
+        )
+
+        workers = workers or os.cpu_count() or 1
+        with tqdm(desc="Extracting frames", unit="frame") as pbar:
+            for frame in _ordered_segment_frames(segments, workers, buffer_frames):
+                pbar.update(1)
+                yield frame
 
     @classmethod
     def extract_frames(
@@ -133,77 +715,476 @@ class FFmpegWrapper:
         *,
         skip_validation: bool = False,
         timeout: int = 10,
-    ) -> Iterator[np.ndarray]:
-        """Extract video frames using ffmpeg-python."""
+        threads: int = 0,
+        hwaccel: str | None = None,
+        skip_frame: str | None = None,
+        ring_size: int = 0,
+        scale_flags: str | None = None,
+        pix_fmt: str = "rgb24",
+        sparse_seek: bool = False,
+    ) -> Generator[np.ndarray, None, None]:
+        """
+        Extract video frames using ffmpeg-python.
+
+        With ``sparse_seek``, when ``fps`` samples less often than the
+        video's keyframe interval, each sample is extracted with its own
+        input seek instead of decoding the whole range and dropping frames.
+        Deciding that probes the file's keyframes before decoding starts,
+        so it is opt-in for callers sampling far apart.
+
+        Otherwise FFmpeg is spawned first and the video is probed for its
+        frame size only when the first frame is read, so the probe overlaps
+        with FFmpeg's startup. With ``sparse_seek`` the probe and keyframe
+        scan run synchronously before any process is spawned.
+
+        ``skip_frame`` (e.g. 'noref') lets the decoder drop frames nothing
+        else depends on, so sampling only picks among the frames that were
+        decoded.
+
+        By default every frame is a new array. With ``ring_size=N`` frames are
+        read into N preallocated buffers that are reused in turn, so a yielded
+        frame is only valid until N more frames have been read; copy it to
+        keep it longer.
+
+        Frames are (H, W, 3) rgb24 by default. ``pix_fmt='nv12'`` or
+        ``'yuv420p'`` skips FFmpeg's RGB conversion and halves the bytes
+        piped per frame; each frame is then a (H * 3 // 2, W) array that
+        callers needing RGB convert with
+        ``cv2.cvtColor(frame, cv2.COLOR_YUV2RGB_NV12)`` (``COLOR_YUV2RGB_I420``
+        for yuv420p), and analyses that only need luma can use
+        ``frame[:H]`` directly.
+        """
+        if ring_size < 0:
+            raise ValueError("ring_size must be non-negative")
+
+        video_path = Path(video_path)
+        if not skip_validation and not video_path.exists():
+            raise FileNotFoundError(f"Video file not found: {video_path}")
+
+        # Build FFmpeg command
+        cmd = FFmpegCommand(
+            input_path=video_path,
+            fps=fps,
+            start_time=start_time,
+            end_time=end_time,
+            resolution=resolution,
+            threads=threads,
+            hwaccel=hwaccel,
+            skip_frame=skip_frame,
+            scale_flags=scale_flags,
+            pix_fmt=pix_fmt,
+        )
+
+        if (
+            sparse_seek
+            and fps is not None
+            and cls._use_sparse_seek(video_path, fps, timeout)
+        ):
+            video_info = cls.get_video_info(video_path, timeout=timeout)
+            width, height = (
+                resolution if resolution else (video_info.width, video_info.height)
+            )
+            yield from cls._extract_frames_sparse(
+                cmd, fps, video_info, width, height, timeout
+            )
+            return
+
+        frame_shape: tuple[int, ...] | None = None
+        ring: list[np.ndarray] = []
+
+        def next_buffer(frame_index: int) -> np.ndarray:
+            nonlocal frame_shape
+            if frame_shape is None:
+                # Resolved on the first read, after FFmpeg has been spawned, so
+                # probing overlaps with its startup instead of preceding it
+                if resolution:
+                    width, height = resolution
+                else:
+                    video_info = cls.get_video_info(video_path, timeout=timeout)
+                    width, height = video_info.width, video_info.height
+                frame_shape = pix_fmt_shape(pix_fmt, width, height)
+                ring.extend(np.empty(frame_shape, np.uint8) for _ in range(ring_size))
+
+            if ring:
+                return ring[frame_index % ring_size]
+            return np.empty(frame_shape, np.uint8)
+
+        yield from cls._pipe_frames(cmd, timeout, next_buffer)
+
+    @classmethod
+    def extract_frames_batch(
+        cls,
+        video_paths: Sequence[str | Path],
+        fps: float | None = None,
+        resolution: tuple[int, int] | None = None,
+        *,
+        timeout: int = 10,
+        threads: int = 0,
+    ) -> Iterator[tuple[Path, np.ndarray]]:
+        """
+        Extract frames from several videos, starting each decoder early.
+
+        While frames of one video are being consumed, the FFmpeg process for
+        the next video is spawned and its first frame decoded on a background
+        thread, so process startup and stream analysis are hidden behind the
+        consumer instead of being paid serially per file.
+
+        Args:
+            video_paths: Videos to decode, in order
+            fps: Frames per second to extract
+            resolution: Optional output resolution (width, height)
+            timeout: Timeout in seconds for probing and process shutdown
+            threads: Decoder threads (0 lets FFmpeg decide)
+
+        Yields:
+            (video path, frame) tuples
+        """
+        paths = [Path(path) for path in video_paths]
+
+        def start(
+            path: Path,
+        ) -> tuple[Generator[np.ndarray, None, None], np.ndarray | None]:
+            frames = cls.extract_frames(
+                path, fps=fps, resolution=resolution, timeout=timeout, threads=threads
+            )
+            return frames, next(frames, None)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Lazy, so each decoder is only started when the previous one is
+            # being consumed
+            starts = ((path, executor.submit(start, path)) for path in paths)
+            upcoming = next(starts, None)
+            frames: Generator[np.ndarray, None, None] | None = None
+            try:
+                while upcoming is not None:
+                    path, started = upcoming
+                    frames, first_frame = started.result()
+                    upcoming = next(starts, None)
+
+                    if first_frame is None:
+                        continue
+                    yield path, first_frame
+                    for frame in frames:
+                        yield path, frame
+            finally:
+                if frames is not None:
+                    frames.close()
+                # Shut down a decoder that was started ahead but not consumed;
+                # its startup error, if any, belongs to a video never read
+                if upcoming is not None and not upcoming[1].cancel():
+                    with suppress(Exception):
+                        upcoming[1].result()[0].close()
+
+    @classmethod
+    def read_frames_into(
+        cls,
+        video_path: str | Path,
+        out_buffers: Sequence[np.ndarray],
+        fps: float | None = None,
+        start_time: float | None = None,
+        end_time: float | None = None,
+        resolution: tuple[int, int] | None = None,
+        *,
+        skip_validation: bool = False,
+        timeout: int = 10,
+        threads: int = 0,
+        hwaccel: str | None = None,
+        pix_fmt: str = "rgb24",
+    ) -> Iterator[int]:
+        """
+        Decode frames directly into caller-supplied buffers.
+
+        Frame ``i`` is read into ``out_buffers[i % len(out_buffers)]`` and
+        ``i`` is yielded once it is complete. The buffer stays valid until the
+        generator is resumed ``len(out_buffers)`` more times, so callers can
+        decode into pinned or preallocated memory without an extra copy.
+
+        Args:
+            video_path: Path to video file
+            out_buffers: C-contiguous, writable uint8 arrays of shape
+                ``pix_fmt_shape(pix_fmt, W, H)`` for the output resolution
+            fps: Frames per second to extract
+            start_time: Start time in seconds
+            end_time: End time in seconds
+            resolution: Optional output resolution (width, height)
+            skip_validation: Skip checking that the file exists
+            timeout: Timeout in seconds for probing and process shutdown
+            threads: Decoder threads (0 lets FFmpeg decide)
+            hwaccel: Hardware decode API
+            pix_fmt: Raw output pixel format
+
+        Yields:
+            Index of each decoded frame
+        """
+        if not out_buffers:
+            raise ValueError("At least one output buffer is required")
+
         video_path = Path(video_path)
         if not skip_validation and not video_path.exists():
             raise FileNotFoundError(f"Video file not found: {video_path}")
 
-        # Get video info
         video_info = cls.get_video_info(video_path, timeout=timeout)
         width, height = (
             resolution if resolution else (video_info.width, video_info.height)
         )
 
-        # Build FFmpeg command
+        frame_shape = pix_fmt_shape(pix_fmt, width, height)
+        for buffer in out_buffers:
+            if (
+                buffer.shape != frame_shape
+                or buffer.dtype != np.uint8
+                or not buffer.flags.c_contiguous
+                or not buffer.flags.writeable
+            ):
+                raise ValueError(
+                    f"Output buffers must be writable, C-contiguous uint8 arrays "
+                    f"of shape {frame_shape}"
+                )
+
         cmd = FFmpegCommand(
             input_path=video_path,
             fps=fps,
             start_time=start_time,
             end_time=end_time,
             resolution=resolution,
+            threads=threads,
+            hwaccel=hwaccel,
+            pix_fmt=pix_fmt,
+        )
+
+        frames = cls._pipe_frames(
+            cmd,
+            timeout,
+            lambda frame_index: out_buffers[frame_index % len(out_buffers)],
+        )
+        for frame_index, _ in enumerate(frames):
+            yield frame_index
+
+    @classmethod
+    def extract_frames_normalized(
+        cls,
+        video_path: str | Path,
+        out: np.ndarray,
+        mean: Sequence[float],
+        std: Sequence[float],
+        fps: float | None = None,
+        start_time: float | None = None,
+        end_time: float | None = None,
+        resolution: tuple[int, int] | None = None,
+        *,
+        skip_validation: bool = False,
+        timeout: int = 10,
+        threads: int = 0,
+        hwaccel: str | None = None,
+    ) -> Iterator[np.ndarray]:
+        """
+        Decode frames straight into a normalized float32 batch.
+
+        Frame ``i`` is decoded into a single reused uint8 buffer and written
+        to ``out[i % len(out)]`` as ``(frame - mean) / std`` per channel,
+        without allocating a float copy of each frame. The yielded slice is
+        a view of ``out`` and is overwritten after ``len(out)`` more frames.
+
+        Args:
+            video_path: Path to video file
+            out: C-contiguous float32 array of shape (N, H, W, 3)
+            mean: Per-channel (R, G, B) mean in pixel units (0-255)
+            std: Per-channel (R, G, B) standard deviation in pixel units
+            fps: Frames per second to extract
+            start_time: Start time in seconds
+            end_time: End time in seconds
+            resolution: Optional output resolution (width, height)
+            skip_validation: Skip checking that the file exists
+            timeout: Timeout in seconds for probing and process shutdown
+            threads: Decoder threads (0 lets FFmpeg decide)
+            hwaccel: Hardware decode API
+
+        Yields:
+            Normalized frames, as views of ``out``
+        """
+        if (
+            out.ndim != 4
+            or out.shape[0] == 0
+            or out.shape[-1] != 3
+            or out.dtype != np.float32
+            or not out.flags.c_contiguous
+        ):
+            raise ValueError(
+                "out must be a non-empty C-contiguous float32 array of shape "
+                "(N, H, W, 3)"
+            )
+
+        std_array = np.asarray(std, np.float32)
+        if std_array.shape != (3,) or np.any(std_array == 0):
+            raise ValueError("std must have three non-zero values")
+        mean_array = np.asarray(mean, np.float32)
+        if mean_array.shape != (3,):
+            raise ValueError("mean must have three values")
+
+        # (x - mean) / std folded into x * scale + shift, both applied in place
+        scale = 1 / std_array
+        shift = -mean_array * scale
+
+        # One raw buffer is enough: each frame is normalized into ``out``
+        # before the generator resumes and the next frame is read
+        frames = cls.extract_frames(
+            video_path,
+            fps=fps,
+            start_time=start_time,
+            end_time=end_time,
+            resolution=resolution,
+            skip_validation=skip_validation,
+            timeout=timeout,
+            threads=threads,
+            hwaccel=hwaccel,
+            ring_size=1,
         )
+        for frame_index, frame in enumerate(frames):
+            if frame.shape != out.shape[1:]:
+                frames.close()
+                raise ValueError(
+                    f"out frames must have shape {frame.shape}, got {out.shape[1:]}"
+                )
+
+            target = out[frame_index % len(out)]
+            np.multiply(frame, scale, out=target)
+            np.add(target, shift, out=target)
+            yield target
+
+    @classmethod
+    def extract_frame_tiles(
+        cls,
+        video_path: str | Path,
+        tile_rows: int = 64,
+        fps: float | None = None,
+        start_time: float | None = None,
+        end_time: float | None = None,
+        resolution: tuple[int, int] | None = None,
+        *,
+        skip_validation: bool = False,
+        timeout: int = 10,
+        threads: int = 0,
+        hwaccel: str | None = None,
+    ) -> Iterator[tuple[int, int, np.ndarray]]:
+        """
+        Extract frames as horizontal strips of ``tile_rows`` rows.
+
+        Each frame is decoded into one reused buffer and yielded strip by
+        strip, top to bottom; the last strip of a frame may be shorter. At
+        1080p a 64-row strip is about 360 KB, small enough to stay in L2, so
+        callers that run all their per-pixel steps on a strip in place before
+        moving on read each pixel from DRAM once instead of once per step.
+        Strips are views into the buffer and are overwritten by the next
+        frame.
 
-        stream = (
-            cmd.build_stream()
-            .output("pipe:", format="rawvideo", pix_fmt="rgb24")
-            .overwrite_output()
+        Args:
+            video_path: Path to video file
+            tile_rows: Rows per strip
+            fps: Frames per second to extract
+            start_time: Start time in seconds
+            end_time: End time in seconds
+            resolution: Optional output resolution (width, height)
+            skip_validation: Skip checking that the file exists
+            timeout: Timeout in seconds for probing and process shutdown
+            threads: Decoder threads (0 lets FFmpeg decide)
+            hwaccel: Hardware decode API
+
+        Yields:
+            (frame index, first row, strip) tuples
+        """
+        if tile_rows <= 0:
+            raise ValueError("tile_rows must be positive")
+
+        frames = cls.extract_frames(
+            video_path,
+            fps=fps,
+            start_time=start_time,
+            end_time=end_time,
+            resolution=resolution,
+            skip_validation=skip_validation,
+            timeout=timeout,
+            threads=threads,
+            hwaccel=hwaccel,
+            ring_size=1,
         )
+        for frame_index, frame in enumerate(frames):
+            for top in range(0, frame.shape[0], tile_rows):
+                yield frame_index, top, frame[top : top + tile_rows]
+
+    @staticmethod
+    def _pipe_frames(
+        cmd: FFmpegCommand,
+        timeout: int,
+        next_buffer: Callable[[int], np.ndarray],
+    ) -> Iterator[np.ndarray]:
+        """
+        Run the command and read each raw frame into ``next_buffer(i)``.
+
+        FFmpeg is started before the first buffer is requested, so the
+        provider may do setup work (e.g. probing) while FFmpeg starts up.
+        stderr is drained concurrently and its tail reported on failure.
+        """
+        # The argv is compiled from a validated FFmpegCommand and run
+        # without a shell
+        try:
+            process = subprocess.Popen(  # noqa: S603
+                cmd.compile_args(), stdout=subprocess.PIPE, stderr=subprocess.PIPE
+            )
+        except OSError as e:
+            raise FFmpegError(f"Failed to start FFmpeg: {e}") from e
+        stdout = process.stdout
+        # A piped stdout with default buffering is a BufferedReader, which
+        # provides readinto
+        if not isinstance(stdout, io.BufferedReader):
+            process.kill()
+            process.wait()
+            raise FFmpegError("FFmpeg stdout is not a buffered pipe")
+        set_pipe_size(stdout)
+        stderr_thread, stderr_tail = _drain_stderr(process)
 
         try:
-            process = stream.run_async(pipe_stdout=True, pipe_stderr=True)
+            frame_index = 0
+            unreported = 0
 
-            # Set up progress bar
-            with tqdm(desc="Extracting frames", unit="frame") as pbar:
+            # Set up progress bar; updates are batched so the per-frame cost
+            # is a counter increment rather than a tqdm lock and clock check
+            with tqdm(
+                desc="Extracting frames",
+                unit="frame",
+                miniters=PROGRESS_BATCH,
+                mininterval=0.1,
+            ) as pbar:
                 while True:
-                    try:
-                        in_bytes = process.stdout.read(width * height * 3)
-                        if not in_bytes:
-                            break
-
-                        frame = np.frombuffer(in_bytes, np.uint8).reshape(
-                            (height, width, 3)
-                        )
-                        pbar.update(1)
-                        yield frame
-
-                    except Exception as e:
-                        process.stdout.close()
-                        process.stderr.close()
-                        process.terminate()
-                        raise FFmpegError(f"Frame extraction failed: {str(e)}")
+                    frame = next_buffer(frame_index)
+                    # Read straight into the frame's memory, no bytes copy
+                    if stdout.readinto(_byte_view(frame)) < frame.nbytes:
+                        break
+
+                    frame_index += 1
+                    unreported += 1
+                    if unreported == PROGRESS_BATCH:
+                        pbar.update(unreported)
+                        unreported = 0
+                    yield frame
+
+                pbar.update(unreported)
 
             process.wait(timeout=timeout)
             if process.returncode != 0:
-                error_msg = (
-                    process.stderr.read().decode()
-                    if process.stderr
-                    else "Unknown error"
+                stderr_thread.join()
+                error_msg = b"".join(stderr_tail).decode(errors="replace")
+                raise FFmpegError(
+                    f"FFmpeg process failed: {error_msg or 'Unknown error'}"
                 )
-                raise FFmpegError(f"FFmpeg process failed: {error_msg}")
 
+        except FFmpegError:
+            raise
+        except subprocess.TimeoutExpired as e:
+            raise FFmpegTimeoutError(
+                f"FFmpeg did not exit within {timeout}s after its output ended"
+            ) from e
         except Exception as e:
-            raise FFmpegError(f"Frame extraction failed: {str(e)}")
+            raise FFmpegError(f"Frame extraction failed: {e}") from e
 
         finally:
-            try:
-                process.stdout.close()
-                process.stderr.close()
-                if process.poll() is None:
-                    process.terminate()
-                    try:
-                        process.wait(timeout=1)
-                    except Exception:
-                        process.kill()
-            except Exception:
-                pass
+            _stop_process(process, stderr_thread)
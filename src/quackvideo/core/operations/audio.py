@@ -1,13 +1,14 @@
 # src/quackvideo/core/operations/audio.py
 from __future__ import annotations
 
-import hashlib
 from enum import Enum
 from pathlib import Path
 
 import ffmpeg
 from pydantic import BaseModel
 
+from quackvideo.core.utils import probe_media
+
 from .base import FFmpegOperation, FFmpegOperationError
 from .models import AudioConfig, MediaType, ProcessingMetadata
 
@@ -54,16 +55,12 @@ class AudioProcessor(FFmpegOperation[AudioConfig, AudioOperationResult]):
 
     def _calculate_file_hash(self, file_path: Path) -> str:
         """Calculate SHA-256 hash of an audio file."""
-        sha256_hash = hashlib.sha256()
-        with file_path.open("rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
+        return self._hash_file(file_path)
 
     def _get_audio_info(self, file_path: Path) -> dict:
         """Get audio file information using ffprobe."""
         try:
-            probe = ffmpeg.probe(str(file_path))
+            probe = probe_media(file_path)
             audio_info = next(
                 stream for stream in probe["streams"] if stream["codec_type"] == "audio"
             )
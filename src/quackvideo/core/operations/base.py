@@ -1,9 +1,15 @@
 # src/quackvideo/core/operations/base.py
 from __future__ import annotations
 
+import hashlib
 import logging
+import mmap
+import os
+import threading
 import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Generic, TypeVar
 from urllib.parse import quote
@@ -22,6 +28,29 @@ from ..operations.models import (
 T = TypeVar("T", bound=FFmpegBaseConfig)
 R = TypeVar("R", bound=BaseModel)  # For operation results
 
+# Minimum seconds between non-forced metadata writes
+METADATA_FLUSH_INTERVAL = 1.0
+
+# Maximum number of file digests memoized per operation
+HASH_CACHE_SIZE = 4096
+
+# Keys of FFmpeg's -progress report, filtered out of captured stderr
+_PROGRESS_KEYS = frozenset(
+    {
+        b"frame",
+        b"fps",
+        b"bitrate",
+        b"total_size",
+        b"out_time_us",
+        b"out_time_ms",
+        b"out_time",
+        b"dup_frames",
+        b"drop_frames",
+        b"speed",
+        b"progress",
+    }
+)
+
 
 class FFmpegOperationError(Exception):
     """Base exception for FFmpeg operation errors."""
@@ -57,6 +86,12 @@ class FFmpegOperation(ABC, Generic[T, R]):
         self.config = config
         self.episode_dir = Path(episode_dir)
         self.logger = logger or self._setup_logger()
+        self._metadata_flushed_at = 0.0
+
+        # LRU of digests keyed on (path, algo, size, mtime_ns); rewriting a
+        # file changes its mtime, so stale entries are never hit
+        self._hash_cache: OrderedDict[tuple[str, str, int, int], str] = OrderedDict()
+        self._hash_cache_lock = threading.Lock()
 
         # Ensure episode directory exists
         self.episode_dir.mkdir(parents=True, exist_ok=True)
@@ -80,10 +115,93 @@ class FFmpegOperation(ABC, Generic[T, R]):
 
         return logger
 
-    def _create_metadata_file(self, metadata: ProcessingMetadata) -> None:
-        """Create or update metadata file for the operation."""
+    def _hash_file(
+        self, file_path: Path, algo: str = "sha256", use_cache: bool = True
+    ) -> str:
+        """
+        Hash a file in a single native pass.
+
+        On POSIX the file is memory-mapped and hashed with one update call;
+        elsewhere hashlib.file_digest reads large blocks into a single buffer.
+        Either way hashing runs in C with the GIL released, using OpenSSL's
+        SHA extensions where the CPU has them. Digests are cached per file
+        until its size or mtime changes, in a bounded per-operation LRU.
+
+        Args:
+            file_path: Path to file
+            algo: hashlib algorithm name
+            use_cache: Serve and record digests in the cache; integrity
+                checks pass False so the bytes are always reread
+
+        Returns:
+            Hex digest of the file contents
+        """
+        stat = file_path.stat()
+        key = (str(file_path.resolve()), algo, stat.st_size, stat.st_mtime_ns)
+        if use_cache:
+            with self._hash_cache_lock:
+                cached = self._hash_cache.get(key)
+                if cached is not None:
+                    self._hash_cache.move_to_end(key)
+                    return cached
+
+        with file_path.open("rb", buffering=0) as f:
+            if os.name == "posix" and stat.st_size > 0:
+                # Hash the whole mapping in one update: the kernel handles
+                # readahead and OpenSSL runs over one contiguous buffer
+                with mmap.mmap(f.fileno(), 0, prot=mmap.PROT_READ) as mapped:
+                    if hasattr(mmap, "MADV_SEQUENTIAL"):
+                        # Aggressive readahead: fewer, larger page-in faults
+                        mapped.madvise(mmap.MADV_SEQUENTIAL)
+                    digest = hashlib.new(algo, mapped).hexdigest()
+            else:
+                digest = hashlib.file_digest(f, algo).hexdigest()
+
+        if use_cache:
+            with self._hash_cache_lock:
+                self._hash_cache[key] = digest
+                while len(self._hash_cache) > HASH_CACHE_SIZE:
+                    self._hash_cache.popitem(last=False)
+        return digest
+
+    def _create_metadata_file(
+        self, metadata: ProcessingMetadata, indent: int | None = 2
+    ) -> None:
+        """
+        Create or update metadata file for the operation.
+
+        The file is written to a temporary name and moved into place, so an
+        interrupted write never leaves a truncated file for resume to read.
+
+        Args:
+            metadata: Metadata to write
+            indent: JSON indentation; None writes compact JSON
+        """
         metadata_file = self.episode_dir / ".metadata.json"
-        metadata_file.write_text(metadata.model_dump_json(indent=2))
+        tmp_file = metadata_file.with_name(metadata_file.name + ".tmp")
+        tmp_file.write_text(metadata.model_dump_json(indent=indent))
+        os.replace(tmp_file, metadata_file)
+        self._metadata_flushed_at = time.monotonic()
+
+    def _flush_metadata(
+        self, metadata: ProcessingMetadata, force: bool = False
+    ) -> None:
+        """
+        Write metadata that has changed, at most once per flush interval.
+
+        Progress updates call this freely; serializing is skipped until
+        METADATA_FLUSH_INTERVAL has passed since the last write, and those
+        checkpoints are written as compact JSON. Status transitions pass
+        ``force`` to write immediately in the readable indented form.
+
+        Args:
+            metadata: Metadata to write
+            force: Write regardless of when the last write happened
+        """
+        if force:
+            self._create_metadata_file(metadata)
+        elif time.monotonic() - self._metadata_flushed_at >= METADATA_FLUSH_INTERVAL:
+            self._create_metadata_file(metadata, indent=None)
 
     @abstractmethod
     def _build_ffmpeg_stream(self, input_path: Path) -> ffmpeg.Stream:
@@ -103,15 +221,20 @@ class FFmpegOperation(ABC, Generic[T, R]):
         """
         pass
 
+    @cached_property
+    def _format_sets(self) -> dict[str, frozenset[str]]:
+        """Compatible suffixes per media type, built once per operation."""
+        return {
+            media_type: frozenset(suffix.lower() for suffix in suffixes)
+            for media_type, suffixes in self.config.compatible_formats.items()
+        }
+
     def _validate_input_file(self, input_path: Path, media_type: MediaType) -> None:
         """Validate input file exists and has correct format."""
         if not input_path.exists():
             raise FileNotFoundError(f"Input file not found: {input_path}")
 
-        if (
-            input_path.suffix.lower()
-            not in self.config.compatible_formats[media_type.value]
-        ):
+        if input_path.suffix.lower() not in self._format_sets[media_type.value]:
             raise ValueError(
                 f"Unsupported file format for {media_type.value}: {input_path.suffix}"
             )
@@ -154,7 +277,7 @@ class FFmpegOperation(ABC, Generic[T, R]):
         self.logger.info("Input file validation passed")
 
         metadata = ProcessingMetadata()
-        self._create_metadata_file(metadata)
+        self._flush_metadata(metadata, force=True)
 
         output_metadata = OutputMetadata(
             original_filename=input_path.name,
@@ -181,20 +304,9 @@ class FFmpegOperation(ABC, Generic[T, R]):
                 with tqdm(
                     total=self._total_frames, desc=progress_desc, unit="frames"
                 ) as pbar:
-
-                    def on_progress(progress: dict[str, Any]) -> None:
-                        if "frame" in progress:
-                            pbar.update(1)
-                            pbar.refresh()
-
                     # Run FFmpeg operation
                     try:
-                        result = ffmpeg.run(
-                            stream,
-                            capture_stdout=True,
-                            capture_stderr=True,
-                            overwrite_output=True,
-                        )
+                        result = self._run_with_progress(stream, pbar)
                         self.logger.info("FFmpeg operation completed successfully")
 
                     except ffmpeg.Error as e:
@@ -207,7 +319,7 @@ class FFmpegOperation(ABC, Generic[T, R]):
 
                 # Process and return results
                 metadata.status = "completed"
-                self._create_metadata_file(metadata)
+                self._flush_metadata(metadata, force=True)
                 return self._process_output(result, metadata)
 
             except ffmpeg.Error as e:
@@ -235,11 +347,67 @@ class FFmpegOperation(ABC, Generic[T, R]):
                 break
 
         metadata.status = "failed"
-        self._create_metadata_file(metadata)
+        self._flush_metadata(metadata, force=True)
         raise last_error or FFmpegOperationError(
             "Operation failed with no specific error"
         )
 
+    def _run_with_progress(
+        self, stream: ffmpeg.Stream, pbar: tqdm
+    ) -> tuple[bytes, bytes]:
+        """
+        Run an FFmpeg stream, advancing the progress bar from its reports.
+
+        FFmpeg writes machine-readable ``-progress`` blocks to stderr and the
+        bar follows their ``frame=`` counts, so progress costs nothing until
+        FFmpeg reports it. stdout is collected on a background thread so a
+        stream that outputs to ``pipe:`` cannot block on a full pipe.
+
+        Args:
+            stream: FFmpeg output stream to run
+            pbar: Progress bar to advance
+
+        Returns:
+            Captured (stdout, stderr); progress lines are left out of stderr
+
+        Raises:
+            ffmpeg.Error: If FFmpeg exits with a non-zero status
+        """
+        process = ffmpeg.run_async(
+            stream.global_args("-progress", "pipe:2", "-nostats"),
+            pipe_stdout=True,
+            pipe_stderr=True,
+            overwrite_output=True,
+        )
+
+        stdout_chunks: list[bytes] = []
+        stdout_thread = threading.Thread(
+            target=lambda: stdout_chunks.extend(iter(process.stdout.read1, b"")),
+            daemon=True,
+        )
+        stdout_thread.start()
+
+        stderr_lines = []
+        reported = 0
+        for line in process.stderr:
+            key, sep, value = line.partition(b"=")
+            if sep and key == b"frame" and value.strip().isdigit():
+                frame = int(value)
+                if frame > reported:
+                    pbar.update(frame - reported)
+                    reported = frame
+            elif not sep or (
+                key not in _PROGRESS_KEYS and not key.startswith(b"stream_")
+            ):
+                stderr_lines.append(line)
+
+        process.wait()
+        stdout_thread.join()
+        stdout, stderr = b"".join(stdout_chunks), b"".join(stderr_lines)
+        if process.returncode != 0:
+            raise ffmpeg.Error("ffmpeg", stdout, stderr)
+        return stdout, stderr
+
     def cleanup(self) -> None:
         """Clean up any temporary files or resources."""
         pass
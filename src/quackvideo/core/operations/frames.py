@@ -2,14 +2,26 @@
 from __future__ import annotations
 
 import hashlib
-import time
+import asyncio
+import io
+import logging
+import os
+import subprocess
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
 import math
+from typing import TypeVar
 
 import ffmpeg
+import numpy as np
 from tqdm import tqdm
 from pydantic import BaseModel
 
+from quackvideo.core.ffmpeg import FFmpegWrapper
+from quackvideo.core.utils import probe_media
+
 from .base import FFmpegOperation, FFmpegOperationError
 from .models import FrameExtractionConfig, MediaType, ProcessingMetadata
 
@@ -19,7 +31,166 @@ class FrameExtractionResult(BaseModel):
 
     total_frames: int
     output_directory: Path
-    frame_files: dict[str, str]  # filename -> hash
+    frame_files: dict[str, str]  # filename -> "algo:hexdigest"
+
+
+class _PipeReader:
+    """Buffered reader that splits a byte stream on exact sizes or markers."""
+
+    def __init__(self, pipe: io.BufferedReader, chunk_size: int = 1 << 20) -> None:
+        self._pipe = pipe
+        self._chunk_size = chunk_size
+        self._buffer = bytearray()
+
+    def _fill(self) -> bool:
+        chunk = self._pipe.read1(self._chunk_size)
+        self._buffer += chunk
+        return bool(chunk)
+
+    def _take(self, size: int) -> bytes:
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+    def read_exact(self, size: int) -> bytes | None:
+        """Read exactly ``size`` bytes, or None if the stream ends first."""
+        while len(self._buffer) < size:
+            if not self._fill():
+                return None
+        return self._take(size)
+
+    def read_entropy_coded(self) -> bytes | None:
+        """
+        Read JPEG entropy-coded data up to, but excluding, the next marker.
+
+        Inside scan data 0xFF is either byte-stuffed (FF00), a restart
+        marker (FFD0-FFD7) or fill before a marker (FFFF); any other
+        0xFFxx ends the scan. Returns None if the stream ends first.
+        """
+        search_from = 0
+        while True:
+            index = self._buffer.find(b"\xff", search_from)
+            if index == -1 or index + 1 == len(self._buffer):
+                search_from = len(self._buffer) if index == -1 else index
+                if not self._fill():
+                    return None
+                continue
+            following = self._buffer[index + 1]
+            if following in (0x00, 0xFF) or 0xD0 <= following <= 0xD7:
+                search_from = index + 1
+                continue
+            return self._take(index)
+
+
+def _read_png(reader: _PipeReader) -> bytes | None:
+    """Read one PNG image: the signature, then chunks up to IEND."""
+    if (signature := reader.read_exact(8)) is None:
+        return None
+    parts = [signature]
+    while (header := reader.read_exact(8)) is not None:
+        # Chunk length covers the data only; the CRC adds four bytes
+        if (body := reader.read_exact(int.from_bytes(header[:4]) + 4)) is None:
+            return None
+        parts += (header, body)
+        if header[4:] == b"IEND":
+            return b"".join(parts)
+    return None
+
+
+def _read_jpeg(reader: _PipeReader) -> bytes | None:
+    """
+    Read one JPEG image: marker segments and scans up to EOI.
+
+    Progressive images interleave several scans with table segments, so
+    segments are walked until EOI rather than stopping after the first scan.
+    """
+    if (soi := reader.read_exact(2)) is None:
+        return None
+    parts = [soi]
+    while (marker := reader.read_exact(2)) is not None:
+        parts.append(marker)
+        if marker[1] == 0xD9:
+            return b"".join(parts)
+        # Segment lengths include their own two bytes but not the marker's
+        if (length := reader.read_exact(2)) is None:
+            return None
+        if (body := reader.read_exact(int.from_bytes(length) - 2)) is None:
+            return None
+        parts += (length, body)
+        if marker[1] == 0xDA:
+            if (scan := reader.read_entropy_coded()) is None:
+                return None
+            parts.append(scan)
+    return None
+
+
+def _parse_fps(fps: str) -> float:
+    """Parse an fps value given as a number or a fraction like '1/5'."""
+    if "/" in fps:
+        num, den = map(int, fps.split("/"))
+        return num / den
+    return float(fps)
+
+
+def _video_stream(video_path: Path) -> dict:
+    """Get the first video stream of a file from its cached probe."""
+    probe = probe_media(video_path)
+    return next(s for s in probe["streams"] if s["codec_type"] == "video")
+
+
+def _rgb24_frame_size(video_path: Path) -> int:
+    """Get the byte size of one full-resolution RGB24 frame of a video."""
+    video_info = _video_stream(video_path)
+    return int(video_info["width"]) * int(video_info["height"]) * 3
+
+
+def _stat_key(path: Path) -> tuple[int, int]:
+    """Get the (size, mtime_ns) fingerprint of a file."""
+    stat = path.stat()
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _read_webp(reader: _PipeReader) -> bytes | None:
+    """Read one WebP image: the RIFF header gives the size of the rest."""
+    if (header := reader.read_exact(8)) is None:
+        return None
+    if (body := reader.read_exact(int.from_bytes(header[4:], "little"))) is None:
+        return None
+    return header + body
+
+
+R = TypeVar("R")
+
+# Below this many frames, hashing serially is cheaper than starting a pool
+PARALLEL_HASH_MIN_FRAMES = 8
+
+# Upper bound on hashing threads, however many CPUs there are
+HASH_WORKERS_MAX = 32
+
+# Algorithm assumed for stored hashes written before they were tagged
+_LEGACY_HASH_ALGO = "sha256"
+
+
+def _tag_digest(algo: str, digest: str) -> str:
+    """Prefix a hex digest with its algorithm, e.g. 'sha256:ab12...'."""
+    return f"{algo}:{digest}"
+
+
+def _normalize_digest(stored: str) -> str:
+    """Tag a stored frame hash that predates algorithm tagging."""
+    return stored if ":" in stored else _tag_digest(_LEGACY_HASH_ALGO, stored)
+
+
+# Readers that split FFmpeg's image2pipe output into single images
+_IMAGE_READERS: dict[str, Callable[[_PipeReader], bytes | None]] = {
+    "png": _read_png,
+    "jpg": _read_jpeg,
+    "jpeg": _read_jpeg,
+    "webp": _read_webp,
+}
+
+# File extensions for formats not named after their extension
+_FRAME_EXTENSIONS = {"rawvideo": "raw"}
 
 
 class FrameExtractor(FFmpegOperation[FrameExtractionConfig, FrameExtractionResult]):
@@ -38,72 +209,147 @@ class FrameExtractor(FFmpegOperation[FrameExtractionConfig, FrameExtractionResul
             episode_dir: Directory for episode files
         """
         super().__init__(config, episode_dir)
-        self._frames_processed = 0
 
     def _create_output_directory(self, video_path: Path) -> Path:
         """Create directory for extracted frames."""
         # Safely create output directory handling spaces
         output_dir = self.episode_dir / "frames" / video_path.stem
         output_dir.mkdir(parents=True, exist_ok=True)
-        print(f"Created output directory: {output_dir}")
+        self.logger.debug("Created output directory: %s", output_dir)
         return output_dir
 
-    def _calculate_frame_hash(self, frame_path: Path) -> str:
-        """Calculate SHA-256 hash of a frame file."""
-        sha256_hash = hashlib.sha256()
-        with frame_path.open("rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
+    def _list_frames(self, output_dir: Path) -> list[Path]:
+        """
+        List frame files in the configured format, sorted by name.
+
+        A single scandir pass filters on entry names without the per-entry
+        pattern matching and path building of Path.glob.
+        """
+        suffix = self._frame_suffix()
+        with os.scandir(output_dir) as entries:
+            return sorted(
+                Path(entry.path)
+                for entry in entries
+                if entry.name.startswith("frame_")
+                and entry.name.endswith(suffix)
+                and entry.is_file()
+            )
+
+    def _frame_suffix(self) -> str:
+        """Get the file suffix of frames in the configured format."""
+        return "." + _FRAME_EXTENSIONS.get(self.config.format, self.config.format)
+
+    def _calculate_frame_hash(
+        self, frame_path: Path, algo: str | None = None, use_cache: bool = True
+    ) -> str:
+        """
+        Calculate the tagged hash of a frame file.
+
+        Args:
+            frame_path: Path to frame file
+            algo: hashlib algorithm; defaults to the configured one
+            use_cache: Allow a cached digest; False rereads the file
+
+        Returns:
+            Hash as "algo:hexdigest"
+        """
+        algo = algo or self.config.hash_algo
+        return _tag_digest(algo, self._hash_file(frame_path, algo, use_cache))
 
     def _verify_existing_frames(
-        self, output_dir: Path, metadata: ProcessingMetadata
+        self, output_dir: Path, metadata: ProcessingMetadata, deep: bool = False
     ) -> dict[str, str]:
         """
         Verify integrity of existing frames.
 
+        A frame whose size and mtime still match those recorded when it was
+        hashed keeps its stored hash without being reread; only changed
+        frames, or all frames with ``deep``, are hashed again.
+
+        Args:
+            output_dir: Directory holding the frames
+            metadata: Metadata with the stored hashes and file stats
+            deep: Rehash every frame regardless of its stats
+
         Returns:
             Dict mapping filename to hash for valid frames
         """
         valid_frames = {}
-        existing_frames = list(output_dir.glob(f"frame_*.{self.config.format}"))
+        existing_frames = self._list_frames(output_dir)
 
         if not existing_frames:
             return {}
 
         self.logger.info(f"Found {len(existing_frames)} existing frames")
 
-        for frame_path in existing_frames:
+        def verify(frame_path: Path) -> str | None:
+            """Get the frame's hash if it matches the stored one."""
             try:
-                current_hash = self._calculate_frame_hash(frame_path)
                 stored_hash = metadata.frame_integrity.get(frame_path.name)
-
-                if stored_hash and current_hash == stored_hash:
-                    valid_frames[frame_path.name] = current_hash
-                else:
-                    self.logger.warning(
-                        f"Frame integrity check failed for {frame_path.name}, "
-                        "will re-extract"
-                    )
-                    frame_path.unlink()
+                if not stored_hash:
+                    return None
+                stored_hash = _normalize_digest(stored_hash)
+                stored_stat = metadata.frame_stats.get(frame_path.name)
+                if not deep and stored_stat == _stat_key(frame_path):
+                    return stored_hash
+                # Verify with the algorithm the hash was stored with, so
+                # changing hash_algo does not invalidate existing frames;
+                # the digest cache is bypassed so the bytes are reread
+                current_hash = self._calculate_frame_hash(
+                    frame_path, stored_hash.partition(":")[0], use_cache=False
+                )
+                return current_hash if current_hash == stored_hash else None
             except Exception as e:
                 self.logger.error(f"Error verifying frame {frame_path}: {e}")
+                return None
+
+        for frame_path, current_hash in zip(
+            existing_frames, self._map_frames(verify, existing_frames), strict=True
+        ):
+            if current_hash is not None:
+                valid_frames[frame_path.name] = current_hash
+            else:
+                self.logger.warning(
+                    f"Frame integrity check failed for {frame_path.name}, "
+                    "will re-extract"
+                )
                 frame_path.unlink()
 
         return valid_frames
 
-    def _build_ffmpeg_stream(self, input_path: Path) -> ffmpeg.Stream:
-        """Build FFmpeg stream for frame extraction."""
+    @staticmethod
+    def _map_frames(func: Callable[[Path], R], frame_paths: list[Path]) -> list[R]:
+        """
+        Apply a hashing function to frame files, in order.
+
+        hashlib releases the GIL while hashing, so larger sets are spread
+        over a thread pool. The pool has a few more workers than CPUs so
+        that reads of upcoming files are in flight while others are hashed,
+        keeping the disk queue busy on fast storage.
+        """
+        if len(frame_paths) <= PARALLEL_HASH_MIN_FRAMES:
+            return [func(frame_path) for frame_path in frame_paths]
+        max_workers = min(HASH_WORKERS_MAX, (os.cpu_count() or 1) + 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(func, frame_paths))
+
+    def _prepare_input(self, input_path: Path) -> dict[str, str]:
+        """
+        Probe the input, set the expected frame count and output directory.
+
+        Returns:
+            Decoder options for the input
+        """
         try:
             input_path = input_path.absolute()
-            print(f"Processing input path: {input_path}")
+            self.logger.debug("Processing input path: %s", input_path)
 
             if not input_path.exists():
                 raise FileNotFoundError(f"Input file not found: {input_path}")
 
-            # Get video info for frame count first
-            probe = ffmpeg.probe(str(input_path))
-            video_info = next(s for s in probe["streams"] if s["codec_type"] == "video")
+            # Get video info for frame count first; the probe is cached per
+            # file version, so retries and repeated runs reuse it
+            video_info = _video_stream(input_path)
 
             # Get the original video fps and duration
             duration = float(video_info["duration"])
@@ -115,22 +361,23 @@ class FrameExtractor(FFmpegOperation[FrameExtractionConfig, FrameExtractionResul
                 num, den = map(int, video_info["avg_frame_rate"].split("/"))
                 original_fps = num / den if den != 0 else 0
 
-            print(f"Original video: duration={duration}s, fps={original_fps}")
+            self.logger.debug(
+                "Original video: duration=%ss, fps=%s", duration, original_fps
+            )
 
             # Calculate target fps and total frames
-            if "/" in self.config.fps:
-                num, den = map(int, self.config.fps.split("/"))
-                target_fps = num / den
-            else:
-                target_fps = float(self.config.fps)
+            target_fps = _parse_fps(self.config.fps)
 
             # Use ceil to ensure we get all frames
             self._total_frames = math.ceil(duration * target_fps)
             total_original_frames = math.ceil(duration * original_fps)
 
-            print(
-                f"Frame extraction: target_fps={target_fps}, total_frames={self._total_frames} "
-                f"(from {total_original_frames} original frames)"
+            self.logger.debug(
+                "Frame extraction: target_fps=%s, total_frames=%s "
+                "(from %s original frames)",
+                target_fps,
+                self._total_frames,
+                total_original_frames,
             )
 
             # Create a frames directory without spaces
@@ -138,50 +385,124 @@ class FrameExtractor(FFmpegOperation[FrameExtractionConfig, FrameExtractionResul
                 " ", "_"
             )
             if safe_output_dir != self._output_dir:
-                print(f"Creating safe output directory: {safe_output_dir}")
+                self.logger.debug("Creating safe output directory: %s", safe_output_dir)
                 if self._output_dir.exists():
                     self._output_dir.rename(safe_output_dir)
                 self._output_dir = safe_output_dir
 
-            # Build the ffmpeg command with progress
-            stream = ffmpeg.input(str(input_path)).output(
-                str(self._output_dir / f"frame_%04d.{self.config.format}"),
-                vf=f"fps={self.config.fps}",
-                progress="-",  # Enable progress output
-                **self._get_output_options(),
-            )
-
-            print(f"FFmpeg command: {' '.join(ffmpeg.compile(stream))}")
-            return stream
+            input_kwargs = self._decoder_kwargs()
+            # When sampling below 1 fps, optionally let the decoder skip
+            # non-reference frames; the fps filter then picks among the
+            # decoded ones
+            if self.config.skip_nonref and target_fps < 1:
+                input_kwargs["skip_frame"] = "noref"
+            return input_kwargs
 
         except Exception as e:
-            print(f"Error in _build_ffmpeg_stream: {str(e)}")
+            self.logger.error(f"Error in _prepare_input: {str(e)}")
             if hasattr(e, "stderr"):
-                print(
+                self.logger.error(
                     f"FFmpeg stderr: {e.stderr.decode() if e.stderr else 'No stderr'}"
                 )
             raise
 
-    def _get_output_options(self) -> dict:
-        """Get output options based on format."""
-        options = {"y": None}  # Add -y to overwrite files
+    def _decoder_kwargs(self) -> dict[str, str]:
+        """
+        Decoder options shared by every extraction path.
+
+        With ``hwaccel`` set, decoding runs on the GPU and FFmpeg downloads
+        each frame to system memory before the fps filter and encoder, so
+        the rest of the command is unchanged.
+        """
+        if self.config.hwaccel is None:
+            return {}
+        return {"hwaccel": self.config.hwaccel}
+
+    def _build_ffmpeg_stream(self, input_path: Path) -> ffmpeg.Stream:
+        """Build FFmpeg stream that writes frames as numbered files."""
+        input_kwargs = self._prepare_input(input_path)
+
+        # Progress is reported by execute_with_retry via -progress
+        stream = ffmpeg.input(str(input_path.absolute()), **input_kwargs).output(
+            str(self._output_dir / f"frame_%04d{self._frame_suffix()}"),
+            format="image2",
+            vf=f"fps={self.config.fps}",
+            **self._encode_params,
+        )
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("FFmpeg command: %s", " ".join(ffmpeg.compile(stream)))
+        return stream
+
+    def _build_argv(self, input_path: Path) -> list[str]:
+        """
+        Build the FFmpeg argv that streams encoded frames to stdout.
+
+        The command is a fixed shape, so it is assembled directly instead
+        of through an ffmpeg-python graph.
+        """
+        input_kwargs = self._prepare_input(input_path)
+
+        # stdout carries the images, so nothing else may write to it; stderr
+        # is only read after exit, so keep it short
+        argv = ["ffmpeg", "-hide_banner", "-loglevel", "error", "-nostats"]
+        for key, value in input_kwargs.items():
+            argv += [f"-{key}", str(value)]
+        argv += [
+            "-i",
+            str(input_path.absolute()),
+            "-vf",
+            f"fps={self.config.fps}",
+            "-f",
+            "image2pipe",
+            *self._encode_args,
+            "pipe:",
+        ]
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("FFmpeg command: %s", " ".join(argv))
+        return argv
+
+    @cached_property
+    def _encode_args(self) -> list[str]:
+        """Encoder options as command-line arguments."""
+        args = []
+        for key, value in self._encode_params.items():
+            args.append(f"-{key}")
+            if value is not None:
+                args.append(str(value))
+        return args
+
+    @cached_property
+    def _encode_params(self) -> dict[str, object]:
+        """
+        Encoder options for the configured format, computed once.
+
+        Quality is mapped onto each encoder's own scale here rather than on
+        every stream build; numbers are passed as ints for FFmpeg to parse.
+        """
+        options: dict[str, object] = {"y": None}  # Add -y to overwrite files
 
         if self.config.format == "png":
             options.update(
                 {
                     "vcodec": "png",
-                    "compression_level": str(
-                        int((100 - self.config.quality) / 100 * 9)
-                    ),
+                    "compression_level": (100 - self.config.quality) * 9 // 100,
                 }
             )
         elif self.config.format in ["jpg", "jpeg"]:
             options.update(
                 {
                     "vcodec": "mjpeg",
-                    "q:v": str(int((100 - self.config.quality) / 100 * 31)),
+                    "q:v": (100 - self.config.quality) * 31 // 100,
                 }
             )
+        elif self.config.format == "webp":
+            # Lossy WebP encodes far faster than PNG at a fraction of the size
+            options.update({"vcodec": "libwebp", "quality": self.config.quality})
+        elif self.config.format == "rawvideo":
+            # No encoding at all: each frame is width * height * 3 RGB bytes
+            options.update({"vcodec": "rawvideo", "pix_fmt": "rgb24"})
 
         return options
 
@@ -189,19 +510,23 @@ class FrameExtractor(FFmpegOperation[FrameExtractionConfig, FrameExtractionResul
         self, result: Any, metadata: ProcessingMetadata
     ) -> FrameExtractionResult:
         """Process extracted frames and update metadata."""
+        frame_paths = self._list_frames(self._output_dir)
         frame_files = {}
-        for frame_path in sorted(
-            self._output_dir.glob(f"frame_*.{self.config.format}")
+        for frame_path, frame_hash in zip(
+            frame_paths,
+            self._map_frames(self._calculate_frame_hash, frame_paths),
+            strict=True,
         ):
-            frame_hash = self._calculate_frame_hash(frame_path)
             frame_files[frame_path.name] = frame_hash
             metadata.frame_integrity[frame_path.name] = frame_hash
+            metadata.frame_stats[frame_path.name] = _stat_key(frame_path)
 
         metadata.total_frames = self._total_frames
         metadata.completed_frames = len(frame_files)
-        metadata.last_processed = max(frame_files.keys(), default=None)
+        # _list_frames returns names in sorted order, so the last is the max
+        metadata.last_processed = frame_paths[-1].name if frame_paths else None
 
-        self._create_metadata_file(metadata)
+        self._flush_metadata(metadata, force=True)
 
         return FrameExtractionResult(
             total_frames=self._total_frames,
@@ -209,116 +534,323 @@ class FrameExtractor(FFmpegOperation[FrameExtractionConfig, FrameExtractionResul
             frame_files=frame_files,
         )
 
+    def _get_image_reader(
+        self, video_path: Path
+    ) -> Callable[[_PipeReader], bytes | None]:
+        """Get the reader that splits piped images in the configured format."""
+        if self.config.format == "rawvideo":
+            # Raw frames carry no header, so their size comes from the probe
+            frame_size = _rgb24_frame_size(video_path)
+            return lambda reader: reader.read_exact(frame_size)
+
+        read_image = _IMAGE_READERS.get(self.config.format)
+        if read_image is None:
+            raise ValueError(
+                f"Unsupported frame format: {self.config.format} "
+                f"(expected one of {sorted({*_IMAGE_READERS, 'rawvideo'})})"
+            )
+        return read_image
+
+    def _hash_image(self, image: bytes) -> str:
+        """Calculate the tagged hash of an encoded image held in memory."""
+        algo = self.config.hash_algo
+        return _tag_digest(algo, hashlib.new(algo, image).hexdigest())
+
+    def _iter_piped_images(
+        self,
+        argv: list[str],
+        read_image: Callable[[_PipeReader], bytes | None],
+    ) -> Iterator[bytes]:
+        """
+        Run an image2pipe FFmpeg command and yield each encoded image.
+
+        Raises:
+            FFmpegOperationError: If FFmpeg exits with a non-zero status
+        """
+        # argv comes from _build_argv or ffmpeg.compile: each option is its
+        # own argument and no shell is involved
+        with subprocess.Popen(  # noqa: S603
+            argv, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        ) as process:
+            stdout, stderr_pipe = process.stdout, process.stderr
+            if not isinstance(stdout, io.BufferedReader) or stderr_pipe is None:
+                process.kill()
+                raise FFmpegOperationError("FFmpeg pipes were not opened")
+            try:
+                reader = _PipeReader(stdout)
+                while (image := read_image(reader)) is not None:
+                    yield image
+                # stderr is limited to errors, so reading it after stdout
+                # ends cannot block FFmpeg
+                stderr = stderr_pipe.read()
+                process.wait()
+            finally:
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
+        # Leaving the with block closed both pipes
+
+        if process.returncode != 0:
+            raise FFmpegOperationError(
+                f"FFmpeg process failed with return code {process.returncode}\n"
+                f"{stderr.decode('utf-8', errors='replace') or 'No error output'}"
+            )
+
+    def extract_specific_frames(
+        self, video_path: Path, frame_indices: Iterable[int]
+    ) -> FrameExtractionResult:
+        """
+        Extract frames by index with a single FFmpeg process.
+
+        A ``select`` filter passes only the requested frames and variable
+        frame rate output keeps FFmpeg from duplicating them, so any number
+        of frames costs one process spawn and one pass over the video.
+        Frames are written to a ``selected`` subdirectory as
+        ``frame_<index>.<format>``, using zero-based source frame indices.
+
+        Args:
+            video_path: Path to video file
+            frame_indices: Zero-based indices of frames to extract
+
+        Returns:
+            FrameExtractionResult with extraction details
+        """
+        video_path = Path(video_path).resolve()
+        if not video_path.exists():
+            raise FileNotFoundError(f"Input file not found: {video_path}")
+
+        indices = sorted(set(frame_indices))
+        if not indices or indices[0] < 0:
+            raise ValueError("frame_indices must be non-empty and non-negative")
+
+        read_image = self._get_image_reader(video_path)
+        output_dir = self._create_output_directory(video_path) / "selected"
+        output_dir.mkdir(exist_ok=True)
+
+        select_expr = "+".join(f"eq(n,{index})" for index in indices)
+        stream = (
+            ffmpeg.input(str(video_path), **self._decoder_kwargs())
+            .filter("select", select_expr)
+            .output(
+                "pipe:",
+                format="image2pipe",
+                vsync="vfr",
+                **self._encode_params,
+            )
+            .global_args("-loglevel", "error", "-nostats")
+        )
+
+        frame_files = {}
+        images = self._iter_piped_images(ffmpeg.compile(stream), read_image)
+        with tqdm(total=len(indices), desc="Extracting frames", unit="frames") as pbar:
+            # FFmpeg emits nothing for indices past the last frame, so fewer
+            # images than indices is expected
+            for index, image in zip(indices, images, strict=False):
+                frame_name = f"frame_{index:04d}{self._frame_suffix()}"
+                (output_dir / frame_name).write_bytes(image)
+                frame_files[frame_name] = self._hash_image(image)
+                pbar.update(1)
+
+        self.logger.info(
+            f"Extracted {len(frame_files)} of {len(indices)} requested frames "
+            f"from {video_path}"
+        )
+        return FrameExtractionResult(
+            total_frames=len(frame_files),
+            output_directory=output_dir,
+            frame_files=frame_files,
+        )
+
+    def iter_frames(self, video_path: Path, ring_size: int = 0) -> Iterator[np.ndarray]:
+        """
+        Stream frames at the configured fps as RGB arrays, skipping files.
+
+        For consumers that work on pixels (e.g. models), this avoids the
+        encode, disk write and decode round-trip of extract_frames. Frames
+        are piped as rawvideo straight into (H, W, 3) uint8 arrays.
+
+        Args:
+            video_path: Path to video file
+            ring_size: Reuse this many preallocated buffers instead of
+                allocating each frame; a frame is then only valid until
+                ``ring_size`` more frames have been read
+
+        Yields:
+            Frames as (H, W, 3) uint8 RGB arrays
+        """
+        video_path = Path(video_path).resolve()
+        if not video_path.exists():
+            raise FileNotFoundError(f"Input file not found: {video_path}")
+
+        target_fps = _parse_fps(self.config.fps)
+        yield from FFmpegWrapper.extract_frames(
+            video_path,
+            fps=target_fps,
+            skip_validation=True,
+            timeout=self.config.timeout,
+            # Same decoder shortcut as extract_frames for sparse sampling
+            skip_frame="noref" if self.config.skip_nonref and target_fps < 1 else None,
+            hwaccel=self.config.hwaccel,
+            ring_size=ring_size,
+        )
+
+    def hash_frames(self, video_path: Path) -> dict[str, str]:
+        """
+        Hash decoded frames in memory without writing any files.
+
+        Frames are piped from FFmpeg as raw RGB24 at the configured fps and
+        hashed straight from the pipe, skipping image encoding and the disk
+        round-trip. Hashes are of pixel data, so they are not comparable to
+        the file hashes stored by extract_frames.
+
+        Args:
+            video_path: Path to video file
+
+        Returns:
+            Dict mapping frame name (frame_0001, ...) to frame hash
+        """
+        video_path = Path(video_path).resolve()
+        if not video_path.exists():
+            raise FileNotFoundError(f"Input file not found: {video_path}")
+
+        frame_size = _rgb24_frame_size(video_path)
+
+        process = (
+            ffmpeg.input(str(video_path), **self._decoder_kwargs())
+            .output(
+                "pipe:",
+                format="rawvideo",
+                pix_fmt="rgb24",
+                vf=f"fps={self.config.fps}",
+            )
+            .global_args("-loglevel", "error")
+            .run_async(pipe_stdout=True, pipe_stderr=True)
+        )
+
+        # Each frame is read into the same buffer and hashed with one update
+        frame_buffer = bytearray(frame_size)
+        frame_view = memoryview(frame_buffer)
+        frame_hashes: dict[str, str] = {}
+        try:
+            while process.stdout.readinto(frame_view) == frame_size:
+                frame_name = f"frame_{len(frame_hashes) + 1:04d}"
+                frame_hashes[frame_name] = hashlib.new(
+                    self.config.hash_algo, frame_view
+                ).hexdigest()
+
+            process.wait()
+            if process.returncode != 0:
+                stderr = process.stderr.read().decode("utf-8")
+                raise FFmpegOperationError(
+                    f"FFmpeg process failed with return code {process.returncode}",
+                    ffmpeg_error=stderr,
+                )
+        finally:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+
+        self.logger.info(f"Hashed {len(frame_hashes)} frames from {video_path}")
+        return frame_hashes
+
     def extract_frames(
         self,
         video_path: Path,
         resume: bool = True,
+        save_frames: bool = True,
+        deep_verify: bool = False,
     ) -> FrameExtractionResult:
         """
         Extract frames from a video file.
 
+        A single FFmpeg process encodes the sampled frames and streams them
+        over stdout; each image is hashed from memory and written once, so
+        frames are never read back from disk to be hashed. On resume, frames
+        whose stored hash still matches are not rewritten.
+
         Args:
             video_path: Path to video file
             resume: Whether to resume from previous extraction
+            save_frames: Write frame files; when False only hashes are kept
+            deep_verify: On resume, rehash every existing frame instead of
+                trusting frames whose size and mtime are unchanged
 
         Returns:
             FrameExtractionResult with extraction details
         """
-        """Extract frames from a video file."""
-        print(f"Starting frame extraction for: {video_path}")
+        self.logger.debug("Starting frame extraction for: %s", video_path)
         video_path = Path(video_path).resolve()
+        read_image = self._get_image_reader(video_path)
 
         try:
             self._output_dir = self._create_output_directory(video_path)
-            print(f"Output directory: {self._output_dir}")
+            self.logger.debug("Output directory: %s", self._output_dir)
 
             # Load existing metadata if resuming
             metadata_file = self.episode_dir / ".metadata.json"
             metadata = ProcessingMetadata()
+            valid_frames: dict[str, str] = {}
 
             if resume and metadata_file.exists():
-                print("Found existing metadata, checking for valid frames...")
+                self.logger.debug("Found existing metadata, checking for valid frames")
                 metadata = ProcessingMetadata.model_validate_json(
                     metadata_file.read_text()
                 )
-                valid_frames = self._verify_existing_frames(self._output_dir, metadata)
+                valid_frames = self._verify_existing_frames(
+                    self._output_dir, metadata, deep=deep_verify
+                )
                 if valid_frames:
-                    print(f"Found {len(valid_frames)} valid frames to resume from")
+                    self.logger.debug(
+                        "Found %d valid frames to resume from", len(valid_frames)
+                    )
 
-            # Build and run ffmpeg stream
-            stream = self._build_ffmpeg_stream(video_path)
+            # Build and run ffmpeg command
+            argv = self._build_argv(video_path)
+
+            # Frame count is only known at the end; leaving it unset keeps
+            # checkpoints valid if more frames arrive than estimated
+            metadata.total_frames = None
+            metadata.status = "in_progress"
+            self._flush_metadata(metadata, force=True)
 
             try:
                 with tqdm(
                     total=self._total_frames, desc="Extracting frames", unit="frames"
                 ) as pbar:
-                    # Start ffmpeg process with suppressed output
-                    process = ffmpeg.run_async(
-                        stream,
-                        pipe_stderr=True,
-                        pipe_stdout=True,
-                        overwrite_output=True,
-                    )
-
-                    last_count = 0
-                    last_update = time.time()
-
-                    # Monitor progress by counting files
-                    while process.poll() is None:
-                        current_time = time.time()
-
-                        # Update progress every 100ms
-                        if current_time - last_update >= 0.1:
-                            current_count = len(
-                                list(
-                                    self._output_dir.glob(
-                                        f"frame_*.{self.config.format}"
-                                    )
-                                )
-                            )
-                            if current_count > last_count:
-                                pbar.update(current_count - last_count)
-                                last_count = current_count
-
-                                # Update metadata
-                                metadata.completed_frames = current_count
-                                metadata.status = "in_progress"
-                                self._create_metadata_file(metadata)
-
-                            last_update = current_time
-
-                        time.sleep(0.1)  # Short sleep to prevent CPU thrashing
-
-                    # Check if process completed successfully
-                    if process.returncode != 0:
-                        stderr = (
-                            process.stderr.read().decode("utf-8")
-                            if process.stderr
-                            else "No error output"
-                        )
-                        raise FFmpegOperationError(
-                            f"FFmpeg process failed with return code {process.returncode}\n{stderr}"
+                    frame_files: dict[str, str] = {}
+                    frame_stats = {}
+                    for image in self._iter_piped_images(argv, read_image):
+                        frame_name = (
+                            f"frame_{len(frame_files) + 1:04d}{self._frame_suffix()}"
                         )
-
-                    # Final file counting and metadata
-                    frame_files = {}
-                    for frame_path in sorted(
-                        self._output_dir.glob(f"frame_*.{self.config.format}")
-                    ):
-                        frame_hash = self._calculate_frame_hash(frame_path)
-                        frame_files[frame_path.name] = frame_hash
+                        frame_hash = self._hash_image(image)
+                        frame_files[frame_name] = frame_hash
+
+                        # A verified file with the same hash is left alone
+                        unchanged = valid_frames.get(frame_name) == frame_hash
+                        if save_frames:
+                            frame_path = self._output_dir / frame_name
+                            if not unchanged:
+                                frame_path.write_bytes(image)
+                            frame_stats[frame_name] = _stat_key(frame_path)
+                            metadata.frame_stats[frame_name] = frame_stats[frame_name]
+                        pbar.update(1)
+
+                        # Checkpoint hashes so an interrupted run resumes;
+                        # writes are throttled to the flush interval
+                        metadata.frame_integrity[frame_name] = frame_hash
+                        metadata.completed_frames = len(frame_files)
+                        self._flush_metadata(metadata)
 
                     final_count = len(frame_files)
-                    if final_count > last_count:
-                        pbar.update(final_count - last_count)
-
                     metadata.total_frames = final_count
                     metadata.completed_frames = final_count
                     metadata.status = "completed"
                     metadata.frame_integrity = frame_files
-                    self._create_metadata_file(metadata)
+                    metadata.frame_stats = frame_stats
+                    self._flush_metadata(metadata, force=True)
 
-                    print(f"\nSuccessfully extracted {final_count} frames")
+                    self.logger.info(f"Successfully extracted {final_count} frames")
 
                     return FrameExtractionResult(
                         total_frames=final_count,
@@ -328,13 +860,42 @@ class FrameExtractor(FFmpegOperation[FrameExtractionConfig, FrameExtractionResul
 
             except ffmpeg.Error as e:
                 stderr = e.stderr.decode("utf-8") if e.stderr else "No stderr"
-                print(f"FFmpeg error: {stderr}")
+                self.logger.error(f"FFmpeg error: {stderr}")
                 metadata.status = "failed"
-                self._create_metadata_file(metadata)
+                self._flush_metadata(metadata, force=True)
                 raise FFmpegOperationError(f"FFmpeg operation failed: {stderr}")
 
         except Exception as e:
-            print(f"Error during frame extraction: {str(e)}")
+            self.logger.error(f"Error during frame extraction: {str(e)}")
             if hasattr(e, "__dict__"):
-                print(f"Error details: {e.__dict__}")
+                self.logger.error(f"Error details: {e.__dict__}")
             raise
+
+    async def extract_frames_async(
+        self,
+        video_path: Path,
+        resume: bool = True,
+        save_frames: bool = True,
+        deep_verify: bool = False,
+    ) -> FrameExtractionResult:
+        """
+        Extract frames without blocking the event loop.
+
+        The work happens in the FFmpeg process; the calling side only moves
+        bytes, so it runs on a worker thread and many extractions can be
+        awaited together with ``asyncio.gather``. Extractors keep per-run
+        state, so use one extractor (and episode directory) per concurrent
+        extraction.
+
+        Args:
+            video_path: Path to video file
+            resume: Whether to resume from previous extraction
+            save_frames: Write frame files; when False only hashes are kept
+            deep_verify: On resume, rehash every existing frame
+
+        Returns:
+            FrameExtractionResult with extraction details
+        """
+        return await asyncio.to_thread(
+            self.extract_frames, video_path, resume, save_frames, deep_verify
+        )
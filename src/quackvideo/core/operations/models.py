@@ -1,6 +1,7 @@
 # src/quackvideo/core/operations/models.py
 from __future__ import annotations
 
+import hashlib
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
@@ -28,8 +29,36 @@ class FrameExtractionConfig(FFmpegBaseConfig):
     """Configuration for frame extraction."""
 
     fps: str = Field("1/5", description="Frames per second to extract")
-    format: str = Field("png", description="Output format for frames")
+    format: str = Field(
+        "png",
+        description=(
+            "Output format for frames: 'png' (lossless, slowest), 'jpg', 'webp' "
+            "or 'rawvideo' (unencoded RGB24 .raw files)"
+        ),
+    )
     quality: int = Field(100, description="Output quality (1-100)")
+    hash_algo: str = Field(
+        "sha256",
+        description=(
+            "hashlib algorithm for frame integrity hashes "
+            "(e.g. 'blake2b' is faster on CPUs without SHA extensions)"
+        ),
+    )
+    hwaccel: str | None = Field(
+        None,
+        description=(
+            "Hardware decode API (e.g. 'auto', 'cuda', 'vaapi', 'videotoolbox'); "
+            "None decodes in software"
+        ),
+    )
+    skip_nonref: bool = Field(
+        False,
+        description=(
+            "When sampling below 1 fps, let the decoder skip non-reference "
+            "frames; faster, but the fps filter may then pick different source "
+            "frames, so images and hashes differ from runs without it"
+        ),
+    )
     compatible_formats: dict[str, list[str]] = Field(
         default={
             "video": [".mp4", ".mov", ".avi", ".mkv"],
@@ -43,6 +72,15 @@ class FrameExtractionConfig(FFmpegBaseConfig):
             raise ValueError("Quality must be between 1 and 100")
         return v
 
+    @field_validator("hash_algo")
+    def validate_hash_algo(cls, v: str) -> str:
+        if v not in hashlib.algorithms_available:
+            raise ValueError(f"Unsupported hash algorithm: {v}")
+        # Variable-length digests (shake_*) need a length for hexdigest()
+        if v.startswith("shake_") or hashlib.new(v).digest_size <= 0:
+            raise ValueError(f"Hash algorithm must have a fixed digest size: {v}")
+        return v
+
     @field_validator("compatible_formats")
     def validate_formats(cls, v: dict[str, list[str]]) -> dict[str, list[str]]:
         if "video" not in v:
@@ -58,7 +96,13 @@ class AudioConfig(FFmpegBaseConfig):
     """Configuration for audio operations."""
 
     format: str = Field("flac", description="Output audio format")
-    compression_level: int = Field(8, description="Compression level")
+    compression_level: int = Field(
+        5,
+        description=(
+            "FLAC compression level; 5 is the reference default, higher levels "
+            "are much slower for marginally smaller files"
+        ),
+    )
     mixing_volumes: list[float] = Field(
         default=[0.10, 0.90], description="Volume levels for mixing audio tracks"
     )
@@ -100,6 +144,13 @@ class ProcessingMetadata(BaseModel):
     completed_frames: int = Field(default=0)
     status: str = Field(default="in_progress")
     frame_integrity: dict[str, str] = Field(default_factory=dict)
+    frame_stats: dict[str, tuple[int, int]] = Field(
+        default_factory=dict,
+        description=(
+            "(size, mtime_ns) of each frame file when it was hashed; a match "
+            "lets resume trust the stored hash without rereading the file"
+        ),
+    )
     last_processed: str | None = None
 
     @model_validator(mode="after")
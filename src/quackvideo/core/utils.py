@@ -1,13 +1,46 @@
 # src/quackvideo/core/utils.py
 from __future__ import annotations
 
-from collections.abc import Iterator
+import hashlib
+import json
+import os
+import queue
+import threading
+from collections import OrderedDict, deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import Enum
-from typing import Callable
+from functools import lru_cache
+from pathlib import Path
+from typing import IO, Any, Callable
 
+import cv2
 import ffmpeg
 import numpy as np
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
+
+_PREFETCH_DONE = object()
+
+# Directory where ffprobe results are persisted across processes. Opt-in:
+# set QUACKVIDEO_CACHE_DIR (or assign this) to enable; None keeps the probe
+# cache in memory only
+PROBE_CACHE_DIR: Path | None = (
+    Path(os.environ["QUACKVIDEO_CACHE_DIR"]).expanduser() / "probe"
+    if os.environ.get("QUACKVIDEO_CACHE_DIR")
+    else None
+)
+
+# Maximum number of probe results kept in PROBE_CACHE_DIR; the least
+# recently written entries are removed beyond this
+PROBE_CACHE_MAX_ENTRIES = 4096
+
+# Pipe buffer size requested for FFmpeg frame pipes
+PIPE_SIZE = 1 << 20
+
+# Frames are pooled to a DCT_GRID_SIZE square before the DCT; DCT_COEFFS
+# square low-frequency coefficients per channel form the feature
+DCT_GRID_SIZE = 32
+DCT_COEFFS = 8
 
 
 class ComparisonMethod(str, Enum):
@@ -45,6 +78,58 @@ class FrameComparisonConfig(BaseModel):
         return v
 
 
+def mean_abs_diff(a: np.ndarray, b: np.ndarray) -> float:
+    """
+    Calculate the mean absolute difference between two arrays.
+
+    For uint8 frames this runs as a single fused pass in OpenCV, without
+    materializing the difference or absolute-value temporaries.
+
+    Args:
+        a: First array
+        b: Second array of the same shape
+
+    Returns:
+        Mean absolute difference
+    """
+    if a.shape != b.shape:
+        raise ValueError(f"Array shapes don't match: {a.shape} vs {b.shape}")
+
+    if a.dtype == np.uint8 and b.dtype == np.uint8:
+        return float(cv2.norm(a, b, cv2.NORM_L1)) / a.size
+
+    return float(np.mean(np.abs(a - b)))
+
+
+def _ssim_uint8(a: np.ndarray, b: np.ndarray) -> float:
+    """
+    Calculate global SSIM of two uint8 frames from OpenCV norms.
+
+    The sums SSIM needs are read off three single-pass norms: L1 gives
+    sum(x), L2SQR gives sum(x**2), and the L2SQR of the difference recovers
+    sum(x*y). Nothing is upcast to float and no full-frame temporaries are
+    created; the result matches the float path on [0, 1] scaled frames.
+    """
+    c1 = 0.01**2
+    c2 = 0.03**2
+    n = a.size * 255.0
+    n2 = a.size * 255.0**2
+
+    sum_a2 = cv2.norm(a, cv2.NORM_L2SQR)
+    sum_b2 = cv2.norm(b, cv2.NORM_L2SQR)
+    sum_ab = (sum_a2 + sum_b2 - cv2.norm(a, b, cv2.NORM_L2SQR)) / 2
+
+    mu1 = cv2.norm(a, cv2.NORM_L1) / n
+    mu2 = cv2.norm(b, cv2.NORM_L1) / n
+    var1 = sum_a2 / n2 - mu1**2
+    var2 = sum_b2 / n2 - mu2**2
+    cov = sum_ab / n2 - mu1 * mu2
+
+    return ((2 * mu1 * mu2 + c1) * (2 * cov + c2)) / (
+        (mu1**2 + mu2**2 + c1) * (var1 + var2 + c2)
+    )
+
+
 def calculate_frame_difference(
     frame1: np.ndarray,
     frame2: np.ndarray,
@@ -64,6 +149,21 @@ def calculate_frame_difference(
     if frame1.shape != frame2.shape:
         raise ValueError(f"Frame shapes don't match: {frame1.shape} vs {frame2.shape}")
 
+    uint8 = frame1.dtype == np.uint8 and frame2.dtype == np.uint8
+
+    if method == ComparisonMethod.MSE and uint8:
+        # Exact integer sum of squared differences, normalized once
+        return float(cv2.norm(frame1, frame2, cv2.NORM_L2SQR)) / (
+            frame1.size * 255.0**2
+        )
+
+    if method == ComparisonMethod.MAE and uint8:
+        # Fused uint8 kernel, normalized once at the end
+        return mean_abs_diff(frame1, frame2) / 255.0
+
+    if method == ComparisonMethod.SSIM and uint8:
+        return 1.0 - _ssim_uint8(frame1, frame2)
+
     # Ensure frames are in correct format
     frame1 = frame1.astype(np.float32) / 255.0
     frame2 = frame2.astype(np.float32) / 255.0
@@ -104,7 +204,7 @@ class FeatureExtractionMethod(str, Enum):
 
     HISTOGRAM = "histogram"
     AVERAGE_COLOR = "average_color"
-    DCT = "dct"  # Discrete Cosine Transform
+    DCT = "dct"  # Low-frequency Discrete Cosine Transform coefficients
 
 
 class FeatureExtractor(BaseModel):
@@ -115,10 +215,77 @@ class FeatureExtractor(BaseModel):
         description="Method to use for feature extraction",
     )
     bins: int = Field(default=256, description="Number of bins for histogram")
+    cache: bool = Field(
+        default=False,
+        description="Memoize features by frame content for repeated frames",
+    )
+    cache_size: int = Field(
+        default=1024, description="Maximum number of cached feature vectors"
+    )
+
+    _cache: OrderedDict[tuple[Any, ...], np.ndarray] = PrivateAttr(
+        default_factory=OrderedDict
+    )
+    _cache_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    @field_validator("cache_size")
+    def validate_cache_size(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("Cache size must be positive")
+        return v
 
     def extract(self, frame: np.ndarray) -> np.ndarray:
-        """Extract features from a frame."""
+        """
+        Extract features from a frame.
+
+        With ``cache`` enabled, features are memoized in an LRU keyed on a
+        digest of the frame content, so frames that recur across queries or
+        replayed iterators skip recomputation. Keying on content rather than
+        identity keeps the cache correct for readers that reuse buffers.
+
+        Args:
+            frame: Input frame (HxWx3)
+
+        Returns:
+            Feature vector; cached vectors are shared, so treat as read-only
+        """
+        if not self.cache:
+            return self._extract(frame)
+
+        frame = np.ascontiguousarray(frame)
+        digest = hashlib.blake2b(memoryview(frame).cast("B"), digest_size=16)
+        key = (self.method, self.bins, frame.shape, frame.dtype.str, digest.digest())
+
+        with self._cache_lock:
+            features = self._cache.get(key)
+            if features is not None:
+                self._cache.move_to_end(key)
+                return features
+
+        features = self._extract(frame)
+        with self._cache_lock:
+            self._cache[key] = features
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return features
+
+    def _extract(self, frame: np.ndarray) -> np.ndarray:
+        """Compute features for a frame without consulting the cache."""
         if self.method == FeatureExtractionMethod.HISTOGRAM:
+            if frame.dtype == np.uint8:
+                # One counting pass per channel straight over the interleaved
+                # frame; np.histogram would copy each channel and bin it via
+                # a generic search
+                return (
+                    np.concatenate(
+                        [
+                            cv2.calcHist([frame], [i], None, [self.bins], [0, 256])
+                            for i in range(3)
+                        ]
+                    )
+                    .ravel()
+                    .astype(np.int64)
+                )
             return np.array(
                 [
                     np.histogram(frame[:, :, i], bins=self.bins, range=(0, 256))[0]
@@ -130,31 +297,20 @@ class FeatureExtractor(BaseModel):
             return frame.mean(axis=(0, 1))
 
         elif self.method == FeatureExtractionMethod.DCT:
-            # Use ffmpeg's DCT filter
-            try:
-                process = (
-                    ffmpeg.input(
-                        "pipe:",
-                        format="rawvideo",
-                        pix_fmt="rgb24",
-                        s=f"{frame.shape[1]}x{frame.shape[0]}",
-                    )
-                    .filter("dctdnoiz")  # Apply DCT denoising filter
-                    .output("pipe:", format="rawvideo", pix_fmt="rgb24")
-                    .run_async(pipe_stdin=True, pipe_stdout=True)
-                )
-
-                process.stdin.write(frame.tobytes())
-                process.stdin.close()
-
-                out_bytes = process.stdout.read(frame.size)
-                dct_frame = np.frombuffer(out_bytes, dtype=np.uint8).reshape(
-                    frame.shape
-                )
-                return dct_frame.mean(axis=(0, 1))
-
-            except ffmpeg.Error as e:
-                raise ValueError(f"FFmpeg DCT extraction failed: {str(e)}")
+            # Area-resample to a fixed grid (an average pool over blocks),
+            # then keep each channel's low-frequency DCT coefficients, which
+            # describe the coarse layout independently of resolution
+            pooled = cv2.resize(
+                frame, (DCT_GRID_SIZE, DCT_GRID_SIZE), interpolation=cv2.INTER_AREA
+            ).astype(np.float32)
+            return np.concatenate(
+                [
+                    cv2.dct(np.ascontiguousarray(pooled[:, :, i]))[
+                        :DCT_COEFFS, :DCT_COEFFS
+                    ].ravel()
+                    for i in range(3)
+                ]
+            )
 
         else:
             raise ValueError(f"Unknown feature extraction method: {self.method}")
@@ -171,6 +327,12 @@ def detect_black_frames(frame: np.ndarray, threshold: float = 10.0) -> bool:
     Returns:
         True if frame is considered black
     """
+    if frame.dtype == np.uint8 and frame.ndim == 3 and frame.shape[2] <= 4:
+        # OpenCV returns per-channel means in a single SIMD pass; every
+        # channel has the same pixel count, so their average is the mean
+        channel_means = cv2.mean(frame)[: frame.shape[2]]
+        return sum(channel_means) / len(channel_means) < threshold
+
     return float(np.mean(frame)) < threshold
 
 
@@ -193,44 +355,385 @@ def detect_scene_change(
     return diff > config.threshold
 
 
+def _normalize_features(
+    features: np.ndarray, method: FeatureExtractionMethod
+) -> np.ndarray:
+    """
+    Scale a feature vector onto the [0, 1] range of normalized pixel data.
+
+    Histograms are divided by their pixel count, so frames of different
+    resolutions compare as distributions. Average colors are divided by 255,
+    and DCT coefficients by the grid size times 255, which maps the DC term
+    of the orthonormal transform onto the mean intensity. This keeps
+    distances on the same scale as ``calculate_frame_difference`` and the
+    [0, 1] threshold.
+
+    Args:
+        features: Feature vector from ``FeatureExtractor.extract``
+        method: Method the features were extracted with
+
+    Returns:
+        New float64 feature vector; the input is never modified
+    """
+    features = features.astype(np.float64).ravel()
+    if method == FeatureExtractionMethod.HISTOGRAM:
+        # Each of the three channel histograms sums to the pixel count
+        pixels = features.sum() / 3
+        return features / pixels if pixels > 0 else features
+    elif method == FeatureExtractionMethod.AVERAGE_COLOR:
+        return features / 255.0
+    elif method == FeatureExtractionMethod.DCT:
+        return features / (DCT_GRID_SIZE * 255.0)
+    else:
+        raise ValueError(f"Unknown feature extraction method: {method}")
+
+
+def _feature_distance(
+    features: np.ndarray, target: np.ndarray, method: ComparisonMethod
+) -> np.ndarray:
+    """
+    Score a batch of feature vectors against a target in one vectorized pass.
+
+    Features are expected to be normalized with ``_normalize_features``; each
+    method then matches ``calculate_frame_difference`` applied row by row,
+    with SSIM computed globally over each feature vector.
+
+    Args:
+        features: Normalized feature vectors stacked as (N, D)
+        target: Normalized target feature vector (D,)
+        method: Comparison method to use
+
+    Returns:
+        Distance per row (N,); lower means more similar
+    """
+    if method == ComparisonMethod.MSE:
+        diff = features - target
+        mse: np.ndarray = np.einsum("ij,ij->i", diff, diff) / features.shape[1]
+        return mse
+
+    elif method == ComparisonMethod.MAE:
+        mae: np.ndarray = np.abs(features - target).mean(axis=1)
+        return mae
+
+    elif method == ComparisonMethod.SSIM:
+        c1 = 0.01**2
+        c2 = 0.03**2
+
+        mu1 = features.mean(axis=1)
+        mu2 = target.mean()
+        centered = features - mu1[:, None]
+        target_centered = target - mu2
+
+        var1 = np.einsum("ij,ij->i", centered, centered) / features.shape[1]
+        var2 = target_centered @ target_centered / target.size
+        cov = centered @ target_centered / target.size
+
+        ssim: np.ndarray = ((2 * mu1 * mu2 + c1) * (2 * cov + c2)) / (
+            (mu1**2 + mu2**2 + c1) * (var1 + var2 + c2)
+        )
+        return 1.0 - ssim
+
+    else:
+        raise ValueError(f"Unknown comparison method: {method}")
+
+
 def find_similar_frames(
     target_frame: np.ndarray,
     frame_iterator: Iterator[tuple[float, np.ndarray]],
     config: FrameComparisonConfig | None = None,
     feature_extractor: FeatureExtractor | None = None,
+    *,
+    batch_size: int = 32,
+    max_workers: int | None = None,
 ) -> Iterator[tuple[float, np.ndarray, float]]:
     """
     Find frames similar to a target frame.
 
+    Features are extracted on a thread pool (NumPy and OpenCV release the GIL
+    in their kernels) while the main thread buffers them and scores them
+    against the target in batches, so the distance math runs once per batch
+    instead of once per frame. Features are normalized to the [0, 1] pixel
+    scale first, so ``config.threshold`` means the same as it does for
+    ``calculate_frame_difference``.
+
     Args:
         target_frame: Frame to compare against (HxWx3)
-        frame_iterator: Iterator of (timestamp, frame) tuples
+        frame_iterator: Iterator of (timestamp, frame) tuples; frames are
+            held while in flight and until their batch is scored, so they
+            must not be reused by the iterator in the meantime
         config: Configuration for frame comparison
         feature_extractor: Optional feature extractor for comparison
+        batch_size: Number of frames scored together
+        max_workers: Number of feature extraction threads (defaults to CPU
+            count)
 
     Yields:
         Tuples of (timestamp, frame, difference_score)
     """
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+
     config = config or FrameComparisonConfig()
     feature_extractor = feature_extractor or FeatureExtractor()
+    method = config.method
+    threshold = config.threshold
+    extraction_method = feature_extractor.method
+
+    def extract(frame: np.ndarray) -> np.ndarray:
+        features = feature_extractor.extract(frame)
+        return _normalize_features(features, extraction_method)
 
     # Extract features from target frame
-    target_features = feature_extractor.extract(target_frame)
+    target_features = extract(target_frame)
+    dim = target_features.size
+
+    batch: list[tuple[float, np.ndarray]] = []
+    features = np.empty((batch_size, dim), dtype=np.float64)
+
+    def _flush() -> Iterator[tuple[float, np.ndarray, float]]:
+        count = len(batch)
+        diffs = _feature_distance(features[:count], target_features, method)
+        for i in np.flatnonzero(diffs <= threshold):
+            timestamp, frame = batch[i]
+            yield timestamp, frame, float(diffs[i])
+        batch.clear()
+
+    def _extract(
+        item: tuple[float, np.ndarray],
+    ) -> tuple[float, np.ndarray, np.ndarray]:
+        timestamp, frame = item
+        return timestamp, frame, extract(frame)
+
+    extracted = map_frames(_extract, frame_iterator, max_workers=max_workers)
+    for timestamp, frame, frame_features in extracted:
+        if frame_features.size != dim:
+            continue  # Skip frames with incompatible dimensions
+
+        features[len(batch)] = frame_features
+        batch.append((timestamp, frame))
+        if len(batch) == batch_size:
+            yield from _flush()
+
+    if batch:
+        yield from _flush()
+
+
+def map_frames[U, T](
+    func: Callable[[U], T],
+    frames: Iterable[U],
+    *,
+    max_workers: int | None = None,
+    max_pending: int | None = None,
+) -> Iterator[T]:
+    """
+    Apply a function to frames on a thread pool, yielding results in order.
+
+    NumPy releases the GIL inside its array kernels, so per-frame analysis
+    (feature extraction, black frame detection, ...) overlaps with decoding
+    and runs on several cores. At most ``max_pending`` frames are in flight,
+    which bounds memory use when decoding outpaces the workers.
+
+    Args:
+        func: Function applied to each item
+        frames: Iterable of frames (HxWx3), or any other work items such as
+            (timestamp, frame) pairs or timestamps; frames must not be reused
+            by the iterable while still in flight
+        max_workers: Number of worker threads (defaults to CPU count)
+        max_pending: Maximum number of frames in flight (defaults to
+            twice the number of workers)
+
+    Yields:
+        Results of ``func`` in the same order as the input frames
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    max_pending = max_pending or 2 * max_workers
+
+    pending: deque[Future[T]] = deque()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for frame in frames:
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+            pending.append(executor.submit(func, frame))
+
+        while pending:
+            yield pending.popleft().result()
 
-    for timestamp, frame in frame_iterator:
+
+def _put_until_stopped(
+    buffer: queue.Queue, item: object, stop: threading.Event
+) -> bool:
+    """Put an item into a bounded queue, giving up once ``stop`` is set."""
+    while not stop.is_set():
         try:
-            # Extract features from current frame
-            frame_features = feature_extractor.extract(frame)
-
-            # Calculate difference using selected method
-            diff = calculate_frame_difference(
-                target_features.reshape(1, -1),
-                frame_features.reshape(1, -1),
-                config.method,
-            )
+            buffer.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _produce_into(
+    source: Iterator[np.ndarray], buffer: queue.Queue, stop: threading.Event
+) -> None:
+    """Drain ``source`` into ``buffer``, then a done marker or the error."""
+    try:
+        for frame in source:
+            if not _put_until_stopped(buffer, frame, stop):
+                return
+        _put_until_stopped(buffer, _PREFETCH_DONE, stop)
+    except Exception as e:
+        _put_until_stopped(buffer, e, stop)
+    finally:
+        close = getattr(source, "close", None)
+        if close is not None:
+            close()
+
+
+def prefetch_frames(
+    frames: Iterable[np.ndarray], maxsize: int = 16
+) -> Iterator[np.ndarray]:
+    """
+    Decode frames ahead of the consumer on a background thread.
 
-            if diff <= config.threshold:
-                yield timestamp, frame, diff
+    The producer thread drains ``frames`` into a bounded queue so FFmpeg keeps
+    decoding while the caller computes. When the queue is full the producer
+    blocks, so at most ``maxsize`` decoded frames are buffered.
 
-        except ValueError:
-            continue  # Skip frames with incompatible dimensions
+    Args:
+        frames: Iterable of frames (HxWx3), typically ``read_frames()``;
+            frames must not be reused by the iterable once yielded
+        maxsize: Maximum number of decoded frames buffered ahead
+
+    Yields:
+        Frames in their original order
+    """
+    if maxsize <= 0:
+        raise ValueError("maxsize must be positive")
+
+    buffer: queue.Queue = queue.Queue(maxsize=maxsize)
+    stop = threading.Event()
+    producer = threading.Thread(
+        target=_produce_into, args=(iter(frames), buffer, stop), daemon=True
+    )
+    producer.start()
+
+    try:
+        while True:
+            item = buffer.get()
+            if item is _PREFETCH_DONE:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        producer.join()
+
+
+@lru_cache(maxsize=512)
+def _probe_cached(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Run ffprobe once per file version; mtime and size key the cache."""
+    probe: dict[str, Any]
+    if PROBE_CACHE_DIR is None:
+        probe = ffmpeg.probe(path)
+        return probe
+
+    # Entries are keyed on the file version, so a changed file never hits a
+    # stale one; one file per entry keeps concurrent writers independent
+    key = hashlib.sha256(f"{path}\0{mtime_ns}\0{size}".encode()).hexdigest()
+    cache_file = PROBE_CACHE_DIR / f"{key}.json"
+    try:
+        probe = json.loads(cache_file.read_text())
+        return probe
+    except (OSError, ValueError):
+        pass
+
+    probe = ffmpeg.probe(path)
+    try:
+        PROBE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_text(json.dumps(probe))
+        os.replace(tmp_file, cache_file)
+        _prune_probe_cache(PROBE_CACHE_DIR)
+    except OSError:
+        pass  # The cache is best effort
+    return probe
+
+
+def _prune_probe_cache(cache_dir: Path) -> None:
+    """Remove the oldest probe results beyond PROBE_CACHE_MAX_ENTRIES."""
+    entries = []
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            if entry.name.endswith(".json"):
+                try:
+                    entries.append((entry.stat().st_mtime_ns, entry.path))
+                except OSError:
+                    continue  # Removed by a concurrent prune
+
+    excess = len(entries) - PROBE_CACHE_MAX_ENTRIES
+    if excess <= 0:
+        return
+
+    entries.sort()
+    for _, entry_path in entries[:excess]:
+        try:
+            os.remove(entry_path)
+        except OSError:
+            continue
+
+
+def probe_media(path: str | Path) -> dict[str, Any]:
+    """
+    Probe a media file, reusing the result until the file changes.
+
+    Each ffprobe spawn costs tens to hundreds of milliseconds, so repeated
+    lookups of the same file (video info before every extraction, audio info
+    after every operation) are served from an LRU cache keyed on the
+    resolved path, mtime and size. When ``PROBE_CACHE_DIR`` is set, results
+    are also persisted there with the same key, up to
+    ``PROBE_CACHE_MAX_ENTRIES`` files, so a new process skips ffprobe for
+    files it has already seen.
+
+    Args:
+        path: Path to media file
+
+    Returns:
+        Parsed ffprobe JSON; shared between callers, so treat it as read-only
+    """
+    path = Path(path).resolve()
+    stat = path.stat()
+    return _probe_cached(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+def set_pipe_size(pipe: IO[bytes], size: int = PIPE_SIZE) -> bool:
+    """
+    Enlarge the kernel buffer of a pipe.
+
+    The default 64 KiB Linux pipe makes a 1080p rgb24 frame (~6 MB) cost
+    about a hundred reads and context switches; a larger buffer lets FFmpeg
+    run ahead and the reader drain it in far fewer syscalls. This is a no-op
+    on platforms without F_SETPIPE_SZ or when the size exceeds
+    /proc/sys/fs/pipe-max-size.
+
+    Args:
+        pipe: Pipe file object, e.g. a subprocess stdout
+        size: Requested buffer size in bytes
+
+    Returns:
+        True if the buffer size was changed
+    """
+    try:
+        import fcntl
+    except ImportError:
+        return False
+
+    set_size = getattr(fcntl, "F_SETPIPE_SZ", None)
+    if set_size is None:
+        return False
+
+    try:
+        fcntl.fcntl(pipe.fileno(), set_size, size)
+    except OSError:
+        return False
+    return True
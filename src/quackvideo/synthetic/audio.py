@@ -1,7 +1,8 @@
 # src/quackvideo/synthetic/audio.py
 from __future__ import annotations
 
-from collections.abc import Iterator
+import math
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from enum import Enum
 from pathlib import Path
 
@@ -9,7 +10,11 @@ import ffmpeg
 import numpy as np
 from pydantic import Field
 
-from .base import SyntheticConfig, SyntheticGenerator
+from .base import SyntheticConfig, SyntheticGenerator, _feed_pipe
+
+# Envelope ramp lengths in seconds, applied to avoid clicks
+ATTACK_TIME = 0.01
+RELEASE_TIME = 0.01
 
 
 class AudioPattern(str, Enum):
@@ -34,6 +39,7 @@ class AudioConfig(SyntheticConfig):
     amplitude: float = Field(0.5, description="Signal amplitude (0-1)")
     channels: int = Field(2, description="Number of audio channels")
     format: str = Field("flac", description="Output audio format")
+    compression_level: int = Field(5, description="FLAC compression level (0-12)")
 
     # Pattern-specific settings
     sweep_start: float = Field(20.0, description="Start frequency for sweep (Hz)")
@@ -53,6 +59,16 @@ class AudioGenerator(SyntheticGenerator):
         super().__init__(config)
         self.config = config  # Type hint for IDE
 
+        # Attack and release ramps, built once per generator
+        attack_samples = int(ATTACK_TIME * config.sample_rate)
+        release_samples = int(RELEASE_TIME * config.sample_rate)
+        self._attack = np.linspace(0, 1, attack_samples, dtype=np.float32)[
+            :, np.newaxis
+        ]
+        self._release = np.linspace(1, 0, release_samples, dtype=np.float32)[
+            :, np.newaxis
+        ]
+
     def _generate_samples(self) -> Iterator[np.ndarray]:
         """Generate audio samples based on selected pattern."""
         total_samples = int(self.config.duration * self.config.sample_rate)
@@ -71,31 +87,110 @@ class AudioGenerator(SyntheticGenerator):
             yield from self._generate_multi_tone(total_samples)
 
     def _apply_envelope(
-        self, samples: np.ndarray, attack_time: float = 0.01, release_time: float = 0.01
+        self, samples: np.ndarray, start: int, total_samples: int
     ) -> np.ndarray:
-        """Apply attack and release envelope to avoid clicks."""
-        attack_samples = int(attack_time * self.config.sample_rate)
-        release_samples = int(release_time * self.config.sample_rate)
+        """
+        Apply attack and release envelope to avoid clicks.
+
+        The ramps belong to the start and end of the whole signal, so a chunk
+        is only scaled where it overlaps them.
 
-        attack = np.linspace(0, 1, attack_samples)
-        release = np.linspace(1, 0, release_samples)
+        Args:
+            samples: Chunk of shape (samples, channels), scaled in place
+            start: Index of the chunk's first sample in the signal
+            total_samples: Length of the whole signal
 
-        samples[:attack_samples] *= attack[:, np.newaxis]
-        samples[-release_samples:] *= release[:, np.newaxis]
+        Returns:
+            The scaled chunk
+        """
+        end = start + len(samples)
+
+        attack_end = min(len(self._attack), total_samples)
+        if start < attack_end:
+            stop = min(attack_end, end)
+            samples[: stop - start] *= self._attack[start:stop]
+
+        release_start = max(total_samples - len(self._release), 0)
+        if end > release_start:
+            first = max(release_start, start)
+            offset = len(self._release) - (total_samples - first)
+            samples[first - start :] *= self._release[offset : offset + end - first]
 
         return samples
 
+    def _render(
+        self,
+        total_samples: int,
+        fill: Callable[[np.ndarray, np.ndarray], None],
+        gain: float,
+        envelope: bool = False,
+    ) -> Iterator[np.ndarray]:
+        """
+        Render a mono signal chunk by chunk into a reused multi-channel buffer.
+
+        Memory stays bounded by the chunk size regardless of duration. The
+        yielded chunk is overwritten on the next iteration, so consumers must
+        copy it if they keep a reference.
+
+        Args:
+            total_samples: Number of samples to render
+            fill: Writes the unit signal for the sample times in its second
+                argument (seconds) into its first argument
+            gain: Scale applied to the unit signal
+            envelope: Whether to apply the attack/release envelope
+
+        Yields:
+            float32 chunks of shape (samples, channels)
+        """
+        chunk_size = self.config.sample_rate  # 1 second chunks
+        index = np.arange(chunk_size, dtype=np.float64)
+        t = np.empty(chunk_size)
+        signal = np.empty(chunk_size)
+        buffer = np.empty((chunk_size, self.config.channels), dtype=np.float32)
+
+        for start in range(0, total_samples, chunk_size):
+            n = min(chunk_size, total_samples - start)
+            np.add(index[:n], start, out=t[:n])
+            t[:n] /= self.config.sample_rate
+
+            fill(signal[:n], t[:n])
+
+            # Broadcast into every channel instead of column-stacking copies
+            chunk = buffer[:n]
+            np.multiply(signal[:n, np.newaxis], gain, out=chunk)
+            if envelope:
+                self._apply_envelope(chunk, start, total_samples)
+            yield chunk
+
+    def _tone_fill(self) -> Callable[[np.ndarray, np.ndarray], None]:
+        """
+        Build a fill function for a single-frequency tone without per-sample sin.
+
+        A tone is a rotating phasor: sample k of a chunk starting at phase
+        theta is sin(theta + omega*k) = sin(theta)*cos(omega*k) +
+        cos(theta)*sin(omega*k). The cos/sin tables over one chunk are built
+        once, so each chunk costs two multiplies and an add per sample plus
+        one scalar sin/cos for its start phase, which is taken from absolute
+        time and so never drifts.
+        """
+        omega = 2 * np.pi * self.config.frequency
+        steps = omega * np.arange(self.config.sample_rate) / self.config.sample_rate
+        cos_table = np.cos(steps)
+        sin_table = np.sin(steps)
+        scratch = np.empty_like(steps)
+
+        def fill(out: np.ndarray, t: np.ndarray) -> None:
+            theta = math.fmod(omega * float(t[0]), 2 * math.pi)
+            n = len(out)
+            np.multiply(cos_table[:n], math.sin(theta), out=out)
+            np.multiply(sin_table[:n], math.cos(theta), out=scratch[:n])
+            out += scratch[:n]
+
+        return fill
+
     def _generate_sine(self, total_samples: int) -> Iterator[np.ndarray]:
         """Generate sine wave."""
-        t = np.linspace(0, self.config.duration, total_samples)
-        signal = self.config.amplitude * np.sin(2 * np.pi * self.config.frequency * t)
-        stereo_signal = np.column_stack([signal] * self.config.channels)
-
-        # Process in chunks
-        chunk_size = self.config.sample_rate  # 1 second chunks
-        for i in range(0, total_samples, chunk_size):
-            chunk = stereo_signal[i : i + chunk_size]
-            yield chunk.astype(np.float32)
+        yield from self._render(total_samples, self._tone_fill(), self.config.amplitude)
 
     def _generate_white_noise(self, total_samples: int) -> Iterator[np.ndarray]:
         """Generate white noise."""
@@ -108,66 +203,69 @@ class AudioGenerator(SyntheticGenerator):
 
     def _generate_sweep(self, total_samples: int) -> Iterator[np.ndarray]:
         """Generate frequency sweep (linear)."""
-        t = np.linspace(0, self.config.duration, total_samples)
         freq_range = self.config.sweep_end - self.config.sweep_start
-        freq_t = self.config.sweep_start + (freq_range * t / self.config.duration)
+        slope = freq_range / self.config.duration
 
-        # Integrate frequency to get phase
-        phase = 2 * np.pi * np.cumsum(freq_t) / self.config.sample_rate
-        signal = self.config.amplitude * np.sin(phase)
-        stereo_signal = np.column_stack([signal] * self.config.channels)
+        def fill(out: np.ndarray, t: np.ndarray) -> None:
+            # Closed-form phase of a linear sweep:
+            # 2*pi * (f0*t + slope/2 * t**2)
+            np.multiply(t, 0.5 * slope, out=out)
+            out += self.config.sweep_start
+            out *= t
+            out *= 2 * np.pi
+            np.sin(out, out=out)
 
-        chunk_size = self.config.sample_rate
-        for i in range(0, total_samples, chunk_size):
-            chunk = stereo_signal[i : i + chunk_size]
-            yield chunk.astype(np.float32)
+        yield from self._render(total_samples, fill, self.config.amplitude)
 
     def _generate_chirp(self, total_samples: int) -> Iterator[np.ndarray]:
         """Generate chirp signal (exponential frequency change)."""
-        t = np.linspace(0, self.config.duration, total_samples)
-        freq_t = self.config.frequency * np.exp(self.config.chirp_rate * t)
-        phase = 2 * np.pi * np.cumsum(freq_t) / self.config.sample_rate
-        signal = self.config.amplitude * np.sin(phase)
-        stereo_signal = np.column_stack([signal] * self.config.channels)
-
-        chunk_size = self.config.sample_rate
-        for i in range(0, total_samples, chunk_size):
-            chunk = stereo_signal[i : i + chunk_size]
-            yield self._apply_envelope(chunk).astype(np.float32)
+        rate = self.config.chirp_rate
+        omega = 2 * np.pi * self.config.frequency
+
+        def fill(out: np.ndarray, t: np.ndarray) -> None:
+            # Closed-form phase of an exponential chirp:
+            # 2*pi * f0 / rate * (exp(rate*t) - 1)
+            if rate == 0:
+                np.multiply(t, omega, out=out)
+            else:
+                np.multiply(t, rate, out=out)
+                np.expm1(out, out=out)
+                out *= omega / rate
+            np.sin(out, out=out)
+
+        yield from self._render(
+            total_samples, fill, self.config.amplitude, envelope=True
+        )
 
     def _generate_pure_tone(self, total_samples: int) -> Iterator[np.ndarray]:
         """Generate pure tone with precise frequency."""
-        t = np.linspace(0, self.config.duration, total_samples)
-        signal = self.config.amplitude * np.sin(2 * np.pi * self.config.frequency * t)
-        stereo_signal = np.column_stack([signal] * self.config.channels)
-
-        chunk_size = self.config.sample_rate
-        for i in range(0, total_samples, chunk_size):
-            chunk = stereo_signal[i : i + chunk_size]
-            yield self._apply_envelope(chunk).astype(np.float32)
+        yield from self._render(
+            total_samples, self._tone_fill(), self.config.amplitude, envelope=True
+        )
 
     def _generate_multi_tone(self, total_samples: int) -> Iterator[np.ndarray]:
         """Generate multiple simultaneous tones."""
-        t = np.linspace(0, self.config.duration, total_samples)
-        signal = np.zeros(total_samples)
+        omegas = 2 * np.pi * np.asarray(self.config.frequencies, dtype=np.float64)
+        phases = np.empty((self.config.sample_rate, len(omegas)))
 
-        # Sum multiple frequencies
-        for freq in self.config.frequencies:
-            signal += np.sin(2 * np.pi * freq * t)
+        def fill(out: np.ndarray, t: np.ndarray) -> None:
+            # One (samples, tones) phase block: a single outer product, sin
+            # and row sum replace a Python loop of per-frequency passes
+            block = phases[: len(out)]
+            np.multiply(t[:, np.newaxis], omegas, out=block)
+            np.sin(block, out=block)
+            block.sum(axis=1, out=out)
 
         # Normalize and apply amplitude
-        signal = signal / len(self.config.frequencies)
-        signal *= self.config.amplitude
-
-        stereo_signal = np.column_stack([signal] * self.config.channels)
-
-        chunk_size = self.config.sample_rate
-        for i in range(0, total_samples, chunk_size):
-            chunk = stereo_signal[i : i + chunk_size]
-            yield self._apply_envelope(chunk).astype(np.float32)
+        gain = self.config.amplitude / len(self.config.frequencies)
+        yield from self._render(total_samples, fill, gain, envelope=True)
 
     def generate(self, output_path: Path) -> Path:
         """Generate synthetic audio file."""
+        return self._encode(self._generate_samples(), output_path)
+
+    def _encode(self, chunks: Iterable[np.ndarray], output_path: Path) -> Path:
+        """Encode float32 PCM chunks to an audio file with FFmpeg."""
         output_path = Path(output_path)
 
         # Set up FFmpeg process
@@ -182,7 +280,11 @@ class AudioGenerator(SyntheticGenerator):
             .output(
                 str(output_path),
                 acodec="flac" if self.config.format == "flac" else "pcm_s16le",
-                compression_level=8 if self.config.format == "flac" else None,
+                compression_level=(
+                    self.config.compression_level
+                    if self.config.format == "flac"
+                    else None
+                ),
             )
             .overwrite_output()
             .run_async(pipe_stdin=True)
@@ -190,8 +292,7 @@ class AudioGenerator(SyntheticGenerator):
 
         try:
             # Write audio samples
-            for samples in self._generate_samples():
-                process.stdin.write(samples.tobytes())
+            _feed_pipe(process.stdin, chunks)
 
             # Close stdin pipe
             process.stdin.close()
@@ -203,3 +304,52 @@ class AudioGenerator(SyntheticGenerator):
             if process.poll() is None:
                 process.kill()
             raise
+
+
+def generate_mix(
+    generators: Sequence[AudioGenerator],
+    volumes: Sequence[float],
+    output_path: Path,
+) -> Path:
+    """
+    Generate several synthetic patterns and encode their mix in one pass.
+
+    The patterns are mixed chunk by chunk in memory, so no intermediate
+    files are written or decoded and the output is encoded only once. Like
+    FFmpeg's amix filter, the weighted sum is divided by the number of inputs.
+
+    Args:
+        generators: Generators to mix; they must share sample rate, channels
+            and duration
+        volumes: Volume level for each generator
+        output_path: Path to save mixed audio
+
+    Returns:
+        Path to the generated file
+    """
+    if not generators:
+        raise ValueError("At least one generator is required")
+    if len(volumes) != len(generators):
+        raise ValueError("Number of volumes must match number of generators")
+
+    first = generators[0].config
+    for generator in generators[1:]:
+        config = generator.config
+        if (
+            config.sample_rate != first.sample_rate
+            or config.channels != first.channels
+            or config.duration != first.duration
+        ):
+            raise ValueError("Generators must share sample rate, channels and duration")
+
+    weights = [volume / len(generators) for volume in volumes]
+
+    def mixed_chunks() -> Iterator[np.ndarray]:
+        streams = [generator._generate_samples() for generator in generators]
+        for chunks in zip(*streams, strict=True):
+            mixed = np.multiply(chunks[0], weights[0], dtype=np.float32)
+            for chunk, weight in zip(chunks[1:], weights[1:], strict=True):
+                mixed += chunk * np.float32(weight)
+            yield mixed
+
+    return generators[0]._encode(mixed_chunks(), output_path)
@@ -1,12 +1,85 @@
 # src/quackvideo/synthetic/base.py
 from __future__ import annotations
 
+import queue
+import threading
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from pathlib import Path
+from typing import IO
 
+import numpy as np
 from pydantic import BaseModel, Field
 
 
+def _byte_view(array: np.ndarray) -> memoryview:
+    """Return a flat byte view of an array so it can be piped without a copy."""
+    return memoryview(np.ascontiguousarray(array)).cast("B")
+
+
+# Number of rendered buffers that may wait for the FFmpeg writer thread
+FEED_DEPTH = 8
+
+
+def _feed_pipe(
+    pipe: IO[bytes], arrays: Iterable[np.ndarray], depth: int = FEED_DEPTH
+) -> None:
+    """
+    Write arrays to a pipe from a dedicated writer thread.
+
+    Rendering on the calling thread overlaps with FFmpeg consuming the pipe,
+    so neither side idles while the other works. The generators reuse their
+    output buffers, so each array is copied into one of ``depth`` staging
+    buffers that are recycled once the writer thread has flushed them.
+
+    Args:
+        pipe: Pipe to write to, e.g. a subprocess stdin
+        arrays: Arrays to write in order
+        depth: Maximum number of arrays queued ahead of the writer
+
+    Raises:
+        OSError: If writing to the pipe fails
+    """
+    ready: queue.Queue[np.ndarray | None] = queue.Queue()
+    free: queue.Queue[np.ndarray] = queue.Queue()
+    errors: list[OSError] = []
+
+    def _write() -> None:
+        while (buffer := ready.get()) is not None:
+            if not errors:
+                try:
+                    pipe.write(_byte_view(buffer))
+                except OSError as e:
+                    errors.append(e)
+            free.put(buffer)
+
+    writer = threading.Thread(target=_write, daemon=True)
+    writer.start()
+
+    allocated = 0
+    try:
+        for array in arrays:
+            if errors:
+                break
+
+            if allocated < depth:
+                buffer = np.empty_like(array)
+                allocated += 1
+            else:
+                buffer = free.get()
+                if buffer.shape != array.shape or buffer.dtype != array.dtype:
+                    buffer = np.empty_like(array)
+
+            np.copyto(buffer, array)
+            ready.put(buffer)
+    finally:
+        ready.put(None)
+        writer.join()
+
+    if errors:
+        raise errors[0]
+
+
 class SyntheticConfig(BaseModel):
     """Base configuration for synthetic data generation."""
 
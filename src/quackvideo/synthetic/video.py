@@ -10,7 +10,7 @@ import ffmpeg
 import numpy as np
 from pydantic import Field
 
-from .base import SyntheticConfig, SyntheticGenerator
+from .base import SyntheticConfig, SyntheticGenerator, _byte_view, _feed_pipe
 
 
 class VideoPattern(str, Enum):
@@ -23,6 +23,41 @@ class VideoPattern(str, Enum):
     PULSE = "pulse"
 
 
+# Color bars, left to right
+COLOR_BARS = [
+    (255, 255, 255),  # White
+    (255, 255, 0),  # Yellow
+    (0, 255, 255),  # Cyan
+    (0, 255, 0),  # Green
+    (255, 0, 255),  # Magenta
+    (255, 0, 0),  # Red
+    (0, 0, 255),  # Blue
+    (0, 0, 0),  # Black
+]
+
+# Checkerboard square size in pixels
+CHECK_SIZE = 64
+
+# Patterns that can be rendered directly as yuv420p planes
+YUV_PATTERNS = frozenset(
+    {VideoPattern.COLOR_BARS, VideoPattern.CHECKERBOARD, VideoPattern.PULSE}
+)
+
+
+def _rgb_to_yuv(color: tuple[int, int, int]) -> tuple[int, int, int]:
+    """
+    Convert an RGB color to limited-range BT.601 YUV.
+
+    This matches FFmpeg's default rgb24 to yuv420p conversion, so patterns
+    rendered straight to YUV encode to the same colors as their RGB form.
+    """
+    r, g, b = color
+    y = 16 + (65.481 * r + 128.553 * g + 24.966 * b) / 255
+    u = 128 + (-37.797 * r - 74.203 * g + 112.0 * b) / 255
+    v = 128 + (112.0 * r - 93.786 * g - 18.214 * b) / 255
+    return round(y), round(u), round(v)
+
+
 class VideoConfig(SyntheticConfig):
     """Configuration for synthetic video generation."""
 
@@ -40,9 +75,16 @@ class VideoGenerator(SyntheticGenerator):
     def __init__(self, config: VideoConfig) -> None:
         super().__init__(config)
         self.config = config  # Type hint for IDE
+        self._frame = np.empty((config.height, config.width, 3), dtype=np.uint8)
 
     def _generate_frames(self) -> Iterator[np.ndarray]:
-        """Generate frames based on selected pattern."""
+        """
+        Generate frames based on selected pattern.
+
+        Every pattern renders into the same preallocated frame buffer, so a
+        yielded frame is overwritten on the next iteration; copy it if the
+        reference is kept beyond that.
+        """
         total_frames = int(self.config.duration * self.config.fps)
 
         if self.config.pattern == VideoPattern.COLOR_BARS:
@@ -56,26 +98,20 @@ class VideoGenerator(SyntheticGenerator):
         elif self.config.pattern == VideoPattern.PULSE:
             yield from self._generate_pulse(total_frames)
 
+    def _bar_bounds(self, width: int) -> Iterator[tuple[int, int, int]]:
+        """Yield (index, start, end) column bounds of each color bar."""
+        bar_width = width // len(COLOR_BARS)
+        for i in range(len(COLOR_BARS)):
+            start = i * bar_width
+            end = (i + 1) * bar_width if i < len(COLOR_BARS) - 1 else width
+            yield i, start, end
+
     def _generate_color_bars(self, total_frames: int) -> Iterator[np.ndarray]:
         """Generate color bars test pattern."""
-        colors = [
-            (255, 255, 255),  # White
-            (255, 255, 0),  # Yellow
-            (0, 255, 255),  # Cyan
-            (0, 255, 0),  # Green
-            (255, 0, 255),  # Magenta
-            (255, 0, 0),  # Red
-            (0, 0, 255),  # Blue
-            (0, 0, 0),  # Black
-        ]
-
-        bar_width = self.config.width // len(colors)
-        frame = np.zeros((self.config.height, self.config.width, 3), dtype=np.uint8)
-
-        for i, color in enumerate(colors):
-            start = i * bar_width
-            end = (i + 1) * bar_width if i < len(colors) - 1 else self.config.width
-            frame[:, start:end] = color
+        frame = self._frame
+
+        for i, start, end in self._bar_bounds(self.config.width):
+            frame[:, start:end] = COLOR_BARS[i]
 
         for _ in range(total_frames):
             yield frame
@@ -86,42 +122,73 @@ class VideoGenerator(SyntheticGenerator):
         y = np.linspace(0, 1, self.config.height)
         xx, yy = np.meshgrid(x, y)
 
+        # The spatial phase is time-invariant, and rolling the sine equals
+        # rolling its phase, so the per-channel shifts are baked into one
+        # static (H, W, 3) phase array; each frame only adds 2*pi*t
+        base = 2 * np.pi * (xx + yy)
+        shift = self.config.width // 3
+        phases = np.stack(
+            [base, np.roll(base, shift), np.roll(base, -shift)], axis=-1
+        ).astype(np.float32)  # Red, Green, Blue
+
+        pattern = np.empty_like(phases)
+        frame = self._frame
         for frame_idx in range(total_frames):
             t = frame_idx / self.config.fps
-            frame = np.zeros((self.config.height, self.config.width, 3), dtype=np.uint8)
 
             # Create moving gradient
-            pattern = np.sin(2 * np.pi * (xx + yy + t))
-            frame[..., 0] = ((pattern + 1) * 127.5).astype(np.uint8)  # Red
-            frame[..., 1] = (
-                (np.roll(pattern, self.config.width // 3) + 1) * 127.5
-            ).astype(np.uint8)  # Green
-            frame[..., 2] = (
-                (np.roll(pattern, -self.config.width // 3) + 1) * 127.5
-            ).astype(np.uint8)  # Blue
+            np.add(phases, np.float32((2 * np.pi * t) % (2 * np.pi)), out=pattern)
+            np.sin(pattern, out=pattern)
+            pattern += 1
+            pattern *= 127.5
+            np.copyto(frame, pattern, casting="unsafe")
 
             yield frame
 
+    def _checkerboard_base(self) -> np.ndarray:
+        """
+        Build the unshifted checkerboard as an (H, W) uint8 array of 0/255.
+
+        A square is white when its row and column tile indices plus the
+        animation offset (in tiles) are odd, so the board only ever takes two
+        states; the base is built once by broadcasting the 0/255 row and
+        column tile parities, entirely in uint8.
+        """
+        height, width = self.config.height, self.config.width
+        rows = ((np.arange(height, dtype=np.int32) // CHECK_SIZE) & 1) * 255
+        cols = ((np.arange(width, dtype=np.int32) // CHECK_SIZE) & 1) * 255
+        return np.bitwise_xor.outer(rows.astype(np.uint8), cols.astype(np.uint8))
+
+    @staticmethod
+    def _checkerboard_phase(frame_idx: int) -> int:
+        """Return whether the board is inverted at a frame (0 or 1)."""
+        offset = frame_idx % (CHECK_SIZE * 2)
+        return (offset // CHECK_SIZE) & 1
+
     def _generate_checkerboard(self, total_frames: int) -> Iterator[np.ndarray]:
         """Generate animated checkerboard pattern."""
-        check_size = 64
+        board = self._checkerboard_base()[..., np.newaxis]
+
+        frame = self._frame
+        phase = None
         for frame_idx in range(total_frames):
-            frame = np.zeros((self.config.height, self.config.width, 3), dtype=np.uint8)
-            offset = frame_idx % (check_size * 2)
+            frame_phase = self._checkerboard_phase(frame_idx)
 
-            for i in range(0, self.config.height, check_size):
-                for j in range(0, self.config.width, check_size):
-                    if ((i + j + offset) // check_size) % 2:
-                        frame[i : i + check_size, j : j + check_size] = 255
+            # Rewrite the buffer only when the board flips
+            if frame_phase != phase:
+                np.bitwise_xor(board, 255 * frame_phase, out=frame)
+                phase = frame_phase
 
             yield frame
 
     def _generate_moving_box(self, total_frames: int) -> Iterator[np.ndarray]:
         """Generate moving box pattern."""
         box_size = 100
-        for frame_idx in range(total_frames):
-            frame = np.zeros((self.config.height, self.config.width, 3), dtype=np.uint8)
+        frame = self._frame
+        frame.fill(0)
+        previous: tuple[int, int] | None = None
 
+        for frame_idx in range(total_frames):
             # Calculate box position
             t = frame_idx / total_frames
             x = int(
@@ -132,31 +199,120 @@ class VideoGenerator(SyntheticGenerator):
                 * (0.5 + 0.5 * math.sin(2 * math.pi * t))
             )
 
+            # Clear the previous box instead of reallocating the frame
+            if previous is not None:
+                px, py = previous
+                frame[py : py + box_size, px : px + box_size] = 0
+
             # Draw box
             frame[y : y + box_size, x : x + box_size] = [255, 0, 0]  # Red box
+            previous = (x, y)
             yield frame
 
     def _generate_pulse(self, total_frames: int) -> Iterator[np.ndarray]:
         """Generate pulsing pattern."""
+        frame = self._frame
         for frame_idx in range(total_frames):
-            t = frame_idx / self.config.fps
-            intensity = int(127.5 * (1 + math.sin(2 * math.pi * t)))
-
-            frame = np.full(
-                (self.config.height, self.config.width, 3), intensity, dtype=np.uint8
-            )
+            frame.fill(self._pulse_intensity(frame_idx))
             yield frame
 
+    def _pulse_intensity(self, frame_idx: int) -> int:
+        """Return the gray level of the pulse pattern at a frame."""
+        t = frame_idx / self.config.fps
+        return int(127.5 * (1 + math.sin(2 * math.pi * t)))
+
+    def _uses_yuv_input(self) -> bool:
+        """
+        Check whether frames can be fed to FFmpeg as yuv420p planes.
+
+        Flat-colored patterns are trivially expressed in YUV, and feeding
+        yuv420p halves the bytes piped per frame and skips FFmpeg's RGB to YUV
+        conversion. This requires yuv420p output and even frame dimensions.
+        """
+        return (
+            self.config.pattern in YUV_PATTERNS
+            and self.config.pixel_format == "yuv420p"
+            and self.config.width % 2 == 0
+            and self.config.height % 2 == 0
+        )
+
+    def _generate_yuv_frames(self) -> Iterator[np.ndarray]:
+        """
+        Generate yuv420p frames for the patterns in ``YUV_PATTERNS``.
+
+        Each frame is one contiguous buffer holding the Y, U and V planes
+        back to back, as FFmpeg's rawvideo demuxer expects. Like the RGB
+        frames, the buffer is reused across iterations.
+        """
+        total_frames = int(self.config.duration * self.config.fps)
+        height, width = self.config.height, self.config.width
+
+        luma_size = height * width
+        chroma_size = luma_size // 4
+        frame = np.empty(luma_size + 2 * chroma_size, dtype=np.uint8)
+        y = frame[:luma_size].reshape(height, width)
+        u = frame[luma_size : luma_size + chroma_size].reshape(height // 2, width // 2)
+        v = frame[luma_size + chroma_size :].reshape(height // 2, width // 2)
+
+        if self.config.pattern == VideoPattern.COLOR_BARS:
+            for i, start, end in self._bar_bounds(width):
+                bar_y, bar_u, bar_v = _rgb_to_yuv(COLOR_BARS[i])
+                y[:, start:end] = bar_y
+                u[:, start // 2 : end // 2] = bar_u
+                v[:, start // 2 : end // 2] = bar_v
+
+            for _ in range(total_frames):
+                yield frame
+
+        elif self.config.pattern == VideoPattern.CHECKERBOARD:
+            # Black and white squares: luma 16/235, neutral chroma
+            board = self._checkerboard_base()
+            np.bitwise_and(board, 219, out=board)
+            board += 16
+            u.fill(128)
+            v.fill(128)
+
+            phase = None
+            for frame_idx in range(total_frames):
+                frame_phase = self._checkerboard_phase(frame_idx)
+                if frame_phase != phase:
+                    if frame_phase:
+                        np.subtract(251, board, out=y)
+                    else:
+                        np.copyto(y, board)
+                    phase = frame_phase
+
+                yield frame
+
+        elif self.config.pattern == VideoPattern.PULSE:
+            # Gray levels only touch luma
+            u.fill(128)
+            v.fill(128)
+            for frame_idx in range(total_frames):
+                intensity = self._pulse_intensity(frame_idx)
+                y.fill(_rgb_to_yuv((intensity, intensity, intensity))[0])
+                yield frame
+
+        else:
+            raise ValueError(f"Pattern {self.config.pattern} has no YUV renderer")
+
     def generate(self, output_path: Path) -> Path:
         """Generate synthetic video file."""
         output_path = Path(output_path)
 
+        if self._uses_yuv_input():
+            input_pix_fmt = "yuv420p"
+            frames = self._generate_yuv_frames()
+        else:
+            input_pix_fmt = "rgb24"
+            frames = self._generate_frames()
+
         # Set up FFmpeg process
         process = (
             ffmpeg.input(
                 "pipe:",
                 format="rawvideo",
-                pix_fmt="rgb24",
+                pix_fmt=input_pix_fmt,
                 s=f"{self.config.width}x{self.config.height}",
                 r=str(self.config.fps),
             )
@@ -172,8 +328,16 @@ class VideoGenerator(SyntheticGenerator):
 
         try:
             # Write frames
-            for frame in self._generate_frames():
-                process.stdin.write(frame.tobytes())
+            if self.config.pattern == VideoPattern.COLOR_BARS:
+                # Static frames leave no rendering to overlap with encoding,
+                # so stream one cached byte view of the frame
+                frame_view = None
+                for frame in frames:
+                    if frame_view is None:
+                        frame_view = _byte_view(frame)
+                    process.stdin.write(frame_view)
+            else:
+                _feed_pipe(process.stdin, frames)
 
             # Close stdin pipe
             process.stdin.close()
@@ -1,21 +1,146 @@
 # src/quackvideo/video/reader.py
 from __future__ import annotations
 
+import io
 import logging
+import queue
+import re
+import subprocess
+import threading
+from collections import deque
 from pathlib import Path
-from typing import Iterator, Sequence
+from typing import Generator, Iterable, Iterator, Sequence
 
+import cv2
 import ffmpeg
 import numpy as np
 from pydantic import BaseModel, Field, field_validator
 
 from quackvideo.core.utils import (
+    PIPE_SIZE,
     FrameComparisonConfig,
     detect_scene_change,
+    map_frames,
+    mean_abs_diff,
+    probe_media,
+    set_pipe_size,
 )
 
 logger = logging.getLogger(__name__)
 
+# Input options that skip FFmpeg's stream analysis at startup; the reader
+# already knows the stream layout from the (cached) probe
+_FAST_INPUT_KWARGS = {"probesize": "32", "analyzeduration": "0", "fflags": "nobuffer"}
+
+# Frame timestamp in the log lines of FFmpeg's showinfo filter
+_SHOWINFO_PTS_TIME = re.compile(r"pts_time:\s*(-?\d+(?:\.\d+)?)")
+
+# Sampling interval (seconds) above which seeking to each timestamp decodes
+# less than streaming the whole range; roughly a few GOPs of typical video
+SPARSE_SAMPLE_INTERVAL = 2.0
+
+# Side length of the luma previews compared by the Python scene detector
+SCENE_PREVIEW_SIZE = 64
+
+# Number of non-showinfo stderr lines kept for error messages
+STDERR_TAIL_LINES = 50
+
+
+def _spawn(
+    stream: ffmpeg.nodes.OutputStream,
+) -> tuple[subprocess.Popen[bytes], io.BufferedReader, io.BufferedReader]:
+    """
+    Start an FFmpeg stream with large pipe buffers on its stdout.
+
+    Both the Python-side buffer and the kernel pipe are sized to
+    ``PIPE_SIZE``, so FFmpeg can run a frame ahead and the reader drains
+    whole frames in a few syscalls instead of one per few scanlines.
+
+    Returns:
+        The process and its stdout and stderr pipes
+    """
+    # The argv is compiled by ffmpeg-python from our own filter graph and
+    # run without a shell
+    process = subprocess.Popen(  # noqa: S603
+        stream.compile(),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        bufsize=PIPE_SIZE,
+    )
+    stdout, stderr = process.stdout, process.stderr
+    # Buffered binary pipes were requested above; this narrows their types
+    if not isinstance(stdout, io.BufferedReader) or not isinstance(
+        stderr, io.BufferedReader
+    ):
+        process.kill()
+        raise RuntimeError("FFmpeg pipes are not buffered binary streams")
+    set_pipe_size(stdout)
+    return process, stdout, stderr
+
+
+def _read_frame(
+    pipe: io.BufferedReader, width: int, height: int, out: np.ndarray | None = None
+) -> np.ndarray | None:
+    """
+    Read one rgb24 frame from a pipe straight into an array.
+
+    ``readinto`` fills the array's memory directly, so no intermediate
+    ``bytes`` object is allocated and copied per frame.
+
+    Args:
+        pipe: Pipe to read from
+        width: Frame width
+        height: Frame height
+        out: Contiguous (height, width, 3) uint8 buffer to reuse; a new array
+            is allocated when omitted
+
+    Returns:
+        The frame, or None at end of stream (including a truncated frame)
+    """
+    frame = np.empty((height, width, 3), dtype=np.uint8) if out is None else out
+    if pipe.readinto(memoryview(frame).cast("B")) < frame.nbytes:
+        return None
+    return frame
+
+
+def _nearest_frames(
+    frames: Iterable[tuple[float, np.ndarray]], timestamps: Iterable[float]
+) -> Iterator[tuple[float, np.ndarray]]:
+    """
+    Pair each timestamp with the nearest of a stream of timed frames.
+
+    Both inputs must be in ascending time order. Each timestamp gets
+    whichever of its two bracketing frames is closer (the earlier one on a
+    tie); timestamps past the last frame get the last frame.
+
+    Raises:
+        LookupError: If timestamps remain but ``frames`` is empty
+    """
+    targets = iter(timestamps)
+    target = next(targets, None)
+    previous: tuple[float, np.ndarray] | None = None
+
+    for frame_time, frame in frames:
+        while target is not None and frame_time >= target:
+            if previous is not None and target - previous[0] <= frame_time - target:
+                yield float(target), previous[1]
+            else:
+                yield float(target), frame
+            target = next(targets, None)
+
+        if target is None:
+            return
+        previous = (frame_time, frame)
+
+    if target is None:
+        return
+    if previous is None:
+        raise LookupError("No frames to sample from")
+    # The stream ended early; the last frame is the nearest
+    yield float(target), previous[1]
+    for ts in targets:
+        yield float(ts), previous[1]
+
 
 class VideoMetadata(BaseModel):
     """Video metadata information."""
@@ -52,6 +177,30 @@ class VideoReaderConfig(BaseModel):
     )
     skip_validation: bool = Field(default=False, description="Skip input validation")
     force_fps: bool = Field(default=False, description="Force exact FPS")
+    threads: int = Field(
+        default=0, description="Decoder threads (0 lets FFmpeg decide)"
+    )
+    fast_probe: bool = Field(
+        default=True,
+        description=(
+            "Skip FFmpeg's input analysis on each decode; disable for "
+            "containers whose headers lack stream parameters (e.g. MPEG-TS)"
+        ),
+    )
+    max_workers: int | None = Field(
+        default=None,
+        description=(
+            "Concurrent FFmpeg processes for per-timestamp extraction "
+            "(defaults to CPU count)"
+        ),
+    )
+    force_python_scene: bool = Field(
+        default=False,
+        description=(
+            "Detect scene changes by comparing decoded frames in Python "
+            "instead of with FFmpeg's scene filter"
+        ),
+    )
 
     @field_validator("fps")
     def validate_fps(cls, v: float | None) -> float | None:
@@ -79,6 +228,18 @@ class VideoReaderConfig(BaseModel):
             raise ValueError("Resolution dimensions must be positive")
         return v
 
+    @field_validator("threads")
+    def validate_threads(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError("Thread count must be non-negative")
+        return v
+
+    @field_validator("max_workers")
+    def validate_max_workers(cls, v: int | None) -> int | None:
+        if v is not None and v <= 0:
+            raise ValueError("max_workers must be positive")
+        return v
+
 
 class VideoReader:
     """High-level interface for reading video files using ffmpeg-python."""
@@ -89,6 +250,7 @@ class VideoReader:
         config: VideoReaderConfig | None = None,
         *,
         skip_validation: bool = False,
+        _metadata: VideoMetadata | None = None,
     ) -> None:
         self.video_path = Path(video_path)
         self.config = config or VideoReaderConfig(skip_validation=skip_validation)
@@ -96,12 +258,13 @@ class VideoReader:
         if not skip_validation and not self.video_path.exists():
             raise FileNotFoundError(f"Video file not found: {self.video_path}")
 
-        self._metadata = self._load_metadata()
+        # Readers derived from an existing one reuse its metadata
+        self._metadata = _metadata or self._load_metadata()
 
     def _load_metadata(self) -> VideoMetadata:
-        """Load video metadata using ffmpeg-python's probe."""
+        """Load video metadata from the (cached) ffprobe result."""
         try:
-            probe = ffmpeg.probe(str(self.video_path))
+            probe = probe_media(self.video_path)
             video_stream = next(
                 (
                     stream
@@ -136,9 +299,36 @@ class VideoReader:
         """Get video metadata."""
         return self._metadata
 
-    def read_frames(self) -> Iterator[np.ndarray]:
-        """Read video frames according to configuration."""
-        stream = ffmpeg.input(str(self.video_path))
+    def _input_kwargs(self) -> dict[str, object]:
+        """Get input-side FFmpeg options shared by all decode paths."""
+        kwargs: dict[str, object] = (
+            dict(_FAST_INPUT_KWARGS) if self.config.fast_probe else {}
+        )
+        if self.config.threads > 0:
+            # Slice threading parallelizes within a frame without the
+            # latency (and instability) of frame threading
+            kwargs.update(threads=self.config.threads, thread_type="slice")
+        return kwargs
+
+    def read_frames(self, *, ring_size: int = 0) -> Iterator[np.ndarray]:
+        """
+        Read video frames according to configuration.
+
+        By default every frame is a new array. With ``ring_size=N`` frames are
+        read into N preallocated buffers that are reused in turn, so no memory
+        is allocated per frame but a yielded frame is only valid until N more
+        frames have been read; copy it to keep it longer.
+
+        Args:
+            ring_size: Number of reused frame buffers (0 allocates per frame)
+
+        Yields:
+            Frames (HxWx3)
+        """
+        if ring_size < 0:
+            raise ValueError("ring_size must be non-negative")
+
+        stream = ffmpeg.input(str(self.video_path), **self._input_kwargs())
 
         if self.config.start_time is not None:
             stream = stream.filter("setpts", f"PTS-{self.config.start_time}/TB")
@@ -159,8 +349,8 @@ class VideoReader:
             "pipe:", format="rawvideo", pix_fmt="rgb24"
         ).overwrite_output()
 
+        process, stdout, stderr = _spawn(stream)
         try:
-            process = stream.run_async(pipe_stdout=True, pipe_stderr=True)
             width = (
                 self.config.resolution[0]
                 if self.config.resolution
@@ -172,48 +362,126 @@ class VideoReader:
                 else self.metadata.height
             )
 
+            ring = [np.empty((height, width, 3), np.uint8) for _ in range(ring_size)]
+            frame_index = 0
             while True:
-                in_bytes = process.stdout.read(width * height * 3)
-                if not in_bytes:
+                out = ring[frame_index % ring_size] if ring else None
+                frame = _read_frame(stdout, width, height, out)
+                if frame is None:
                     break
-                yield np.frombuffer(in_bytes, np.uint8).reshape((height, width, 3))
+                yield frame
+                frame_index += 1
 
             process.wait()
             if process.returncode != 0:
-                error = process.stderr.read().decode()
+                error = stderr.read().decode()
                 raise RuntimeError(f"FFmpeg process failed: {error}")
 
         except Exception as e:
             logger.error(f"Error reading frames: {e}")
             raise
         finally:
-            try:
-                process.stdout.close()
-                process.stderr.close()
-                if process.poll() is None:
-                    process.terminate()
-            except Exception:
-                pass
+            stdout.close()
+            stderr.close()
+            if process.poll() is None:
+                process.terminate()
+                process.wait()
+
+    def _read_frames_stream(
+        self, start_time: float, end_time: float
+    ) -> Generator[tuple[float, np.ndarray], None, None]:
+        """
+        Decode every frame in a time range from a single FFmpeg process.
+
+        The input is seeked to ``start_time`` and decoding stops at
+        ``end_time`` (plus one frame, so the end timestamp has a neighbor).
+        Timestamps are the frames' own presentation times from showinfo, so
+        they stay correct for variable frame rate input and when the first
+        decoded frame is not exactly at ``start_time``.
+
+        Args:
+            start_time: Start time in seconds
+            end_time: End time in seconds
+
+        Yields:
+            Tuples of (timestamp, frame) for each decoded frame
+        """
+        frame_duration = 1.0 / self.metadata.fps
+        stream = (
+            ffmpeg.input(
+                str(self.video_path),
+                ss=start_time,
+                t=end_time - start_time + frame_duration,
+                **self._input_kwargs(),
+            )
+            .filter("showinfo")
+            .output("pipe:", format="rawvideo", pix_fmt="rgb24", vsync="vfr")
+            .global_args("-nostats")
+            .overwrite_output()
+        )
+
+        try:
+            # Input seeking restarts timestamps at zero from the seek point
+            for pts_time, frame in self._read_timed_frames(
+                stream, self.metadata.width, self.metadata.height
+            ):
+                yield start_time + pts_time, frame
+        except Exception as e:
+            logger.error(f"Error reading frame range: {e}")
+            raise
 
     def extract_frames_range(
         self, start_time: float, end_time: float, *, frame_count: int | None = None
     ) -> Iterator[tuple[float, np.ndarray]]:
-        """Extract frames within a specific time range."""
+        """
+        Extract frames within a specific time range.
+
+        With ``frame_count``, that many evenly spaced timestamps are sampled.
+        Dense samples come from one seek-and-decode pass, where each timestamp
+        gets the decoded frame nearest to it; samples further apart than
+        ``SPARSE_SAMPLE_INTERVAL`` are instead seeked to individually and in
+        parallel, which skips decoding the frames in between.
+        """
+        if start_time < 0:
+            raise ValueError("start_time must be non-negative")
         if end_time <= start_time:
             raise ValueError("end_time must be greater than start_time")
 
+        if (
+            frame_count is not None
+            and frame_count > 1
+            and (end_time - start_time) / (frame_count - 1) > SPARSE_SAMPLE_INTERVAL
+        ):
+            sample_times = np.linspace(start_time, end_time, frame_count).tolist()
+            yield from zip(
+                sample_times, self.extract_frames_at(sample_times), strict=True
+            )
+            return
+
         if frame_count is not None:
-            timestamps = np.linspace(start_time, end_time, frame_count)
-            for ts in timestamps:
-                yield float(ts), self.extract_frame_at(ts)
+            frames = self._read_frames_stream(start_time, end_time)
+            timestamps = np.linspace(start_time, end_time, frame_count).tolist()
+            try:
+                yield from _nearest_frames(frames, timestamps)
+            except LookupError:
+                raise RuntimeError(
+                    f"No frames decoded between {start_time}s and {end_time}s"
+                ) from None
+            finally:
+                frames.close()
         else:
-            config = VideoReaderConfig(
-                start_time=start_time,
-                end_time=end_time,
-                resolution=self.config.resolution,
-                skip_validation=True,
+            # model_copy skips validation; these values are already checked
+            config = self.config.model_copy(
+                update={
+                    "fps": None,
+                    "start_time": start_time,
+                    "end_time": end_time,
+                    "skip_validation": True,
+                }
+            )
+            reader = VideoReader(
+                self.video_path, config, skip_validation=True, _metadata=self.metadata
             )
-            reader = VideoReader(self.video_path, config, skip_validation=True)
 
             frame_duration = 1.0 / reader.metadata.fps
             current_time = start_time
@@ -223,74 +491,241 @@ class VideoReader:
                 current_time += frame_duration
 
     def extract_keyframes(self) -> Iterator[tuple[float, np.ndarray]]:
-        """Extract keyframes from the video."""
-        try:
-            probe = ffmpeg.probe(str(self.video_path))
-            stream = (
-                ffmpeg.input(str(self.video_path))
-                .filter("select", "key")
-                .output("pipe:", format="rawvideo", pix_fmt="rgb24")
-                .overwrite_output()
-            )
+        """
+        Extract keyframes from the video in a single pass.
 
-            process = stream.run_async(pipe_stdout=True, pipe_stderr=True)
-            width = self.metadata.width
-            height = self.metadata.height
+        The decoder skips every non-key frame (``-skip_frame nokey``), so only
+        keyframes are decoded at all; the select filter guards against
+        decoders that ignore the hint, and timestamps are the keyframes' own
+        presentation times reported by showinfo.
 
-            frame_size = width * height * 3
-            timestamp = 0.0
-
-            while True:
-                in_bytes = process.stdout.read(frame_size)
-                if not in_bytes:
-                    break
-                frame = np.frombuffer(in_bytes, np.uint8).reshape((height, width, 3))
-                yield timestamp, frame
-                timestamp += 1.0 / self.metadata.fps
-
-            process.wait()
-            if process.returncode != 0:
-                error = process.stderr.read().decode()
-                raise RuntimeError(f"FFmpeg process failed: {error}")
+        Yields:
+            Tuples of (timestamp, frame)
+        """
+        stream = (
+            ffmpeg.input(
+                str(self.video_path), skip_frame="nokey", **self._input_kwargs()
+            )
+            .filter("select", "eq(pict_type,I)")
+            .filter("showinfo")
+            .output("pipe:", format="rawvideo", pix_fmt="rgb24", vsync="vfr")
+            .global_args("-nostats")
+            .overwrite_output()
+        )
 
+        try:
+            yield from self._read_timed_frames(
+                stream, self.metadata.width, self.metadata.height
+            )
         except Exception as e:
             logger.error(f"Error extracting keyframes: {e}")
             raise
 
     def extract_scene_changes(
-        self, threshold: float = 0.3
+        self, threshold: float = 0.3, *, preview_size: int | None = SCENE_PREVIEW_SIZE
     ) -> Iterator[tuple[float, np.ndarray]]:
-        """Extract frames at scene changes."""
-        config = FrameComparisonConfig(threshold=threshold)
-        frames = list(self.read_frames())
+        """
+        Extract frames at scene changes.
+
+        By default detection runs inside FFmpeg's ``select`` filter on its
+        scene score (0-1), so only the scene-change frames are decoded into
+        the pipe and timestamps are the frames' own, from the start of the
+        video. With ``force_python_scene`` every frame is streamed and
+        compared pairwise; only the previous frame's preview is held in
+        memory regardless of video length.
+
+        Args:
+            threshold: Scene change threshold (0-1)
+            preview_size: Python path only; frames are compared as
+                area-downsampled ``preview_size`` square luma previews by
+                their mean absolute difference, a cache-resident uint8 SAD.
+                None compares full-resolution RGB with ``detect_scene_change``
+
+        Yields:
+            Tuples of (timestamp, frame) for frames that start a new scene
+        """
+        if preview_size is not None and preview_size <= 0:
+            raise ValueError("preview_size must be positive")
+
+        if not self.config.force_python_scene:
+            yield from self._select_scene_changes(threshold)
+            return
+
+        frames = self.read_frames()
+        first = next(frames, None)
+        if first is None:
+            return
 
-        if not frames:
+        if preview_size is None:
+            config = FrameComparisonConfig(threshold=threshold)
+            prev_frame = first
+            for i, frame in enumerate(frames, start=1):
+                if detect_scene_change(prev_frame, frame, config=config):
+                    yield i / self.metadata.fps, frame
+                prev_frame = frame
             return
 
-        prev_frame = frames[0]
-        for i, frame in enumerate(frames[1:]):
-            if detect_scene_change(prev_frame, frame, config=config):
-                timestamp = (i + 1) / self.metadata.fps
-                yield timestamp, frame
-            prev_frame = frame
+        def _preview(frame: np.ndarray) -> np.ndarray:
+            # Area-resize first so the color conversion only touches the
+            # small image
+            small = cv2.resize(
+                frame, (preview_size, preview_size), interpolation=cv2.INTER_AREA
+            )
+            return cv2.cvtColor(small, cv2.COLOR_RGB2GRAY)
+
+        # Compare the mean absolute difference in raw uint8 units
+        sad_threshold = threshold * 255
+        prev_preview = _preview(first)
+        for i, frame in enumerate(frames, start=1):
+            preview = _preview(frame)
+            if mean_abs_diff(prev_preview, preview) > sad_threshold:
+                yield i / self.metadata.fps, frame
+            prev_preview = preview
+
+    def _select_scene_changes(
+        self, threshold: float
+    ) -> Iterator[tuple[float, np.ndarray]]:
+        """Let FFmpeg's scene filter pick frames; see ``extract_scene_changes``."""
+        input_kwargs = self._input_kwargs()
+        start_time = self.config.start_time or 0.0
+        if self.config.start_time is not None:
+            input_kwargs["ss"] = start_time
+        if self.config.end_time is not None:
+            input_kwargs["t"] = self.config.end_time - start_time
+
+        stream = ffmpeg.input(str(self.video_path), **input_kwargs)
+        if self.config.fps is not None:
+            stream = stream.filter("fps", fps=self.config.fps)
+        stream = stream.filter("select", f"gt(scene,{threshold})").filter("showinfo")
+
+        width, height = self.metadata.width, self.metadata.height
+        if self.config.resolution is not None:
+            width, height = self.config.resolution
+            stream = stream.filter("scale", width, height)
+
+        stream = (
+            stream.output("pipe:", format="rawvideo", pix_fmt="rgb24", vsync="vfr")
+            .global_args("-nostats")
+            .overwrite_output()
+        )
+
+        for pts_time, frame in self._read_timed_frames(stream, width, height):
+            yield start_time + pts_time, frame
+
+    def _read_timed_frames(
+        self, stream: ffmpeg.nodes.OutputStream, width: int, height: int
+    ) -> Iterator[tuple[float, np.ndarray]]:
+        """
+        Run a stream ending in a ``showinfo`` filter and pair frames with times.
+
+        showinfo logs each frame's ``pts_time`` on stderr; a thread drains
+        stderr while frames are read from stdout, so neither pipe can fill up
+        and stall FFmpeg.
+
+        Yields:
+            Tuples of (pts_time, frame) in output order
+        """
+        process, stdout, stderr = _spawn(stream)
+        pts_times: queue.Queue[float | None] = queue.Queue()
+        stderr_tail: deque[str] = deque(maxlen=STDERR_TAIL_LINES)
+
+        def _drain() -> None:
+            for raw_line in stderr:
+                line = raw_line.decode(errors="replace")
+                match = _SHOWINFO_PTS_TIME.search(line)
+                if match and "showinfo" in line:
+                    pts_times.put(float(match.group(1)))
+                else:
+                    stderr_tail.append(line)
+            pts_times.put(None)
+
+        drain = threading.Thread(target=_drain, daemon=True)
+        drain.start()
+
+        try:
+            while (frame := _read_frame(stdout, width, height)) is not None:
+                pts_time = pts_times.get()
+                if pts_time is None:
+                    raise RuntimeError("FFmpeg output a frame without a timestamp")
+                yield pts_time, frame
+
+            process.wait()
+            drain.join()
+            if process.returncode != 0:
+                error = "".join(stderr_tail)
+                raise RuntimeError(f"FFmpeg process failed: {error}")
+
+        except Exception as e:
+            logger.error(f"Error reading frames: {e}")
+            raise
+        finally:
+            stdout.close()
+            if process.poll() is None:
+                process.terminate()
+                # Reap the process so an early close leaves no zombie
+                process.wait()
+            drain.join()
+            stderr.close()
+
+    def extract_frames_at(self, timestamps: Iterable[float]) -> Iterator[np.ndarray]:
+        """
+        Extract single frames at several timestamps concurrently.
+
+        Each timestamp is an independent seek in its own FFmpeg process, and
+        the threads only wait on those processes, so up to
+        ``config.max_workers`` decodes run in parallel; at most twice that
+        many frames are in flight.
+
+        Args:
+            timestamps: Timestamps in seconds
+
+        Yields:
+            Frames in the order of ``timestamps``
+        """
+        yield from map_frames(
+            self.extract_frame_at, timestamps, max_workers=self.config.max_workers
+        )
 
-    def extract_frame_at(self, timestamp: float) -> np.ndarray:
-        """Extract a single frame at the specified timestamp."""
+    def extract_frame_at(self, timestamp: float, *, exact: bool = True) -> np.ndarray:
+        """
+        Extract a single frame at the specified timestamp.
+
+        The input is seeked directly to ``timestamp`` and exactly one frame
+        is decoded into the pipe. FFmpeg starts decoding at the preceding
+        keyframe and, when ``exact``, discards frames up to the timestamp so
+        the returned frame is the one shown at that time. With
+        ``exact=False`` the seek snaps to that keyframe and returns it, which
+        skips decoding the rest of the GOP.
+
+        Args:
+            timestamp: Timestamp in seconds
+            exact: Whether to return the exact frame rather than the
+                preceding keyframe
+
+        Returns:
+            Frame (HxWx3)
+        """
         if timestamp < 0:
             raise ValueError("Timestamp must be non-negative")
 
+        input_kwargs = self._input_kwargs()
+        if not exact:
+            input_kwargs["noaccurate_seek"] = None
+
         stream = (
-            ffmpeg.input(str(self.video_path), ss=timestamp)
+            ffmpeg.input(str(self.video_path), ss=timestamp, **input_kwargs)
             .output("pipe:", format="rawvideo", pix_fmt="rgb24", vframes=1)
             .overwrite_output()
         )
 
         try:
             out, _ = stream.run(capture_stdout=True, capture_stderr=True)
-            return np.frombuffer(out, np.uint8).reshape(
-                (self.metadata.height, self.metadata.width, 3)
-            )
         except ffmpeg.Error as e:
             raise RuntimeError(
                 f"Failed to extract frame: {e.stderr.decode() if e.stderr else str(e)}"
             )
+
+        shape = (self.metadata.height, self.metadata.width, 3)
+        if len(out) < np.prod(shape):
+            raise RuntimeError(f"No frame decoded at {timestamp}s")
+        return np.frombuffer(out, np.uint8).reshape(shape)
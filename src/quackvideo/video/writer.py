@@ -13,6 +13,11 @@ from tqdm import tqdm
 logger = logging.getLogger(__name__)
 
 
+def _frame_view(frame: np.ndarray) -> memoryview:
+    """Return a flat byte view of a frame so it can be piped without a copy."""
+    return memoryview(np.ascontiguousarray(frame)).cast("B")
+
+
 class VideoEncodingPreset(str):
     """FFmpeg encoding presets."""
 
@@ -148,7 +153,7 @@ class VideoWriter:
                             f"got {frame.shape[:2]}"
                         )
 
-                    process.stdin.write(frame.tobytes())
+                    process.stdin.write(_frame_view(frame))
                     pbar.update(1)
 
             # Close input pipe and wait for FFmpeg
@@ -229,7 +234,7 @@ class VideoWriter:
             process = stream.run_async(pipe_stdin=True, pipe_stderr=True)
 
             # Write first frame
-            process.stdin.write(first_frame.tobytes())
+            process.stdin.write(_frame_view(first_frame))
             frame_count += 1
 
             # Write remaining frames
@@ -240,7 +245,7 @@ class VideoWriter:
                         f"got {frame.shape[:2]}"
                     )
 
-                process.stdin.write(frame.tobytes())
+                process.stdin.write(_frame_view(frame))
                 frame_count += 1
 
             # Close input pipe and wait for FFmpeg
@@ -0,0 +1,179 @@
+# tests/core/test_frame_analysis.py
+
+import time
+
+import numpy as np
+import pytest
+
+from quackvideo.core.utils import (
+    ComparisonMethod,
+    FeatureExtractionMethod,
+    FeatureExtractor,
+    FrameComparisonConfig,
+    _feature_distance,
+    _normalize_features,
+    _ssim_uint8,
+    calculate_frame_difference,
+    find_similar_frames,
+    map_frames,
+)
+
+
+def _flat_frame(value, shape=(24, 32, 3)):
+    return np.full(shape, value, dtype=np.uint8)
+
+
+def _float_ssim(a, b):
+    """
+    Reference global SSIM on [0, 1] scaled frames.
+    """
+    a = a.astype(np.float64) / 255.0
+    b = b.astype(np.float64) / 255.0
+    c1, c2 = 0.01**2, 0.03**2
+    mu1, mu2 = a.mean(), b.mean()
+    cov = np.mean((a - mu1) * (b - mu2))
+    return ((2 * mu1 * mu2 + c1) * (2 * cov + c2)) / (
+        (mu1**2 + mu2**2 + c1) * (a.var() + b.var() + c2)
+    )
+
+
+def test_ssim_uint8_matches_float_reference():
+    """
+    The norm-based uint8 SSIM agrees with the float formula.
+    """
+    rng = np.random.default_rng(0)
+    a = rng.integers(0, 256, (48, 64, 3), dtype=np.uint8)
+    noise = rng.integers(-20, 21, a.shape)
+    b = np.clip(a.astype(np.int64) + noise, 0, 255).astype(np.uint8)
+
+    assert _ssim_uint8(a, b) == pytest.approx(_float_ssim(a, b), abs=1e-9)
+    assert _ssim_uint8(a, a) == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize("method", list(ComparisonMethod))
+def test_frame_difference_uint8_matches_float_path(method):
+    """
+    uint8 fast paths return the same scores as the float fallback.
+    """
+    rng = np.random.default_rng(1)
+    a = rng.integers(0, 256, (16, 16, 3), dtype=np.uint8)
+    b = rng.integers(0, 256, (16, 16, 3), dtype=np.uint8)
+
+    fast = calculate_frame_difference(a, b, method)
+    slow = calculate_frame_difference(a.astype(np.int64), b.astype(np.int64), method)
+    assert fast == pytest.approx(slow, abs=1e-6)
+
+
+@pytest.mark.parametrize("method", list(ComparisonMethod))
+def test_feature_distance_matches_row_by_row(method):
+    """
+    Batched feature distances equal per-row frame differences.
+    """
+    rng = np.random.default_rng(2)
+    target = rng.random(12)
+    features = rng.random((5, 12))
+
+    batched = _feature_distance(features, target, method)
+    for row, score in zip(features, batched, strict=True):
+        expected = calculate_frame_difference(
+            (target * 255).reshape(1, -1), (row * 255).reshape(1, -1), method
+        )
+        assert score == pytest.approx(expected, abs=1e-6)
+
+
+def test_feature_distance_ssim_is_intensity_sensitive():
+    """
+    Unlike cosine distance, SSIM separates vectors that differ only in scale.
+    """
+    target = np.array([0.4, 0.4, 0.4])
+    features = np.stack([target, target * 0.5, target * 0.1])
+
+    scores = _feature_distance(features, target, ComparisonMethod.SSIM)
+    assert scores[0] == pytest.approx(0.0)
+    assert 0 < scores[1] < scores[2]
+
+
+def test_normalize_histogram_by_pixel_count():
+    """
+    Histograms of the same content at different resolutions normalize equal.
+    """
+    extractor = FeatureExtractor(method=FeatureExtractionMethod.HISTOGRAM, bins=8)
+    small = _normalize_features(
+        extractor.extract(_flat_frame(100, (10, 10, 3))), extractor.method
+    )
+    large = _normalize_features(
+        extractor.extract(_flat_frame(100, (40, 40, 3))), extractor.method
+    )
+    np.testing.assert_allclose(small, large)
+    assert small.sum() == pytest.approx(3.0)
+
+
+@pytest.mark.parametrize("method", list(ComparisonMethod))
+def test_find_similar_frames_grades_average_color(method):
+    """
+    Flat frames near the target all match, with scores growing with distance.
+    """
+    target = _flat_frame(100)
+    frames = [(float(d), _flat_frame(100 + d)) for d in (0, 2, 5, 20)]
+
+    matches = list(
+        find_similar_frames(
+            target,
+            iter(frames),
+            FrameComparisonConfig(method=method, threshold=0.3),
+            FeatureExtractor(method=FeatureExtractionMethod.AVERAGE_COLOR),
+        )
+    )
+
+    assert [timestamp for timestamp, _, _ in matches] == [0.0, 2.0, 5.0, 20.0]
+    scores = [score for _, _, score in matches]
+    assert scores[0] == pytest.approx(0.0)
+    assert scores == sorted(scores)
+    assert scores[1] < scores[3]
+
+
+def test_find_similar_frames_rejects_distant_frames():
+    """
+    A black frame is not similar to a white target.
+    """
+    matches = list(
+        find_similar_frames(
+            _flat_frame(255),
+            iter([(0.0, _flat_frame(0)), (1.0, _flat_frame(250))]),
+            FrameComparisonConfig(method=ComparisonMethod.MSE, threshold=0.3),
+            FeatureExtractor(method=FeatureExtractionMethod.AVERAGE_COLOR),
+        )
+    )
+    assert [timestamp for timestamp, _, _ in matches] == [1.0]
+
+
+def test_map_frames_preserves_order():
+    """
+    Results come back in input order even when workers finish out of order.
+    """
+    delays = np.random.default_rng(3).uniform(0, 0.005, 50)
+
+    def work(index):
+        time.sleep(delays[index])
+        return index * 2
+
+    results = list(map_frames(work, range(50), max_workers=8, max_pending=4))
+    assert results == [index * 2 for index in range(50)]
+
+
+def test_map_frames_bounds_items_in_flight():
+    """
+    No more than max_pending items are taken from the input ahead of results.
+    """
+    pulled = 0
+
+    def source():
+        nonlocal pulled
+        for index in range(20):
+            pulled += 1
+            yield index
+
+    results = map_frames(lambda x: x, source(), max_workers=2, max_pending=3)
+    assert next(results) == 0
+    assert pulled <= 4
+    assert list(results) == list(range(1, 20))
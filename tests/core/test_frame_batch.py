@@ -0,0 +1,70 @@
+# tests/core/test_frame_batch.py
+
+from pathlib import Path
+
+import pytest
+
+from quackvideo.core.ffmpeg import FFmpegWrapper
+
+
+@pytest.fixture
+def decoders(monkeypatch):
+    """
+    Replace extract_frames with fake decoders that log their lifecycle.
+    """
+    events = []
+    frame_counts = {"a.mp4": 2, "empty.mp4": 0, "b.mp4": 3}
+
+    def fake_extract_frames(path, **kwargs):
+        events.append(("start", path.name))
+        try:
+            for index in range(frame_counts[path.name]):
+                yield f"{path.stem}{index}"
+        finally:
+            events.append(("close", path.name))
+
+    monkeypatch.setattr(FFmpegWrapper, "extract_frames", fake_extract_frames)
+    return events
+
+
+def test_batch_yields_frames_in_video_order(decoders):
+    """
+    Frames come out per video in order; videos without frames are skipped.
+    """
+    frames = list(FFmpegWrapper.extract_frames_batch(["a.mp4", "empty.mp4", "b.mp4"]))
+
+    assert frames == [
+        (Path("a.mp4"), "a0"),
+        (Path("a.mp4"), "a1"),
+        (Path("b.mp4"), "b0"),
+        (Path("b.mp4"), "b1"),
+        (Path("b.mp4"), "b2"),
+    ]
+    assert [name for event, name in decoders if event == "start"] == [
+        "a.mp4",
+        "empty.mp4",
+        "b.mp4",
+    ]
+
+
+def test_batch_early_close_closes_started_decoders(decoders):
+    """
+    Stopping early closes the current decoder and any started ahead.
+    """
+    frames = FFmpegWrapper.extract_frames_batch(["a.mp4", "b.mp4"])
+    assert next(frames) == (Path("a.mp4"), "a0")
+    frames.close()
+
+    started = {name for event, name in decoders if event == "start"}
+    closed = {name for event, name in decoders if event == "close"}
+    # The next decoder may or may not have started before it was cancelled
+    assert "a.mp4" in started
+    assert closed == started
+
+
+def test_batch_of_nothing(decoders):
+    """
+    No videos, no frames and no decoders.
+    """
+    assert list(FFmpegWrapper.extract_frames_batch([])) == []
+    assert decoders == []
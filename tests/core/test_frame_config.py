@@ -0,0 +1,42 @@
+# tests/core/test_frame_config.py
+
+import hashlib
+
+import pytest
+from pydantic import ValidationError
+
+from quackvideo.core.operations.models import FrameExtractionConfig
+
+
+@pytest.mark.parametrize("algo", ["sha256", "blake2b", "sha3_256", "md5"])
+def test_hash_algo_accepts_fixed_size_digests(algo):
+    """
+    Any hashlib algorithm with a fixed digest size is accepted.
+    """
+    if algo not in hashlib.algorithms_available:
+        pytest.skip(f"{algo} not available in this hashlib")
+    assert FrameExtractionConfig(hash_algo=algo).hash_algo == algo
+
+
+def test_hash_algo_defaults_to_sha256():
+    """
+    Stored hashes stay comparable with older output by default.
+    """
+    assert FrameExtractionConfig().hash_algo == "sha256"
+
+
+@pytest.mark.parametrize("algo", ["shake_128", "shake_256"])
+def test_hash_algo_rejects_variable_length_digests(algo):
+    """
+    shake_* needs a digest length, which frame hashing never passes.
+    """
+    with pytest.raises(ValidationError, match="fixed digest size"):
+        FrameExtractionConfig(hash_algo=algo)
+
+
+def test_hash_algo_rejects_unknown_algorithm():
+    """
+    Names hashlib does not know are rejected up front.
+    """
+    with pytest.raises(ValidationError, match="Unsupported hash algorithm"):
+        FrameExtractionConfig(hash_algo="not-a-hash")
@@ -0,0 +1,62 @@
+# tests/core/test_pipe_frames.py
+
+import sys
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from quackvideo.core.ffmpeg import FFmpegError, FFmpegWrapper
+
+
+def _command(script):
+    """
+    Stand in for an FFmpegCommand with a Python process writing to the pipes.
+    """
+    return SimpleNamespace(compile_args=lambda: [sys.executable, "-c", script])
+
+
+def _buffers(index):
+    return np.empty((2, 2, 3), np.uint8)
+
+
+def test_pipe_frames_reads_whole_frames():
+    """
+    Each full frame is read into a buffer; a trailing partial frame is dropped.
+    """
+    script = "import sys; sys.stdout.buffer.write(bytes(range(24)) + b'xx')"
+    frames = [
+        frame.copy()
+        for frame in FFmpegWrapper._pipe_frames(_command(script), 10, _buffers)
+    ]
+
+    assert len(frames) == 2
+    assert frames[1].tobytes() == bytes(range(12, 24))
+
+
+def test_pipe_frames_reports_process_failure_once():
+    """
+    A failing process raises FFmpegError with its stderr, wrapped only once.
+    """
+    script = "import sys; sys.stderr.write('bad input'); sys.exit(1)"
+    with pytest.raises(FFmpegError) as excinfo:
+        list(FFmpegWrapper._pipe_frames(_command(script), 10, _buffers))
+
+    message = str(excinfo.value)
+    assert message.startswith("FFmpeg process failed:")
+    assert "bad input" in message
+    assert "Frame extraction failed" not in message
+
+
+def test_pipe_frames_chains_other_errors():
+    """
+    Errors from the buffer provider are wrapped with their cause attached.
+    """
+    script = "import sys; sys.stdout.buffer.write(bytes(24))"
+
+    def failing_buffers(index):
+        raise ValueError("no buffer")
+
+    with pytest.raises(FFmpegError, match="Frame extraction failed: no buffer") as e:
+        list(FFmpegWrapper._pipe_frames(_command(script), 10, failing_buffers))
+    assert isinstance(e.value.__cause__, ValueError)
@@ -0,0 +1,125 @@
+# tests/core/test_probe_cache.py
+
+import os
+
+import pytest
+
+from quackvideo.core import utils
+
+
+@pytest.fixture
+def probes(monkeypatch):
+    """
+    Record ffprobe calls instead of running ffprobe.
+    """
+    calls = []
+
+    def fake_probe(path):
+        calls.append(path)
+        return {"format": {"duration": "1.0"}, "streams": [], "call": len(calls)}
+
+    monkeypatch.setattr(utils.ffmpeg, "probe", fake_probe)
+    utils._probe_cached.cache_clear()
+    yield calls
+    utils._probe_cached.cache_clear()
+
+
+@pytest.fixture
+def media(tmp_path):
+    path = tmp_path / "clip.mp4"
+    path.write_bytes(b"not really a video")
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+    return path
+
+
+def test_probe_is_reused_until_file_changes(probes, media, monkeypatch):
+    """
+    The in-memory cache serves a file version once; a new version reprobes.
+    """
+    monkeypatch.setattr(utils, "PROBE_CACHE_DIR", None)
+
+    first = utils.probe_media(media)
+    assert utils.probe_media(str(media)) is first
+    assert len(probes) == 1
+
+    os.utime(media, ns=(2_000_000_000, 2_000_000_000))
+    assert utils.probe_media(media)["call"] == 2
+
+
+def test_disk_cache_is_off_by_default(probes, media, monkeypatch, tmp_path):
+    """
+    Without a cache directory nothing is written to disk.
+    """
+    monkeypatch.setattr(utils, "PROBE_CACHE_DIR", None)
+    before = set(tmp_path.rglob("*"))
+    utils.probe_media(media)
+    assert set(tmp_path.rglob("*")) == before
+
+
+def test_disk_cache_survives_process_cache(probes, media, monkeypatch, tmp_path):
+    """
+    A result persisted on disk is reused after the in-memory cache is gone.
+    """
+    cache_dir = tmp_path / "cache" / "probe"
+    monkeypatch.setattr(utils, "PROBE_CACHE_DIR", cache_dir)
+
+    first = utils.probe_media(media)
+    assert len(list(cache_dir.glob("*.json"))) == 1
+    assert not list(cache_dir.glob("*.tmp"))
+
+    # Simulate a new process
+    utils._probe_cached.cache_clear()
+    assert utils.probe_media(media) == first
+    assert len(probes) == 1
+
+
+def test_disk_cache_keys_on_file_version(probes, media, monkeypatch, tmp_path):
+    """
+    A modified file gets a new entry instead of a stale hit.
+    """
+    cache_dir = tmp_path / "probe"
+    monkeypatch.setattr(utils, "PROBE_CACHE_DIR", cache_dir)
+
+    utils.probe_media(media)
+    media.write_bytes(b"a different video")
+    utils._probe_cached.cache_clear()
+
+    assert utils.probe_media(media)["call"] == 2
+    assert len(list(cache_dir.glob("*.json"))) == 2
+
+
+def test_prune_keeps_newest_entries(tmp_path, monkeypatch):
+    """
+    Pruning removes the oldest entries beyond PROBE_CACHE_MAX_ENTRIES.
+    """
+    monkeypatch.setattr(utils, "PROBE_CACHE_MAX_ENTRIES", 2)
+    for i in range(4):
+        entry = tmp_path / f"{i}.json"
+        entry.write_text("{}")
+        os.utime(entry, ns=(i * 1_000_000_000, i * 1_000_000_000))
+    other = tmp_path / "notes.txt"
+    other.write_text("kept")
+
+    utils._prune_probe_cache(tmp_path)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "2.json",
+        "3.json",
+        "notes.txt",
+    ]
+
+
+def test_disk_cache_is_capped(probes, monkeypatch, tmp_path):
+    """
+    Writing new entries prunes the directory to PROBE_CACHE_MAX_ENTRIES.
+    """
+    cache_dir = tmp_path / "probe"
+    monkeypatch.setattr(utils, "PROBE_CACHE_DIR", cache_dir)
+    monkeypatch.setattr(utils, "PROBE_CACHE_MAX_ENTRIES", 3)
+
+    for i in range(5):
+        path = tmp_path / f"clip{i}.mp4"
+        path.write_bytes(b"x")
+        utils.probe_media(path)
+
+    assert len(list(cache_dir.glob("*.json"))) == 3
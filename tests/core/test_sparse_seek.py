@@ -0,0 +1,54 @@
+# tests/core/test_sparse_seek.py
+
+import sys
+
+import pytest
+
+from quackvideo.core import ffmpeg as ffmpeg_module
+from quackvideo.core.ffmpeg import FFmpegError, FFmpegTimeoutError, FFmpegWrapper
+
+
+def test_run_to_completion_returns_stdout():
+    """
+    A successful run returns everything written to stdout.
+    """
+    args = [sys.executable, "-c", "import sys; sys.stdout.buffer.write(b'abc')"]
+    assert ffmpeg_module._run_to_completion(args, timeout=10) == b"abc"
+
+
+def test_run_to_completion_times_out():
+    """
+    A stuck seek fails after the timeout instead of hanging the generator.
+    """
+    args = [sys.executable, "-c", "import time; time.sleep(30)"]
+    with pytest.raises(FFmpegTimeoutError):
+        ffmpeg_module._run_to_completion(args, timeout=1)
+
+
+def test_run_to_completion_reports_stderr():
+    """
+    A failing run raises FFmpegError with its stderr.
+    """
+    script = "import sys; sys.stderr.write('seek failed'); sys.exit(1)"
+    with pytest.raises(FFmpegError, match="seek failed"):
+        ffmpeg_module._run_to_completion([sys.executable, "-c", script], timeout=10)
+
+
+def test_extract_frames_does_not_probe_keyframes_by_default(tmp_path, monkeypatch):
+    """
+    Without sparse_seek, sampling below the source rate decodes straight away.
+    """
+
+    def no_probe(*args, **kwargs):
+        raise AssertionError("keyframes probed before decoding")
+
+    def fake_pipe_frames(cmd, timeout, next_buffer):
+        yield "frame"
+
+    monkeypatch.setattr(FFmpegWrapper, "_use_sparse_seek", no_probe)
+    monkeypatch.setattr(FFmpegWrapper, "_pipe_frames", fake_pipe_frames)
+
+    frames = FFmpegWrapper.extract_frames(
+        tmp_path / "clip.mp4", fps=0.2, skip_validation=True
+    )
+    assert list(frames) == ["frame"]
@@ -0,0 +1,123 @@
+# tests/operations/test_frame_resume.py
+
+import hashlib
+import os
+
+import pytest
+
+from quackvideo.core.operations.frames import FrameExtractor, _stat_key
+from quackvideo.core.operations.models import FrameExtractionConfig, ProcessingMetadata
+
+
+@pytest.fixture
+def extractor(tmp_path):
+    return FrameExtractor(FrameExtractionConfig(), tmp_path / "episode")
+
+
+@pytest.fixture
+def frames_dir(tmp_path):
+    """
+    A few PNG-named frames with recorded hashes and stats.
+    """
+    output_dir = tmp_path / "frames"
+    output_dir.mkdir()
+    for i in range(3):
+        path = output_dir / f"frame_{i:04d}.png"
+        path.write_bytes(f"frame {i}".encode())
+        os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+    return output_dir
+
+
+def _metadata(frames_dir):
+    metadata = ProcessingMetadata()
+    for path in sorted(frames_dir.iterdir()):
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        metadata.frame_integrity[path.name] = f"sha256:{digest}"
+        metadata.frame_stats[path.name] = _stat_key(path)
+    return metadata
+
+
+def _count_hashes(extractor, monkeypatch):
+    hashed = []
+    original = extractor._hash_file
+
+    def counting(path, *args, **kwargs):
+        hashed.append(path.name)
+        return original(path, *args, **kwargs)
+
+    monkeypatch.setattr(extractor, "_hash_file", counting)
+    return hashed
+
+
+def test_unchanged_frames_are_not_rehashed(extractor, frames_dir, monkeypatch):
+    """
+    Matching (size, mtime_ns) keeps the stored hash without reading the file.
+    """
+    metadata = _metadata(frames_dir)
+    hashed = _count_hashes(extractor, monkeypatch)
+
+    valid = extractor._verify_existing_frames(frames_dir, metadata)
+
+    assert valid == metadata.frame_integrity
+    assert hashed == []
+
+
+def test_changed_frame_is_rehashed_and_removed(extractor, frames_dir, monkeypatch):
+    """
+    A frame whose stats changed is rehashed; a mismatch deletes it.
+    """
+    metadata = _metadata(frames_dir)
+    corrupted = frames_dir / "frame_0001.png"
+    corrupted.write_bytes(b"corrupted")
+    hashed = _count_hashes(extractor, monkeypatch)
+
+    valid = extractor._verify_existing_frames(frames_dir, metadata)
+
+    assert hashed == ["frame_0001.png"]
+    assert set(valid) == {"frame_0000.png", "frame_0002.png"}
+    assert not corrupted.exists()
+
+
+def test_touched_frame_with_same_bytes_stays_valid(extractor, frames_dir):
+    """
+    A changed mtime alone forces a rehash, which still matches.
+    """
+    metadata = _metadata(frames_dir)
+    os.utime(frames_dir / "frame_0000.png", ns=(2_000_000_000, 2_000_000_000))
+
+    valid = extractor._verify_existing_frames(frames_dir, metadata)
+    assert valid == metadata.frame_integrity
+
+
+def test_deep_verify_rehashes_every_frame(extractor, frames_dir, monkeypatch):
+    """
+    ``deep`` ignores stats and rereads every frame, bypassing the cache.
+    """
+    metadata = _metadata(frames_dir)
+    # Change the bytes behind matching stats; only a reread can notice
+    path = frames_dir / "frame_0002.png"
+    path.write_bytes(b"frame X")
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+    hashed = _count_hashes(extractor, monkeypatch)
+
+    assert extractor._verify_existing_frames(frames_dir, metadata) == (
+        metadata.frame_integrity
+    )
+    valid = extractor._verify_existing_frames(frames_dir, metadata, deep=True)
+
+    assert sorted(hashed) == ["frame_0000.png", "frame_0001.png", "frame_0002.png"]
+    assert set(valid) == {"frame_0000.png", "frame_0001.png"}
+
+
+def test_frames_without_stats_are_rehashed(extractor, frames_dir, monkeypatch):
+    """
+    Metadata written before stats were recorded falls back to hashing.
+    """
+    metadata = _metadata(frames_dir)
+    metadata.frame_stats.clear()
+    hashed = _count_hashes(extractor, monkeypatch)
+
+    valid = extractor._verify_existing_frames(frames_dir, metadata)
+
+    assert len(hashed) == 3
+    assert valid == metadata.frame_integrity
@@ -0,0 +1,107 @@
+# tests/operations/test_hash_cache.py
+
+import hashlib
+import os
+
+import pytest
+
+from quackvideo.core.operations import base
+from quackvideo.core.operations.frames import FrameExtractor
+from quackvideo.core.operations.models import FrameExtractionConfig
+
+
+@pytest.fixture
+def extractor(tmp_path):
+    return FrameExtractor(FrameExtractionConfig(), tmp_path / "episode")
+
+
+def _write(path, data, mtime_ns=None):
+    path.write_bytes(data)
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+    return path
+
+
+@pytest.mark.parametrize("algo", ["sha256", "blake2b"])
+def test_hash_file_matches_hashlib(extractor, tmp_path, algo):
+    """
+    Digests equal a plain hashlib digest, including for empty files.
+    """
+    for name, data in (("a.bin", b"frame data" * 1000), ("empty.bin", b"")):
+        path = _write(tmp_path / name, data)
+        assert extractor._hash_file(path, algo) == hashlib.new(algo, data).hexdigest()
+
+
+def test_hash_file_serves_cached_digest(extractor, tmp_path, monkeypatch):
+    """
+    An unchanged file is not rehashed.
+    """
+    path = _write(tmp_path / "a.bin", b"abc")
+    digest = extractor._hash_file(path)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("file was rehashed")
+
+    monkeypatch.setattr(base.hashlib, "new", fail)
+    monkeypatch.setattr(base.hashlib, "file_digest", fail)
+    assert extractor._hash_file(path) == digest
+
+
+def test_hash_file_invalidates_on_rewrite(extractor, tmp_path):
+    """
+    Rewriting a file changes its mtime or size, so the digest is recomputed.
+    """
+    path = _write(tmp_path / "a.bin", b"abc", mtime_ns=1_000_000_000)
+    extractor._hash_file(path)
+
+    # Same size, different mtime
+    _write(path, b"xyz", mtime_ns=2_000_000_000)
+    assert extractor._hash_file(path) == hashlib.sha256(b"xyz").hexdigest()
+
+    # Same mtime, different size
+    _write(path, b"longer", mtime_ns=2_000_000_000)
+    assert extractor._hash_file(path) == hashlib.sha256(b"longer").hexdigest()
+
+
+def test_hash_file_without_cache_rereads(extractor, tmp_path):
+    """
+    Integrity checks bypass the cache, even if it holds a wrong digest.
+    """
+    path = _write(tmp_path / "a.bin", b"abc", mtime_ns=1_000_000_000)
+    extractor._hash_file(path)
+
+    # Change the bytes but restore size and mtime, so the cache key matches
+    _write(path, b"xyz", mtime_ns=1_000_000_000)
+    assert extractor._hash_file(path) == hashlib.sha256(b"abc").hexdigest()
+    assert (
+        extractor._hash_file(path, use_cache=False)
+        == hashlib.sha256(b"xyz").hexdigest()
+    )
+
+
+def test_hash_cache_is_bounded_lru(extractor, tmp_path, monkeypatch):
+    """
+    The least recently used digest is evicted beyond HASH_CACHE_SIZE.
+    """
+    monkeypatch.setattr(base, "HASH_CACHE_SIZE", 2)
+    paths = [_write(tmp_path / f"{i}.bin", bytes([i])) for i in range(3)]
+
+    extractor._hash_file(paths[0])
+    extractor._hash_file(paths[1])
+    extractor._hash_file(paths[0])  # Now most recently used
+    extractor._hash_file(paths[2])
+
+    cached = {key[0] for key in extractor._hash_cache}
+    assert cached == {str(paths[0].resolve()), str(paths[2].resolve())}
+
+
+def test_hash_cache_is_per_instance(tmp_path):
+    """
+    Operations do not share digests.
+    """
+    first = FrameExtractor(FrameExtractionConfig(), tmp_path / "one")
+    second = FrameExtractor(FrameExtractionConfig(), tmp_path / "two")
+    first._hash_file(_write(tmp_path / "a.bin", b"abc"))
+
+    assert len(first._hash_cache) == 1
+    assert len(second._hash_cache) == 0
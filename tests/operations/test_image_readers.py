@@ -0,0 +1,186 @@
+# tests/operations/test_image_readers.py
+
+import io
+import subprocess
+import sys
+
+import cv2
+import numpy as np
+import pytest
+
+from quackvideo.core.operations.base import FFmpegOperationError
+from quackvideo.core.operations.frames import (
+    FrameExtractor,
+    _PipeReader,
+    _read_jpeg,
+    _read_png,
+    _read_webp,
+)
+from quackvideo.core.operations.models import FrameExtractionConfig
+
+
+def _encode_images(ext, params=(), count=5):
+    """
+    Encode a few random images so their bytes exercise marker edge cases.
+    """
+    rng = np.random.default_rng(0)
+    images = []
+    for _ in range(count):
+        frame = rng.integers(0, 256, (48, 64, 3), dtype=np.uint8)
+        ok, buf = cv2.imencode(ext, frame, list(params))
+        assert ok
+        images.append(buf.tobytes())
+    return images
+
+
+def _split(data, read_image, chunk_size):
+    """
+    Split a concatenated image stream the way image2pipe output is consumed.
+    """
+    reader = _PipeReader(io.BytesIO(data), chunk_size=chunk_size)
+    images = []
+    while (image := read_image(reader)) is not None:
+        images.append(image)
+    return images
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 20])
+def test_read_png_splits_on_iend(chunk_size):
+    """
+    PNG images are split after their IEND chunk, whatever the read size.
+    """
+    images = _encode_images(".png")
+    assert _split(b"".join(images), _read_png, chunk_size) == images
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        (),
+        (cv2.IMWRITE_JPEG_RST_INTERVAL, 1),
+        (cv2.IMWRITE_JPEG_PROGRESSIVE, 1),
+        (cv2.IMWRITE_JPEG_PROGRESSIVE, 1, cv2.IMWRITE_JPEG_RST_INTERVAL, 2),
+    ],
+    ids=["baseline", "restart", "progressive", "progressive-restart"],
+)
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 20])
+def test_read_jpeg_splits_on_eoi(params, chunk_size):
+    """
+    JPEG images are split at EOI, across restart markers and multiple scans.
+    """
+    images = _encode_images(".jpg", params)
+    assert _split(b"".join(images), _read_jpeg, chunk_size) == images
+
+
+def test_read_jpeg_ignores_eoi_bytes_inside_segments():
+    """
+    FFD9 inside a segment payload or after a stuffed 0xFF is not the end.
+    """
+    image = b"".join(
+        [
+            b"\xff\xd8",  # SOI
+            b"\xff\xfe\x00\x04\xff\xd9",  # COM whose payload looks like EOI
+            b"\xff\xda\x00\x03\x00",  # SOS header
+            b"\x12\xff\x00\xd9\xff\xd0\x34",  # stuffed FF00 and a restart
+            b"\xff\xc4\x00\x04\xff\xd9",  # table segment between scans
+            b"\xff\xda\x00\x03\x00",  # second scan
+            b"\x56\xff\xff",  # fill bytes before the marker
+            b"\xff\xd9",  # EOI
+        ]
+    )
+    assert _split(image + image, _read_jpeg, 3) == [image, image]
+
+
+def test_read_webp_uses_riff_length():
+    """
+    WebP images are split using the size in their RIFF header.
+    """
+    images = _encode_images(".webp")
+    assert _split(b"".join(images), _read_webp, 5) == images
+
+
+@pytest.mark.parametrize(
+    "ext, read_image",
+    [(".png", _read_png), (".jpg", _read_jpeg), (".webp", _read_webp)],
+)
+def test_truncated_image_is_dropped(ext, read_image):
+    """
+    A stream cut off mid-image yields the complete images and then stops.
+    """
+    images = _encode_images(ext, count=2)
+    data = images[0] + images[1][:-3]
+    assert _split(data, read_image, 16) == images[:1]
+
+
+def _python_argv(script):
+    return [sys.executable, "-c", script]
+
+
+@pytest.fixture
+def spawned(monkeypatch):
+    """
+    Record the processes started by _iter_piped_images.
+    """
+    processes = []
+    popen = subprocess.Popen
+
+    def recording_popen(*args, **kwargs):
+        process = popen(*args, **kwargs)
+        processes.append(process)
+        return process
+
+    monkeypatch.setattr(subprocess, "Popen", recording_popen)
+    return processes
+
+
+@pytest.fixture
+def extractor(tmp_path):
+    return FrameExtractor(FrameExtractionConfig(), tmp_path / "episode")
+
+
+def test_iter_piped_images_closes_pipes(extractor, spawned, tmp_path):
+    """
+    Images are split from the pipe, and both pipes are closed afterwards.
+    """
+    images = _encode_images(".png", count=3)
+    source = tmp_path / "images.bin"
+    source.write_bytes(b"".join(images))
+    script = f"import sys; sys.stdout.buffer.write(open({str(source)!r}, 'rb').read())"
+
+    assert list(extractor._iter_piped_images(_python_argv(script), _read_png)) == (
+        images
+    )
+    (process,) = spawned
+    assert process.stdout.closed
+    assert process.stderr.closed
+    assert process.returncode == 0
+
+
+def test_iter_piped_images_early_close_reaps_process(extractor, spawned):
+    """
+    Closing the generator early kills FFmpeg and releases its pipes.
+    """
+    png = _encode_images(".png", count=1)[0]
+    script = (
+        f"import sys\npng = {png!r}\nwhile True:\n    sys.stdout.buffer.write(png)\n"
+    )
+
+    images = extractor._iter_piped_images(_python_argv(script), _read_png)
+    assert next(images) == png
+    images.close()
+
+    (process,) = spawned
+    assert process.returncode is not None
+    assert process.stdout.closed
+    assert process.stderr.closed
+
+
+def test_iter_piped_images_reports_failure(extractor, spawned):
+    """
+    A non-zero exit raises with FFmpeg's stderr, after closing the pipes.
+    """
+    script = "import sys; sys.stderr.write('no such file'); sys.exit(2)"
+
+    with pytest.raises(FFmpegOperationError, match="no such file"):
+        list(extractor._iter_piped_images(_python_argv(script), _read_png))
+    assert spawned[0].stderr.closed
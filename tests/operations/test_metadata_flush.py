@@ -0,0 +1,93 @@
+# tests/operations/test_metadata_flush.py
+
+import json
+
+import pytest
+
+from quackvideo.core.operations import base
+from quackvideo.core.operations.frames import FrameExtractor
+from quackvideo.core.operations.models import FrameExtractionConfig, ProcessingMetadata
+
+
+class _Clock:
+    def __init__(self, now=100.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(base.time, "monotonic", clock)
+    return clock
+
+
+@pytest.fixture
+def extractor(tmp_path):
+    return FrameExtractor(FrameExtractionConfig(), tmp_path / "episode")
+
+
+def _read(extractor):
+    return (extractor.episode_dir / ".metadata.json").read_text()
+
+
+def test_forced_flush_writes_indented_json(extractor, clock):
+    """
+    Status transitions are written immediately in readable form.
+    """
+    extractor._flush_metadata(ProcessingMetadata(status="completed"), force=True)
+
+    text = _read(extractor)
+    assert json.loads(text)["status"] == "completed"
+    assert "\n  " in text
+
+
+def test_progress_flushes_are_throttled(extractor, clock):
+    """
+    Non-forced writes within METADATA_FLUSH_INTERVAL are skipped.
+    """
+    metadata = ProcessingMetadata()
+    extractor._flush_metadata(metadata, force=True)
+
+    metadata.completed_frames = 1
+    clock.now += base.METADATA_FLUSH_INTERVAL / 2
+    extractor._flush_metadata(metadata)
+    assert json.loads(_read(extractor))["completed_frames"] == 0
+
+    metadata.completed_frames = 2
+    clock.now += base.METADATA_FLUSH_INTERVAL
+    extractor._flush_metadata(metadata)
+    text = _read(extractor)
+    assert json.loads(text)["completed_frames"] == 2
+    # Checkpoints are compact
+    assert "\n" not in text
+
+
+def test_forced_flush_ignores_interval(extractor, clock):
+    """
+    A forced write happens even right after another write.
+    """
+    metadata = ProcessingMetadata()
+    extractor._flush_metadata(metadata, force=True)
+    metadata.status = "failed"
+    extractor._flush_metadata(metadata, force=True)
+    assert json.loads(_read(extractor))["status"] == "failed"
+
+
+def test_flush_replaces_file_atomically(extractor, clock, monkeypatch):
+    """
+    A write that fails before the rename leaves the previous file intact.
+    """
+    extractor._flush_metadata(ProcessingMetadata(status="in_progress"), force=True)
+    assert not list(extractor.episode_dir.glob("*.tmp"))
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(base.os, "replace", fail_replace)
+    with pytest.raises(OSError):
+        extractor._flush_metadata(ProcessingMetadata(status="completed"), force=True)
+
+    assert json.loads(_read(extractor))["status"] == "in_progress"
@@ -0,0 +1,174 @@
+# tests/synthetic/test_audio_synthesis.py
+
+import numpy as np
+import pytest
+
+from quackvideo.synthetic.audio import (
+    ATTACK_TIME,
+    RELEASE_TIME,
+    AudioConfig,
+    AudioGenerator,
+)
+
+SAMPLE_RATE = 1000
+RAMP = int(ATTACK_TIME * SAMPLE_RATE)
+
+
+def _generator(**overrides):
+    """
+    A mono generator at a low sample rate so signals span several chunks.
+    """
+    settings = {"sample_rate": SAMPLE_RATE, "channels": 1, "duration": 2.5}
+    settings.update(overrides)
+    return AudioGenerator(AudioConfig(**settings))
+
+
+def _collect(chunks):
+    """
+    Concatenate chunks, copying each since the render buffer is reused.
+    """
+    return np.concatenate([chunk.copy() for chunk in chunks])
+
+
+def _reference_envelope(total_samples):
+    """
+    The whole-signal envelope: linear ramps at both ends, 1 in between.
+    """
+    envelope = np.ones(total_samples)
+    attack = np.linspace(0, 1, RAMP)
+    release_samples = int(RELEASE_TIME * SAMPLE_RATE)
+    release = np.linspace(1, 0, release_samples)
+
+    head = min(RAMP, total_samples)
+    envelope[:head] *= attack[:head]
+    tail = min(release_samples, total_samples)
+    envelope[total_samples - tail :] *= release[release_samples - tail :]
+    return envelope
+
+
+def _times(total_samples, sample_rate=SAMPLE_RATE):
+    return np.arange(total_samples) / sample_rate
+
+
+@pytest.mark.parametrize(
+    ("total_samples", "chunk_sizes"),
+    [
+        (1005, [1000, 5]),  # Release spans the chunk boundary
+        (2003, [1000, 1000, 3]),  # Short last chunk inside the release
+        (5, [5]),  # Signal shorter than either ramp
+        (12, [4, 4, 4]),  # Ramps overlap and span every chunk
+    ],
+)
+def test_envelope_matches_whole_signal(total_samples, chunk_sizes):
+    """
+    Scaling chunk by chunk equals scaling the whole signal at once.
+    """
+    generator = _generator()
+    chunks = []
+    start = 0
+    for size in chunk_sizes:
+        chunk = np.ones((size, 1), dtype=np.float32)
+        chunks.append(generator._apply_envelope(chunk, start, total_samples))
+        start += size
+
+    enveloped = np.concatenate(chunks)[:, 0]
+    np.testing.assert_allclose(enveloped, _reference_envelope(total_samples))
+
+
+def test_envelope_endpoints():
+    """
+    The signal starts and ends silent and is untouched between the ramps.
+    """
+    total_samples = 2500
+    generator = _generator()
+    enveloped = _collect(
+        generator._apply_envelope(
+            np.ones((size, 1), dtype=np.float32), start, total_samples
+        )
+        for start, size in [(0, 1000), (1000, 1000), (2000, 500)]
+    )[:, 0]
+
+    assert enveloped[0] == 0.0
+    assert enveloped[-1] == 0.0
+    assert enveloped[RAMP - 1] == pytest.approx(1.0)
+    np.testing.assert_array_equal(enveloped[RAMP : total_samples - RAMP], 1.0)
+
+
+def test_render_fills_every_channel_across_chunks():
+    """
+    Each channel gets the scaled signal at the absolute sample times.
+    """
+    generator = _generator(channels=2)
+    total_samples = 2300
+
+    def fill(out, t):
+        out[:] = t
+
+    chunks = list(generator._render(total_samples, fill, 0.5))
+    assert [len(chunk) for chunk in chunks] == [1000, 1000, 300]
+
+    rendered = _collect(generator._render(total_samples, fill, 0.5))
+    expected = 0.5 * _times(total_samples)
+    assert rendered.dtype == np.float32
+    np.testing.assert_allclose(rendered[:, 0], expected, rtol=1e-6)
+    np.testing.assert_array_equal(rendered[:, 0], rendered[:, 1])
+
+
+def test_tone_fill_matches_direct_sine():
+    """
+    The phasor-table tone equals sin(2*pi*f*t) over several chunks.
+    """
+    generator = _generator(sample_rate=8000, frequency=440.0, duration=3.3)
+    total_samples = int(3.3 * 8000)
+
+    sine = _collect(generator._generate_sine(total_samples))[:, 0]
+    expected = 0.5 * np.sin(2 * np.pi * 440.0 * _times(total_samples, 8000))
+    np.testing.assert_allclose(sine, expected, atol=1e-6)
+
+
+def test_pure_tone_is_enveloped_sine():
+    """
+    The pure tone is the direct sine scaled by the whole-signal envelope.
+    """
+    generator = _generator(frequency=13.0)
+    total_samples = 2500
+
+    tone = _collect(generator._generate_pure_tone(total_samples))[:, 0]
+    expected = (
+        0.5
+        * np.sin(2 * np.pi * 13.0 * _times(total_samples))
+        * _reference_envelope(total_samples)
+    )
+    np.testing.assert_allclose(tone, expected, atol=1e-6)
+
+
+def test_sweep_matches_closed_form_phase():
+    """
+    The linear sweep equals the sine of its integrated frequency.
+    """
+    generator = _generator(sweep_start=20.0, sweep_end=200.0)
+    total_samples = 2500
+    t = _times(total_samples)
+    slope = (200.0 - 20.0) / 2.5
+
+    sweep = _collect(generator._generate_sweep(total_samples))[:, 0]
+    expected = 0.5 * np.sin(2 * np.pi * (20.0 * t + slope / 2 * t**2))
+    np.testing.assert_allclose(sweep, expected, atol=1e-6)
+
+
+@pytest.mark.parametrize("chirp_rate", [0.0, 1.5])
+def test_chirp_matches_closed_form_phase(chirp_rate):
+    """
+    The exponential chirp equals the sine of its integrated frequency.
+    """
+    generator = _generator(frequency=10.0, chirp_rate=chirp_rate)
+    total_samples = 2500
+    t = _times(total_samples)
+    if chirp_rate:
+        phase = 2 * np.pi * 10.0 / chirp_rate * np.expm1(chirp_rate * t)
+    else:
+        phase = 2 * np.pi * 10.0 * t
+
+    chirp = _collect(generator._generate_chirp(total_samples))[:, 0]
+    expected = 0.5 * np.sin(phase) * _reference_envelope(total_samples)
+    np.testing.assert_allclose(chirp, expected, atol=1e-6)
@@ -0,0 +1,104 @@
+# tests/synthetic/test_feed_pipe.py
+
+import itertools
+
+import numpy as np
+import pytest
+
+from quackvideo.synthetic.base import _feed_pipe
+
+
+class RecordingPipe:
+    """
+    A pipe that records each written buffer and the array behind it.
+    """
+
+    def __init__(self, fail_after=None):
+        self.chunks = []
+        self.sources = []
+        self.fail_after = fail_after
+
+    def write(self, data):
+        if self.fail_after is not None and len(self.chunks) >= self.fail_after:
+            raise BrokenPipeError("reader went away")
+        self.chunks.append(bytes(data))
+        self.sources.append(data.obj)
+
+
+def _reused_buffer(count, shape=(4, 3)):
+    """
+    Yield one array overwritten with the frame index, like the generators.
+    """
+    buffer = np.empty(shape, dtype=np.uint8)
+    for index in range(count):
+        buffer.fill(index)
+        yield buffer
+
+
+def test_feed_pipe_writes_copies_in_order():
+    """
+    Every array is written in order even though the source buffer is reused.
+    """
+    pipe = RecordingPipe()
+    _feed_pipe(pipe, _reused_buffer(20), depth=3)
+
+    assert pipe.chunks == [bytes([index]) * 12 for index in range(20)]
+
+
+def test_feed_pipe_recycles_staging_buffers():
+    """
+    At most ``depth`` staging buffers are allocated for a long stream.
+    """
+    pipe = RecordingPipe()
+    _feed_pipe(pipe, _reused_buffer(50), depth=2)
+
+    assert len(pipe.chunks) == 50
+    assert len({id(source) for source in pipe.sources}) <= 2
+
+
+def test_feed_pipe_reallocates_on_shape_change():
+    """
+    A recycled buffer of the wrong shape is replaced, not written into.
+    """
+    arrays = [
+        np.full(shape, index, np.uint8)
+        for index, shape in enumerate([(2, 2), (2, 2), (3, 3), (3, 3), (2, 2)])
+    ]
+    pipe = RecordingPipe()
+    _feed_pipe(pipe, arrays, depth=1)
+
+    assert pipe.chunks == [array.tobytes() for array in arrays]
+
+
+def test_feed_pipe_raises_write_errors():
+    """
+    A failed write is raised on the caller, which stops rendering.
+    """
+    rendered = itertools.count()
+
+    def endless():
+        buffer = np.zeros(8, np.uint8)
+        for _ in rendered:
+            yield buffer
+
+    pipe = RecordingPipe(fail_after=3)
+    with pytest.raises(BrokenPipeError):
+        _feed_pipe(pipe, endless(), depth=2)
+
+    assert len(pipe.chunks) == 3
+
+
+def test_feed_pipe_flushes_before_propagating_render_errors():
+    """
+    Arrays rendered before a generator error are still written.
+    """
+
+    def failing():
+        yield from _reused_buffer(3)
+        raise ValueError("render failed")
+
+    pipe = RecordingPipe()
+    with pytest.raises(ValueError, match="render failed"):
+        _feed_pipe(pipe, failing(), depth=2)
+
+    assert pipe.chunks == [bytes([index]) * 12 for index in range(3)]
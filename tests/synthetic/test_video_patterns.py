@@ -0,0 +1,123 @@
+# tests/synthetic/test_video_patterns.py
+
+import numpy as np
+import pytest
+
+from quackvideo.synthetic.video import (
+    COLOR_BARS,
+    VideoConfig,
+    VideoGenerator,
+    VideoPattern,
+    _rgb_to_yuv,
+)
+
+
+def _generator(pattern, **overrides):
+    """
+    A small generator so patterns render without FFmpeg.
+    """
+    settings = {"pattern": pattern, "width": 160, "height": 96, "duration": 1.0}
+    settings.update(overrides)
+    return VideoGenerator(VideoConfig(**settings))
+
+
+def _planes(frame, width, height):
+    """
+    Split a packed yuv420p frame into its Y, U and V planes.
+    """
+    luma_size = width * height
+    chroma_size = luma_size // 4
+    y = frame[:luma_size].reshape(height, width)
+    u = frame[luma_size : luma_size + chroma_size].reshape(height // 2, width // 2)
+    v = frame[luma_size + chroma_size :].reshape(height // 2, width // 2)
+    return y, u, v
+
+
+@pytest.mark.parametrize(
+    ("rgb", "yuv"),
+    [
+        ((255, 255, 255), (235, 128, 128)),
+        ((0, 0, 0), (16, 128, 128)),
+        ((255, 0, 0), (81, 90, 240)),
+        ((0, 255, 0), (145, 54, 34)),
+        ((0, 0, 255), (41, 240, 110)),
+        ((255, 255, 0), (210, 16, 146)),
+    ],
+)
+def test_rgb_to_yuv_matches_bt601_limited_range(rgb, yuv):
+    """
+    Colors convert to the limited-range BT.601 values FFmpeg produces.
+    """
+    assert _rgb_to_yuv(rgb) == yuv
+
+
+def test_yuv_color_bars_match_rgb_bars():
+    """
+    Each bar's planes hold the converted color of the RGB bar.
+    """
+    generator = _generator(VideoPattern.COLOR_BARS)
+    rgb = next(generator._generate_frames()).copy()
+    y, u, v = _planes(next(generator._generate_yuv_frames()), 160, 96)
+
+    for i, start, end in generator._bar_bounds(160):
+        bar_y, bar_u, bar_v = _rgb_to_yuv(COLOR_BARS[i])
+        assert tuple(rgb[0, start]) == COLOR_BARS[i]
+        assert (y[:, start:end] == bar_y).all()
+        assert (u[:, start // 2 : end // 2] == bar_u).all()
+        assert (v[:, start // 2 : end // 2] == bar_v).all()
+
+
+def test_yuv_checkerboard_matches_rgb_checkerboard():
+    """
+    The luma plane is the RGB board mapped to 16/235 on every frame.
+    """
+    generator = _generator(VideoPattern.CHECKERBOARD, fps=200.0)
+    rgb_frames = generator._generate_frames()
+    yuv_frames = generator._generate_yuv_frames()
+
+    for rgb, yuv in zip(rgb_frames, yuv_frames, strict=True):
+        y, u, v = _planes(yuv, 160, 96)
+        expected = np.where(rgb[..., 0] == 255, 235, 16)
+        np.testing.assert_array_equal(y, expected)
+        assert (u == 128).all()
+        assert (v == 128).all()
+
+
+def test_yuv_pulse_tracks_rgb_intensity():
+    """
+    The pulse luma follows the converted gray level of each frame.
+    """
+    generator = _generator(VideoPattern.PULSE, fps=10.0)
+    for frame_idx, frame in enumerate(generator._generate_yuv_frames()):
+        intensity = generator._pulse_intensity(frame_idx)
+        y, u, v = _planes(frame, 160, 96)
+        assert (y == _rgb_to_yuv((intensity,) * 3)[0]).all()
+        assert (u == 128).all()
+        assert (v == 128).all()
+
+
+def _tile_loop_checkerboard(width, height, frame_idx, check_size=64):
+    """
+    The original per-tile checkerboard loop, kept as a reference.
+    """
+    frame = np.zeros((height, width, 3), dtype=np.uint8)
+    offset = frame_idx % (check_size * 2)
+    for i in range(0, height, check_size):
+        for j in range(0, width, check_size):
+            if ((i + j + offset) // check_size) % 2:
+                frame[i : i + check_size, j : j + check_size] = 255
+    return frame
+
+
+@pytest.mark.parametrize(("width", "height"), [(256, 128), (200, 130)])
+def test_checkerboard_matches_tile_loop(width, height):
+    """
+    The broadcast board equals the per-tile loop through two board flips,
+    including partial tiles at the right and bottom edges.
+    """
+    generator = _generator(
+        VideoPattern.CHECKERBOARD, width=width, height=height, fps=300.0
+    )
+    for frame_idx, frame in enumerate(generator._generate_frames()):
+        expected = _tile_loop_checkerboard(width, height, frame_idx)
+        np.testing.assert_array_equal(frame, expected)
@@ -0,0 +1,178 @@
+# tests/video/test_reader.py
+
+import sys
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from quackvideo.video.reader import (
+    VideoMetadata,
+    VideoReader,
+    _nearest_frames,
+    _read_frame,
+    _spawn,
+)
+
+
+def _timed_frames(times):
+    """
+    Frames whose single pixel value records their index.
+    """
+    return [
+        (t, np.full((4, 4, 3), index, dtype=np.uint8)) for index, t in enumerate(times)
+    ]
+
+
+def _indices(pairs):
+    return [(ts, int(frame[0, 0, 0])) for ts, frame in pairs]
+
+
+def test_nearest_frames_picks_closest():
+    """
+    Each timestamp gets whichever bracketing frame is closer.
+    """
+    frames = _timed_frames([0.0, 0.1, 0.2, 0.3])
+    pairs = _nearest_frames(iter(frames), [0.0, 0.04, 0.06, 0.29])
+    assert _indices(pairs) == [(0.0, 0), (0.04, 0), (0.06, 1), (0.29, 3)]
+
+
+def test_nearest_frames_prefers_earlier_on_tie():
+    """
+    A timestamp exactly between two frames gets the earlier one.
+    """
+    frames = _timed_frames([0.0, 0.5, 1.0])
+    pairs = _nearest_frames(iter(frames), [0.25, 0.75])
+    assert _indices(pairs) == [(0.25, 0), (0.75, 1)]
+
+
+def test_nearest_frames_reuses_frame_for_close_timestamps():
+    """
+    Timestamps denser than the frame rate can share a frame.
+    """
+    frames = _timed_frames([0.0, 1.0])
+    pairs = _nearest_frames(iter(frames), [0.1, 0.2, 0.3])
+    assert _indices(pairs) == [(0.1, 0), (0.2, 0), (0.3, 0)]
+
+
+def test_nearest_frames_past_end_uses_last_frame():
+    """
+    Timestamps after the stream ends get the last decoded frame.
+    """
+    frames = _timed_frames([0.0, 0.1])
+    pairs = _nearest_frames(iter(frames), [0.05, 0.5, 0.9])
+    assert _indices(pairs) == [(0.05, 0), (0.5, 1), (0.9, 1)]
+
+
+def test_nearest_frames_stops_consuming_when_done():
+    """
+    Frames after the last timestamp's neighbor are not pulled.
+    """
+    consumed = []
+
+    def frames():
+        for item in _timed_frames([0.0, 0.1, 0.2, 0.3, 0.4]):
+            consumed.append(item[0])
+            yield item
+
+    assert _indices(_nearest_frames(frames(), [0.1])) == [(0.1, 1)]
+    assert consumed == [0.0, 0.1]
+
+
+def test_nearest_frames_empty_stream():
+    """
+    No frames for pending timestamps is an error; no timestamps is not.
+    """
+    with pytest.raises(LookupError):
+        list(_nearest_frames(iter([]), [0.0]))
+    assert list(_nearest_frames(iter([]), [])) == []
+
+
+@pytest.fixture
+def reader():
+    """
+    A reader over fake metadata, so no video file or FFmpeg is needed.
+    """
+    metadata = VideoMetadata(
+        duration=10.0,
+        fps=10.0,
+        width=4,
+        height=4,
+        bitrate=0,
+        codec="h264",
+        size_bytes=0,
+    )
+    return VideoReader("x.mp4", skip_validation=True, _metadata=metadata)
+
+
+def test_extract_frames_range_samples_nearest_frames(reader, monkeypatch):
+    """
+    Dense sampling decodes the range once and picks the nearest frames.
+    """
+    calls = []
+
+    def fake_stream(start_time, end_time):
+        calls.append((start_time, end_time))
+        times = np.arange(start_time, end_time + 0.1, 0.1).tolist()
+        yield from _timed_frames(times)
+
+    monkeypatch.setattr(reader, "_read_frames_stream", fake_stream)
+
+    pairs = list(reader.extract_frames_range(1.0, 2.0, frame_count=5))
+
+    assert calls == [(1.0, 2.0)]
+    assert [ts for ts, _ in pairs] == pytest.approx([1.0, 1.25, 1.5, 1.75, 2.0])
+    # 1.25 and 1.75 fall between frames and take the earlier or nearer one
+    assert [int(frame[0, 0, 0]) for _, frame in pairs] == [0, 2, 5, 7, 10]
+
+
+def test_extract_frames_range_without_frames(reader, monkeypatch):
+    """
+    An empty decode is reported as a RuntimeError.
+    """
+
+    def empty_stream(start_time, end_time):
+        yield from ()
+
+    monkeypatch.setattr(reader, "_read_frames_stream", empty_stream)
+
+    with pytest.raises(RuntimeError, match="No frames decoded"):
+        list(reader.extract_frames_range(1.0, 2.0, frame_count=3))
+
+
+def test_read_frames_stream_uses_decoded_timestamps(reader, monkeypatch):
+    """
+    Frame times come from showinfo, offset by the seek, not from the index.
+    """
+    # Variable gaps, and a first frame 0.07s after the seek point
+    pts_times = [0.07, 0.12, 0.3]
+
+    def fake_timed_frames(stream, width, height):
+        yield from _timed_frames(pts_times)
+
+    monkeypatch.setattr(reader, "_read_timed_frames", fake_timed_frames)
+
+    pairs = list(reader._read_frames_stream(1.0, 1.3))
+    assert [ts for ts, _ in pairs] == pytest.approx([1.07, 1.12, 1.3])
+
+
+def test_spawned_pipe_reads_frames_in_place():
+    """
+    Frames are read straight into arrays; a truncated last frame is dropped.
+    """
+    script = "import sys; sys.stdout.buffer.write(bytes(range(96)) + b'abc')"
+    stream = SimpleNamespace(compile=lambda: [sys.executable, "-c", script])
+
+    process, stdout, stderr = _spawn(stream)
+    try:
+        out = np.empty((4, 4, 3), np.uint8)
+        first = _read_frame(stdout, 4, 4, out)
+        assert first is out
+        assert out.tobytes() == bytes(range(48))
+        second = _read_frame(stdout, 4, 4)
+        assert second.tobytes() == bytes(range(48, 96))
+        assert _read_frame(stdout, 4, 4) is None
+    finally:
+        stdout.close()
+        stderr.close()
+        process.wait()